@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+# ====================================================
+#
+#   Copyright (c) 2023 Nuoyan
+#   nuoyanlib is licensed under Mulan PSL v2.
+#   You can use this software according to the terms and conditions of the Mulan PSL v2.
+#   You may obtain a copy of Mulan PSL v2 at:
+#            http://license.coscl.org.cn/MulanPSL2
+#   THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY OR FIT FOR A PARTICULAR PURPOSE.
+#   See the Mulan PSL v2 for more details.
+#
+#   Author        : 诺言Nuoyan
+#   Email         : 1279735247@qq.com
+#   Gitee         : https://gitee.com/charming-lee
+#   Last Modified : 2026-10-18
+#
+# ====================================================
+
+
+from json import dumps as _json_dumps
+
+
+__all__ = [
+    "LATENCY_BUCKETS",
+    "payload_size",
+    "CallStats",
+]
+
+
+# 往返延迟直方图各档的上限，单位为秒，超出最后一档的计入溢出档
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+def payload_size(obj):
+    # 以json编码后的长度估算消息大小，与引擎实际序列化的字节数不同，但可反映相对大小
+    try:
+        return len(_json_dumps(obj, separators=(",", ":")))
+    except (TypeError, ValueError):
+        return len(repr(obj))
+
+
+def _new_endpoint():
+    return {
+        'calls': 0,
+        'successes': 0,
+        'errors': 0,
+        'timeouts': 0,
+        'cancelled': 0,
+        'request_bytes': 0,
+        'response_bytes': 0,
+        'latency_hist': [0] * (len(LATENCY_BUCKETS) + 1),
+        'latency_sum': 0.0,
+        'latency_max': 0.0,
+        'executions': 0,
+        'exec_errors': 0,
+        'exec_time_sum': 0.0,
+        'exec_time_max': 0.0,
+    }
+
+
+def _percentile(hist, count, p):
+    if not count:
+        return 0.0
+    target = count * p
+    acc = 0
+    for i, n in enumerate(hist):
+        acc += n
+        if acc >= target:
+            # 只能精确到档位，返回该档的上限；落在溢出档时返回None
+            return LATENCY_BUCKETS[i] if i < len(LATENCY_BUCKETS) else None
+    return None
+
+
+class CallStats(object):
+    """
+    | 跨端调用的统计数据，每端（服务端、客户端）各有一份，按被调用的函数（"命名空间:系统名称:函数名"，批量调用为"batch"）分别统计。
+    | 发起方统计调用次数、成功、失败、超时、取消次数，往返延迟，以及请求与返回值的大小；被调用方统计执行次数、执行中出现异常的次数与执行耗时。
+    """
+
+    __slots__ = ("enabled", "endpoints")
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.endpoints = {}
+
+    def _get(self, endpoint):
+        data = self.endpoints.get(endpoint)
+        if data is None:
+            data = self.endpoints[endpoint] = _new_endpoint()
+        return data
+
+    def record_call(self, endpoint, size):
+        data = self._get(endpoint)
+        data['calls'] += 1
+        data['request_bytes'] += size
+
+    def record_result(self, endpoint, success, error, latency, size):
+        data = self._get(endpoint)
+        if success:
+            data['successes'] += 1
+        elif error == "timeout":
+            data['timeouts'] += 1
+            return
+        elif error == "cancelled":
+            data['cancelled'] += 1
+            return
+        else:
+            data['errors'] += 1
+        data['response_bytes'] += size
+        hist = data['latency_hist']
+        for i, bound in enumerate(LATENCY_BUCKETS):
+            if latency <= bound:
+                hist[i] += 1
+                break
+        else:
+            hist[-1] += 1
+        data['latency_sum'] += latency
+        if latency > data['latency_max']:
+            data['latency_max'] = latency
+
+    def record_exec(self, endpoint, success, elapsed):
+        data = self._get(endpoint)
+        data['executions'] += 1
+        if not success:
+            data['exec_errors'] += 1
+        data['exec_time_sum'] += elapsed
+        if elapsed > data['exec_time_max']:
+            data['exec_time_max'] = elapsed
+
+    def reset(self):
+        self.endpoints.clear()
+
+    def snapshot(self):
+        res = {}
+        for endpoint, data in self.endpoints.items():
+            hist = data['latency_hist']
+            count = sum(hist)
+            executions = data['executions']
+            res[endpoint] = {
+                'calls': data['calls'],
+                'successes': data['successes'],
+                'errors': data['errors'],
+                'timeouts': data['timeouts'],
+                'cancelled': data['cancelled'],
+                'request_bytes': data['request_bytes'],
+                'response_bytes': data['response_bytes'],
+                'latency': {
+                    'count': count,
+                    'avg': data['latency_sum'] / count if count else 0.0,
+                    'max': data['latency_max'],
+                    'p50': _percentile(hist, count, 0.5),
+                    'p95': _percentile(hist, count, 0.95),
+                    'buckets': [[bound, n] for bound, n in zip(LATENCY_BUCKETS + (None,), hist)],
+                },
+                'executions': executions,
+                'exec_errors': data['exec_errors'],
+                'exec_time': {
+                    'avg': data['exec_time_sum'] / executions if executions else 0.0,
+                    'max': data['exec_time_max'],
+                },
+            }
+        return res
+
+
+
+
+
+
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+# ====================================================
+#
+#   Copyright (c) 2023 Nuoyan
+#   nuoyanlib is licensed under Mulan PSL v2.
+#   You can use this software according to the terms and conditions of the Mulan PSL v2.
+#   You may obtain a copy of Mulan PSL v2 at:
+#            http://license.coscl.org.cn/MulanPSL2
+#   THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY OR FIT FOR A PARTICULAR PURPOSE.
+#   See the Mulan PSL v2 for more details.
+#
+#   Author        : 诺言Nuoyan
+#   Email         : 1279735247@qq.com
+#   Gitee         : https://gitee.com/charming-lee
+#   Last Modified : 2026-10-18
+#
+# ====================================================
+
+
+from typing import Dict, List, Tuple, Any, Optional
+
+
+LATENCY_BUCKETS: Tuple[float, ...]
+
+
+def payload_size(obj: Any) -> int: ...
+def _new_endpoint() -> Dict[str, Any]: ...
+def _percentile(hist: List[int], count: int, p: float) -> Optional[float]: ...
+
+
+class CallStats(object):
+    enabled: bool
+    endpoints: Dict[str, Dict[str, Any]]
+    def __init__(self, enabled: bool = False) -> None: ...
+    def _get(self, endpoint: str) -> Dict[str, Any]: ...
+    def record_call(self, endpoint: str, size: int) -> None: ...
+    def record_result(self, endpoint: str, success: bool, error: str, latency: float, size: int) -> None: ...
+    def record_exec(self, endpoint: str, success: bool, elapsed: float) -> None: ...
+    def reset(self) -> None: ...
+    def snapshot(self) -> Dict[str, Dict[str, Any]]: ...
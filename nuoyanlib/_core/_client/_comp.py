@@ -12,7 +12,7 @@
 #   Author        : 诺言Nuoyan
 #   Email         : 1279735247@qq.com
 #   Gitee         : https://gitee.com/charming-lee
-#   Last Modified : 2024-07-02
+#   Last Modified : 2026-10-18
 #
 # ====================================================
 
@@ -32,6 +32,10 @@ __all__ = [
     "LEVEL_ID",
     "PlrComp",
     "LvComp",
+    "EntityComp",
+    "release_entity_comp",
+    "set_entity_comp_cache_size",
+    "get_entity_comp_stats",
 ]
 
 
@@ -57,10 +61,12 @@ class _CompDescr(object):
         self.comp_name = comp_name
 
     def __get__(self, ins, cls):
-        if self.comp_name not in cls._cache:
-            comp = getattr(CompFactory, "Create" + self.comp_name)(cls._target)
-            cls._cache[self.comp_name] = comp
-        return cls._cache[self.comp_name]
+        owner = cls if ins is None else ins
+        comp = owner._cache.get(self.comp_name)
+        if comp is None:
+            comp = getattr(CompFactory, "Create" + self.comp_name)(owner._target)
+            owner._cache[self.comp_name] = comp
+        return comp
 
 
 class _CompPool(object):
@@ -130,6 +136,101 @@ class LvComp(_CompPool):
     _target = LEVEL_ID
 
 
+_entity_comps = {}
+_entity_comp_max_size = 4096
+_entity_comp_clock = 0
+_entity_comp_stats = {
+    'hits': 0,
+    'misses': 0,
+    'evictions': 0,
+}
+
+
+def _evict_entity_comps():
+    # 批量淘汰最久未使用的1/4，避免每次访问都需要维护顺序
+    pools = sorted(_entity_comps.itervalues(), key=lambda p: p._last_used)
+    count = max(len(pools) // 4, 1)
+    for pool in pools[:count]:
+        del _entity_comps[pool._target]
+    _entity_comp_stats['evictions'] += count
+
+
+class EntityComp(_CompPool):
+    """
+    | 实体组件池，同一实体的组件只会创建一次，如 ``EntityComp(entity_id).Pos.GetFootPos()`` 。
+    | 缓存的实体数量超出上限（默认为4096，可通过 ``set_entity_comp_cache_size`` 修改）时淘汰最久未使用的实体；实体被移除（RemoveEntityClientEvent）时会自动淘汰。
+
+    -----
+
+    :param str entity_id: 实体ID
+    """
+
+    __slots__ = ("_target", "_cache", "_last_used")
+
+    def __new__(cls, entity_id):
+        global _entity_comp_clock
+        pool = _entity_comps.get(entity_id)
+        if pool is None:
+            _entity_comp_stats['misses'] += 1
+            if len(_entity_comps) >= _entity_comp_max_size:
+                _evict_entity_comps()
+            pool = object.__new__(cls)
+            pool._target = entity_id
+            pool._cache = {}
+            _entity_comps[entity_id] = pool
+        else:
+            _entity_comp_stats['hits'] += 1
+        _entity_comp_clock += 1
+        pool._last_used = _entity_comp_clock
+        return pool
+
+
+def release_entity_comp(entity_id):
+    """
+    | 淘汰指定实体的组件池。
+
+    -----
+
+    :param str entity_id: 实体ID
+
+    :return: 该实体是否在缓存中
+    :rtype: bool
+    """
+    return _entity_comps.pop(entity_id, None) is not None
+
+
+def set_entity_comp_cache_size(size):
+    """
+    | 设置实体组件池最多缓存的实体数量，默认为4096。
+
+    -----
+
+    :param int size: 最大实体数量
+
+    :return: 无
+    :rtype: None
+    """
+    global _entity_comp_max_size
+    _entity_comp_max_size = max(int(size), 1)
+    while len(_entity_comps) > _entity_comp_max_size:
+        _evict_entity_comps()
+
+
+def get_entity_comp_stats():
+    """
+    | 获取实体组件池的缓存统计。
+
+    -----
+
+    :return: 统计字典，包含hits（命中次数）、misses（未命中次数）、evictions（因数量超出上限被淘汰的实体数）、size（当前缓存的实体数量）、max_size（最大实体数量）
+    :rtype: dict[str,int]
+    """
+    stats = dict(_entity_comp_stats)
+    stats['size'] = len(_entity_comps)
+    stats['max_size'] = _entity_comp_max_size
+    return stats
+
+
 if __name__ == "__main__":
     l = []
     for k, v in _CompPool.__dict__.items():
@@ -12,7 +12,7 @@
 #   Author        : 诺言Nuoyan
 #   Email         : 1279735247@qq.com
 #   Gitee         : https://gitee.com/charming-lee
-#   Last Modified : 2023-11-26
+#   Last Modified : 2026-10-18
 #
 # ====================================================
 
@@ -160,6 +160,25 @@ class PlrComp(_CompPool):
 class LvComp(_CompPool):
     _cache: Dict[str, BaseComponent]
     _target: str
+
+
+_entity_comps: Dict[str, EntityComp]
+_entity_comp_max_size: int
+_entity_comp_clock: int
+_entity_comp_stats: Dict[str, int]
+def _evict_entity_comps() -> None: ...
+
+
+class EntityComp(_CompPool):
+    _target: str
+    _cache: Dict[str, BaseComponent]
+    _last_used: int
+    def __new__(cls, entity_id: str) -> EntityComp: ...
+
+
+def release_entity_comp(entity_id: str) -> bool: ...
+def set_entity_comp_cache_size(size: int) -> None: ...
+def get_entity_comp_stats() -> Dict[str, int]: ...
     
     
     
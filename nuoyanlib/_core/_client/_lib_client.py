@@ -12,11 +12,13 @@
 #   Author        : 诺言Nuoyan
 #   Email         : 1279735247@qq.com
 #   Gitee         : https://gitee.com/charming-lee
-#   Last Modified : 2025-01-26
+#   Last Modified : 2026-10-18
 #
 # ====================================================
 
 
+from itertools import count as _count
+from traceback import format_exc as _format_exc
 import mod.client.extraClientApi as _client_api
 from .._const import (
     LIB_NAME as _LIB_NAME,
@@ -28,6 +30,7 @@ from ._comp import (
     ClientSystem as _ClientSystem,
     CompFactory as _CompFactory,
     LvComp as _LvComp,
+    release_entity_comp as _release_entity_comp,
 )
 from ._listener import (
     listen_custom as _listen_custom,
@@ -39,12 +42,27 @@ from .._utils import (
 )
 from .._sys import (
     NuoyanLibBaseSystem as _NuoyanLibBaseSystem,
+    BATCH_EVENT_NAME as _BATCH_EVENT_NAME,
+    STREAM_CHUNK_EVENT_NAME as _STREAM_CHUNK_EVENT_NAME,
+    STREAM_CANCEL_EVENT_NAME as _STREAM_CANCEL_EVENT_NAME,
+)
+from .._logging import (
+    log as _log,
+    debug as _log_debug,
+    error as _log_error,
+    set_log_buffered as _set_log_buffered,
 )
-from .._logging import log as _log
 from ...utils.communicate import (
     call_local as _call_local,
     call_callback as _call_callback,
+    call_batch_local as _call_batch_local,
+    call_endpoint as _call_endpoint,
+    check_call_timeouts as _check_call_timeouts,
+    report_call_progress as _report_call_progress,
+    reset_side_cache as _reset_side_cache,
+    clear_missing_systems as _clear_missing_systems,
 )
+from ...utils.mc_timer import drain_timer_queue as _drain_timer_queue
 
 
 __all__ = [
@@ -67,16 +85,76 @@ class NuoyanLibClientSystem(_NuoyanLibBaseSystem, _ClientSystem):
         self.item_grid_size = {}
         self.item_grid_items = {}
         self.registered_keys = {}
+        self._query_cache_pending = set()
+        self._rpc_synced = False
+        self._subs = {}
+        self._sub_keys = {}
+        self._sub_handles = {}
+        self._sub_topics = {}
+        self._sub_handle_ids = _count(1)
+        self._batch_relay = _ClientSystem(_LIB_NAME, _LIB_SERVER_NAME)
         _LvComp.Game.AddTimer(0, _listen_custom, self)
         global _lib_sys
         _lib_sys = self
+        _reset_side_cache()
         _log("Inited", NuoyanLibClientSystem)
 
+    def Update(self):
+        super(NuoyanLibClientSystem, self).Update()
+        _drain_timer_queue(self._timer_budget, self._timer_time_budget)
+        _check_call_timeouts()
+        _clear_missing_systems()
+
+    def Destroy(self):
+        self.flush_msgs()
+        _set_log_buffered(False)
+
     # General ==========================================================================================================
 
     @_event("UiInitFinished")
     def _on_ui_init_finished(self, args):
+        # 重新进入时服务端会重新下发待请求的实体ID，之前记录的已失效
+        self._query_cache_pending.clear()
         self.NotifyToServer("UiInitFinished", {})
+        # 交换双方的调用表，服务端收到后回复其完整的调用表
+        self.NotifyToServer("_RpcTable", {'table': self.get_rpc_table(), 'full': True})
+        self._rpc_synced = True
+
+    # Message Batching =================================================================================================
+
+    def _send_msg(self, target, event_name, event_data):
+        _ClientSystem.NotifyToServer(self, event_name, event_data)
+
+    def _dispatch_msg(self, event_name, event_data):
+        self._batch_relay.BroadcastEvent(event_name, event_data)
+
+    def NotifyToServer(self, eventName, eventData, immediate=False):
+        self.post_msg("", eventName, eventData, immediate)
+
+    @_lib_sys_event(_BATCH_EVENT_NAME)
+    def _on_batch(self, args):
+        self.dispatch_batch(args)
+
+    # Streaming ========================================================================================================
+
+    @_lib_sys_event(_STREAM_CHUNK_EVENT_NAME)
+    def _on_chunk(self, args):
+        self.receive_chunk(args)
+
+    @_lib_sys_event(_STREAM_CANCEL_EVENT_NAME)
+    def _on_chunk_cancel(self, args):
+        self.cancel_chunks(args)
+
+    def _on_stream_progress(self, event_name, tag, done, total, sender):
+        if event_name == "_NuoyanLibCallReturn":
+            _report_call_progress(tag, "recv", done, total, sender)
+
+    # EntityComp =======================================================================================================
+
+    @_event("RemoveEntityClientEvent")
+    def _on_remove_entity(self, args):
+        _release_entity_comp(args['id'])
+        self._query_cache_pending.discard(args['id'])
 
     # BroadcastToAllClient =============================================================================================
 
@@ -118,6 +196,32 @@ class NuoyanLibClientSystem(_NuoyanLibBaseSystem, _ClientSystem):
                     comp.Register(name, 0.0)
                 comp.Set(name, value)
 
+    @_lib_sys_event("_QueryCachePending")
+    def _on_query_cache_pending(self, args):
+        # 服务端仅发送了这些实体的ID，已加载的实体立即请求，其余的在加载时再请求
+        pending = set(args['ids'])
+        loaded = [
+            i for i in _client_api.GetEngineActor().keys() + _client_api.GetPlayerList()
+            if i in pending
+        ]
+        pending.difference_update(loaded)
+        self._query_cache_pending.update(pending)
+        if loaded:
+            self.NotifyToServer("_RequestQueryCache", {'ids': loaded})
+
+    @_event("AddEntityClientEvent")
+    def _on_add_entity(self, args):
+        self._request_query_cache(args['id'])
+
+    @_event("AddPlayerCreatedClientEvent")
+    def _on_add_player_created(self, args):
+        self._request_query_cache(args['playerId'])
+
+    def _request_query_cache(self, entity_id):
+        if entity_id in self._query_cache_pending:
+            self._query_cache_pending.discard(entity_id)
+            self.NotifyToServer("_RequestQueryCache", {'ids': [entity_id]})
+
     @_lib_sys_event("_SetQueryVar")
     def on_set_query_var(self, args):
         if args.get('__id__') == _PLAYER_ID:
@@ -132,43 +236,156 @@ class NuoyanLibClientSystem(_NuoyanLibBaseSystem, _ClientSystem):
 
     # call =============================================================================================================
 
+    def _on_rpc_registered(self, table):
+        if self._rpc_synced:
+            self.NotifyToServer("_RpcTable", {'table': table})
+
+    @_lib_sys_event("_RpcTable")
+    def _on_rpc_table(self, args):
+        self.update_remote_rpc_ids("", args['table'])
+        if 'keys' in args:
+            self.set_codec_keys(args['keys'])
+
     @_event("_NuoyanLibCall", _LIB_NAME, _LIB_CLIENT_NAME)
     @_event("_NuoyanLibCall", _LIB_NAME, _LIB_SERVER_NAME)
     def _be_called(self, args):
-        namespace = args['namespace']
-        system_name = args['system_name']
-        method = args['method']
+        args = self.decode_call(args)
         uuid = args['uuid']
         delay_ret = args['delay_ret']
         call_args = args['args']
         call_kwargs = args['kwargs']
         player_id = args.get('__id__')
-        target_sys = _client_api.GetSystem(namespace, system_name)
         def callback(cb_args):
             if player_id:
                 self.notify_to_multi_clients(
                     [player_id],
                     "_NuoyanLibCallReturn",
-                    {'uuid': uuid, 'cb_args': cb_args},
+                    self.encode_return((player_id,), uuid, cb_args),
                 )
             else:
-                self.NotifyToServer("_NuoyanLibCallReturn", {'uuid': uuid, 'cb_args': cb_args})
+                data = self.encode_return(("",), uuid, cb_args)
+                if not self.stream_msg(("",), "_NuoyanLibCallReturn", data, uuid):
+                    self.NotifyToServer("_NuoyanLibCallReturn", data)
+        if 'id' in args:
+            _call_endpoint(self.get_rpc_endpoint(args['id']), callback, delay_ret, call_args, call_kwargs)
+            return
+        if 'calls' in args:
+            _call_batch_local(args['calls'], callback, delay_ret, self.resolve_rpc)
+            return
+        namespace = args['namespace']
+        system_name = args['system_name']
+        method = args['method']
+        allowed, func = self.resolve_rpc(namespace, system_name, method)
+        if not allowed:
+            callback({'success': False, 'ret': None, 'error': "not whitelisted", 'player_id': _PLAYER_ID})
+            return
+        if func is not None:
+            _call_endpoint(func, callback, delay_ret, call_args, call_kwargs)
+            return
+        target_sys = _client_api.GetSystem(namespace, system_name)
         _call_local(target_sys, method, callback, delay_ret, call_args, call_kwargs)
 
     @_event("_NuoyanLibCallReturn", _LIB_NAME, _LIB_CLIENT_NAME)
     @_event("_NuoyanLibCallReturn", _LIB_NAME, _LIB_SERVER_NAME)
     def _call_return(self, args):
-        uuid = args['uuid']
-        cb_args = args['cb_args']
+        uuid, cb_args = self.decode_return(args)
         _call_callback(uuid, **cb_args)
 
+    @_lib_sys_event("_NuoyanLibCallCancel")
+    def _on_call_cancel(self, args):
+        self.cancel_streams("", "_NuoyanLibCallReturn", args['uuid'])
+
+    # Subscription ===================================================================================================
+
+    def subscribe(self, namespace, system_name, method, callback, args=None, kwargs=None, interval=1.0):
+        # 相同的订阅在本端合并为一组，服务端对每个玩家只记录一次
+        key = (namespace, system_name, method, repr(args), repr(sorted(kwargs.items())) if kwargs else None)
+        handle = next(self._sub_handle_ids)
+        group_id = self._sub_keys.get(key)
+        if group_id is None:
+            group_id = self._sub_keys[key] = handle
+            group = self._subs[group_id] = {
+                'key': key,
+                'topic': None,
+                'interval': interval,
+                'callbacks': {},
+                'value': None,
+                'has_value': False,
+            }
+            self.NotifyToServer("_Subscribe", {
+                's': group_id,
+                'namespace': namespace,
+                'system_name': system_name,
+                'method': method,
+                'args': args,
+                'kwargs': kwargs,
+                'interval': interval,
+            })
+        else:
+            group = self._subs[group_id]
+            if interval < group['interval']:
+                group['interval'] = interval
+                self.NotifyToServer("_Subscribe", {'s': group_id, 'interval': interval})
+        group['callbacks'][handle] = callback
+        self._sub_handles[handle] = group_id
+        if group['has_value']:
+            callback(group['value'])
+        return handle
+
+    def unsubscribe(self, handle):
+        group_id = self._sub_handles.pop(handle, None)
+        if group_id is None:
+            return False
+        group = self._subs[group_id]
+        del group['callbacks'][handle]
+        if not group['callbacks']:
+            del self._subs[group_id]
+            del self._sub_keys[group['key']]
+            self._sub_topics.pop(group['topic'], None)
+            self.NotifyToServer("_Unsubscribe", {'s': group_id})
+        return True
+
+    def _set_sub_value(self, group, value):
+        group['value'] = value
+        group['has_value'] = True
+        for callback in group['callbacks'].values():
+            try:
+                callback(value)
+            except:
+                _log_error("Subscription callback %s failed:\n%s", NuoyanLibClientSystem, callback, _format_exc())
+
+    @_lib_sys_event("_SubValue")
+    def _on_sub_value(self, args):
+        group = self._subs.get(args['s'])
+        if group is None:
+            # 已取消的订阅
+            return
+        group['topic'] = args['t']
+        self._sub_topics[args['t']] = args['s']
+        self._set_sub_value(group, args['v'])
+
+    @_lib_sys_event("_SubDelta")
+    def _on_sub_delta(self, args):
+        group_id = self._sub_topics.get(args['t'])
+        if group_id is None:
+            return
+        group = self._subs[group_id]
+        if 'v' in args:
+            value = args['v']
+        else:
+            value = dict(group['value'])
+            value.update(args['d'])
+            for k in args['r']:
+                value.pop(k, None)
+        self._set_sub_value(group, value)
+
     # Item Grid （已废弃） ===============================================================================================
 
     @_lib_sys_event("_UpdateItemGrids")
     def _on_update_item_grids(self, args):
         data = args['data']
         self.item_grid_items.update(data)
-        _log("Updated item grids: %s" % data.keys(), NuoyanLibClientSystem)
+        _log_debug("Updated item grids: %s", NuoyanLibClientSystem, data.keys())
 
     def register_item_grid(self, key, cls_path, path, size, is_single):
         if key in self.item_grid_path:
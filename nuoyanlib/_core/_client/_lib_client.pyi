@@ -12,16 +12,16 @@
 #   Author        : 诺言Nuoyan
 #   Email         : 1279735247@qq.com
 #   Gitee         : https://gitee.com/charming-lee
-#   Last Modified : 2025-01-26
+#   Last Modified : 2026-10-18
 #
 # ====================================================
 
 
-from typing import List, Optional, Dict, Tuple, Any
+from typing import List, Optional, Dict, Tuple, Set, Union, Any, Callable, Iterator
 from mod.client.system.clientSystem import ClientSystem
 from .._typing import EventArgs
 from ._listener import event, lib_sys_event
-from .._sys import NuoyanLibBaseSystem
+from .._sys import NuoyanLibBaseSystem, STREAM_CHUNK_EVENT_NAME, STREAM_CANCEL_EVENT_NAME
 from .._const import LIB_NAME, LIB_CLIENT_NAME, LIB_SERVER_NAME
 
 
@@ -30,7 +30,27 @@ class NuoyanLibClientSystem(NuoyanLibBaseSystem, ClientSystem):
     item_grid_size: Dict[str, int]
     item_grid_items: Dict[str, List[Optional[dict]]]
     registered_keys: Dict[str, List[str]]
+    _batch_relay: ClientSystem
+    _query_cache_pending: Set[str]
+    _rpc_synced: bool
+    _subs: Dict[int, Dict[str, Any]]
+    _sub_keys: Dict[Tuple[str, str, str, str, Optional[str]], int]
+    _sub_handles: Dict[int, int]
+    _sub_topics: Dict[int, int]
+    _sub_handle_ids: Iterator[int]
     def __init__(self: ..., namespace: str, system_name: str) -> None: ...
+    def Update(self: ...) -> None: ...
+    def Destroy(self: ...) -> None: ...
+    def _send_msg(self: ..., target: str, event_name: str, event_data: Any) -> None: ...
+    def _dispatch_msg(self: ..., event_name: str, event_data: Any) -> None: ...
+    def NotifyToServer(self: ..., eventName: str, eventData: Any, immediate: bool = False) -> None: ...
+    @lib_sys_event("_NuoyanLibBatch")
+    def _on_batch(self: ..., args: EventArgs) -> None: ...
+    @lib_sys_event(STREAM_CHUNK_EVENT_NAME)
+    def _on_chunk(self: ..., args: EventArgs) -> None: ...
+    @lib_sys_event(STREAM_CANCEL_EVENT_NAME)
+    def _on_chunk_cancel(self: ..., args: EventArgs) -> None: ...
+    def _on_stream_progress(self: ..., event_name: str, tag: Any, done: int, total: int, sender: str) -> None: ...
     def broadcast_to_all_client(
         self: ...,
         event_name: str,
@@ -46,16 +66,46 @@ class NuoyanLibClientSystem(NuoyanLibBaseSystem, ClientSystem):
         namespace: str = "",
         sys_name: str = "",
     ) -> None: ...
+    def _on_rpc_registered(self: ..., table: List[List[Union[str, int]]]) -> None: ...
+    @lib_sys_event("_RpcTable")
+    def _on_rpc_table(self: ..., args: EventArgs) -> None: ...
     @event("_NuoyanLibCall", LIB_NAME, LIB_CLIENT_NAME)
     @event("_NuoyanLibCall", LIB_NAME, LIB_SERVER_NAME)
     def _be_called(self: ..., args: EventArgs) -> None: ...
     @event("_NuoyanLibCallReturn", LIB_NAME, LIB_CLIENT_NAME)
     @event("_NuoyanLibCallReturn", LIB_NAME, LIB_SERVER_NAME)
     def _call_return(self: ..., args: EventArgs) -> None: ...
+    @lib_sys_event("_NuoyanLibCallCancel")
+    def _on_call_cancel(self: ..., args: EventArgs) -> None: ...
+    def subscribe(
+        self: ...,
+        namespace: str,
+        system_name: str,
+        method: str,
+        callback: Callable[[Any], Any],
+        args: Optional[Tuple[Any, ...]] = None,
+        kwargs: Optional[Dict[str, Any]] = None,
+        interval: float = 1.0,
+    ) -> int: ...
+    def unsubscribe(self: ..., handle: int) -> bool: ...
+    def _set_sub_value(self: ..., group: Dict[str, Any], value: Any) -> None: ...
+    @lib_sys_event("_SubValue")
+    def _on_sub_value(self: ..., args: EventArgs) -> None: ...
+    @lib_sys_event("_SubDelta")
+    def _on_sub_delta(self: ..., args: EventArgs) -> None: ...
     @event("UiInitFinished")
     def _on_ui_init_finished(self: ..., args: EventArgs) -> None: ...
+    @event("RemoveEntityClientEvent")
+    def _on_remove_entity(self: ..., args: EventArgs) -> None: ...
     @lib_sys_event("_SetQueryCache")
     def _on_set_query_cache(self: ..., args: EventArgs) -> None: ...
+    @lib_sys_event("_QueryCachePending")
+    def _on_query_cache_pending(self: ..., args: EventArgs) -> None: ...
+    @event("AddEntityClientEvent")
+    def _on_add_entity(self: ..., args: EventArgs) -> None: ...
+    @event("AddPlayerCreatedClientEvent")
+    def _on_add_player_created(self: ..., args: EventArgs) -> None: ...
+    def _request_query_cache(self: ..., entity_id: str) -> None: ...
     @lib_sys_event("_SetQueryVar")
     def on_set_query_var(self: ..., args: EventArgs) -> None: ...
     @lib_sys_event("_UpdateItemGrids")
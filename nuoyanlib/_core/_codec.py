@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+# ====================================================
+#
+#   Copyright (c) 2023 Nuoyan
+#   nuoyanlib is licensed under Mulan PSL v2.
+#   You can use this software according to the terms and conditions of the Mulan PSL v2.
+#   You may obtain a copy of Mulan PSL v2 at:
+#            http://license.coscl.org.cn/MulanPSL2
+#   THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY OR FIT FOR A PARTICULAR PURPOSE.
+#   See the Mulan PSL v2 for more details.
+#
+#   Author        : 诺言Nuoyan
+#   Email         : 1279735247@qq.com
+#   Gitee         : https://gitee.com/charming-lee
+#   Last Modified : 2026-10-18
+#
+# ====================================================
+
+
+__all__ = [
+    "CALL_CODEC_KEYS",
+    "build_codec_tables",
+    "encode_value",
+    "decode_value",
+    "pack_call",
+    "unpack_call",
+    "pack_return",
+    "unpack_return",
+]
+
+
+# 紧凑编码中可被替换为短标记的字典键，追加新键时只能添加在末尾
+CALL_CODEC_KEYS = (
+    # 调用回调参数
+    "success",
+    "ret",
+    "error",
+    "player_id",
+    # 物品信息字典
+    "newItemName",
+    "newAuxValue",
+    "count",
+    "itemName",
+    "auxValue",
+    "showInHand",
+    "enchantData",
+    "modEnchantData",
+    "customTips",
+    "extraId",
+    "userData",
+    "durability",
+    "itemId",
+    "modId",
+    "modItemId",
+)
+_ESCAPE = "#"
+
+
+def build_codec_tables(keys):
+    key_ids = {}
+    tokens = {}
+    for i, k in enumerate(keys):
+        token = "%s%d" % (_ESCAPE, i)
+        key_ids[k] = token
+        tokens[token] = k
+    return key_ids, tokens
+
+
+def encode_value(value, key_ids):
+    # 表中的键替换为"#编号"，原本以"#"开头的键再加一个"#"转义
+    if isinstance(value, dict):
+        res = {}
+        for k, v in value.items():
+            if isinstance(k, str):
+                token = key_ids.get(k)
+                if token is not None:
+                    k = token
+                elif k[:1] == _ESCAPE:
+                    k = _ESCAPE + k
+            res[k] = encode_value(v, key_ids)
+        return res
+    if isinstance(value, list):
+        return [encode_value(i, key_ids) for i in value]
+    if isinstance(value, tuple):
+        return tuple(encode_value(i, key_ids) for i in value)
+    return value
+
+
+def decode_value(value, tokens):
+    if isinstance(value, dict):
+        res = {}
+        for k, v in value.items():
+            if isinstance(k, str) and k[:1] == _ESCAPE:
+                k = k[1:] if k[1:2] == _ESCAPE else tokens.get(k, k)
+            res[k] = decode_value(v, tokens)
+        return res
+    if isinstance(value, list):
+        return [decode_value(i, tokens) for i in value]
+    if isinstance(value, tuple):
+        return tuple(decode_value(i, tokens) for i in value)
+    return value
+
+
+def pack_call(notify_args, key_ids):
+    # 位置：[调用编号, 延迟返回时间, args, kwargs, 调用目标, 批量调用列表]
+    # 调用目标为rpc编号或[namespace, system_name, method]，批量调用时为None
+    if 'id' in notify_args:
+        target = notify_args['id']
+    elif 'calls' in notify_args:
+        target = None
+    else:
+        target = [notify_args['namespace'], notify_args['system_name'], notify_args['method']]
+    return {'c': [
+        notify_args['uuid'],
+        notify_args['delay_ret'],
+        encode_value(notify_args['args'], key_ids),
+        encode_value(notify_args['kwargs'], key_ids),
+        target,
+        encode_value(notify_args.get('calls'), key_ids),
+    ]}
+
+
+def unpack_call(data, tokens):
+    uuid, delay_ret, args, kwargs, target, calls = data['c']
+    res = {
+        'uuid': uuid,
+        'delay_ret': delay_ret,
+        'args': decode_value(args, tokens),
+        'kwargs': decode_value(kwargs, tokens),
+    }
+    if isinstance(target, list):
+        res['namespace'], res['system_name'], res['method'] = target
+    elif target is not None:
+        res['id'] = target
+    else:
+        res['calls'] = decode_value(calls, tokens)
+    if '__id__' in data:
+        res['__id__'] = data['__id__']
+    return res
+
+
+def pack_return(uuid, cb_args, key_ids):
+    # 位置：[调用编号, success, ret, error, player_id]
+    return {'r': [
+        uuid,
+        cb_args['success'],
+        encode_value(cb_args['ret'], key_ids),
+        cb_args['error'],
+        cb_args['player_id'],
+    ]}
+
+
+def unpack_return(data, tokens):
+    uuid, success, ret, error, player_id = data['r']
+    return uuid, {'success': success, 'ret': decode_value(ret, tokens), 'error': error, 'player_id': player_id}
+
+
+
+
+
+
+
+
+
@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+# ====================================================
+#
+#   Copyright (c) 2023 Nuoyan
+#   nuoyanlib is licensed under Mulan PSL v2.
+#   You can use this software according to the terms and conditions of the Mulan PSL v2.
+#   You may obtain a copy of Mulan PSL v2 at:
+#            http://license.coscl.org.cn/MulanPSL2
+#   THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY OR FIT FOR A PARTICULAR PURPOSE.
+#   See the Mulan PSL v2 for more details.
+#
+#   Author        : 诺言Nuoyan
+#   Email         : 1279735247@qq.com
+#   Gitee         : https://gitee.com/charming-lee
+#   Last Modified : 2026-10-18
+#
+# ====================================================
+
+
+from typing import Tuple, Dict, Any, List, Union
+
+
+CALL_CODEC_KEYS: Tuple[str, ...]
+_ESCAPE: str
+
+
+def build_codec_tables(keys: Union[List[str], Tuple[str, ...]]) -> Tuple[Dict[str, str], Dict[str, str]]: ...
+def encode_value(value: Any, key_ids: Dict[str, str]) -> Any: ...
+def decode_value(value: Any, tokens: Dict[str, str]) -> Any: ...
+def pack_call(notify_args: Dict[str, Any], key_ids: Dict[str, str]) -> Dict[str, list]: ...
+def unpack_call(data: Dict[str, Any], tokens: Dict[str, str]) -> Dict[str, Any]: ...
+def pack_return(uuid: int, cb_args: Dict[str, Any], key_ids: Dict[str, str]) -> Dict[str, list]: ...
+def unpack_return(data: Dict[str, Any], tokens: Dict[str, str]) -> Tuple[int, Dict[str, Any]]: ...
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+# ====================================================
+#
+#   Copyright (c) 2023 Nuoyan
+#   nuoyanlib is licensed under Mulan PSL v2.
+#   You can use this software according to the terms and conditions of the Mulan PSL v2.
+#   You may obtain a copy of Mulan PSL v2 at:
+#            http://license.coscl.org.cn/MulanPSL2
+#   THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY OR FIT FOR A PARTICULAR PURPOSE.
+#   See the Mulan PSL v2 for more details.
+#
+#   Author        : 诺言Nuoyan
+#   Email         : 1279735247@qq.com
+#   Gitee         : https://gitee.com/charming-lee
+#   Last Modified : 2026-10-18
+#
+# ====================================================
+
+
+from sys import modules as _modules
+from types import ModuleType as _ModuleType
+from importlib import import_module as _import_module
+from time import time as _time
+
+
+__all__ = [
+    "lazy_module",
+    "get_import_cost",
+]
+
+
+_import_cost = {}
+
+
+def _resolve_name(name, package):
+    if not name.startswith("."):
+        return name
+    level = len(name) - len(name.lstrip("."))
+    base = package.rsplit(".", level - 1)[0] if level > 1 else package
+    return "%s.%s" % (base, name[level:]) if name[level:] else base
+
+
+def _load_module(name, package):
+    full_name = _resolve_name(name, package)
+    module = _modules.get(full_name)
+    if module is not None:
+        return module
+    start = _time()
+    module = _import_module(full_name)
+    # 记录的是累计耗时，包含该模块导入时连带导入的其他模块
+    _import_cost[full_name] = _time() - start
+    return module
+
+
+class _LazyModule(_ModuleType):
+    def __init__(self, orig_module, lazy_attrs):
+        _ModuleType.__init__(self, orig_module.__name__, orig_module.__doc__)
+        self.__dict__.update(orig_module.__dict__)
+        # Python2中模块对象被回收时会将其全局变量全部置为None，因此需要保留原模块的引用
+        self._orig_module = orig_module
+        self._lazy_attrs = lazy_attrs
+        all_names = [k for k in orig_module.__dict__ if not k.startswith("_")]
+        all_names.extend(k for k in lazy_attrs if k not in orig_module.__dict__)
+        self.__all__ = all_names
+
+    def __getattr__(self, name):
+        lazy_attrs = self.__dict__.get('_lazy_attrs', {})
+        if name not in lazy_attrs:
+            raise AttributeError("'module' object '%s' has no attribute '%s'" % (self.__name__, name))
+        value = getattr(_load_module(lazy_attrs[name], self.__name__), name)
+        setattr(self, name, value)
+        return value
+
+    def __dir__(self):
+        return sorted(set(self.__dict__) | set(self._lazy_attrs))
+
+
+def lazy_module(module_name, submodules, star_modules=()):
+    """
+    | 将指定模块替换为惰性加载模块，子模块中的名称将在首次被访问时才导入。
+    | ``from module import *`` 时仍会导入全部名称。
+
+    -----
+
+    :param str module_name: 模块名称，通常传入__name__
+    :param tuple[tuple[str,tuple[str]]] submodules: 子模块及其导出名称的元组，格式为((子模块相对路径, (名称1, 名称2, ...)), ...)，与该子模块的__all__保持一致；名称重复时，后面的子模块优先
+    :param tuple[str] star_modules: 同样由lazy_module创建的惰性加载模块的相对路径元组，其所有导出名称会被一并转发，优先级最高
+
+    :return: 惰性加载模块
+    :rtype: module
+    """
+    orig_module = _modules[module_name]
+    lazy_attrs = {}
+    for name, attrs in submodules:
+        for attr in attrs:
+            lazy_attrs[attr] = name
+    for name in star_modules:
+        star_module = _load_module(name, module_name)
+        for attr in star_module.__all__:
+            lazy_attrs[attr] = name
+    module = _LazyModule(orig_module, lazy_attrs)
+    _modules[module_name] = module
+    return module
+
+
+def get_import_cost():
+    """
+    | 获取通过惰性加载模块导入的各个子模块的耗时。
+
+    -----
+
+    :return: 子模块完整名称到导入耗时（秒）的字典，耗时包含该子模块导入时连带导入的其他模块
+    :rtype: dict[str,float]
+    """
+    return dict(_import_cost)
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+# ====================================================
+#
+#   Copyright (c) 2023 Nuoyan
+#   nuoyanlib is licensed under Mulan PSL v2.
+#   You can use this software according to the terms and conditions of the Mulan PSL v2.
+#   You may obtain a copy of Mulan PSL v2 at:
+#            http://license.coscl.org.cn/MulanPSL2
+#   THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY OR FIT FOR A PARTICULAR PURPOSE.
+#   See the Mulan PSL v2 for more details.
+#
+#   Author        : 诺言Nuoyan
+#   Email         : 1279735247@qq.com
+#   Gitee         : https://gitee.com/charming-lee
+#   Last Modified : 2026-10-18
+#
+# ====================================================
+
+
+from typing import Dict, Tuple, Any, List
+from types import ModuleType
+
+
+_import_cost: Dict[str, float]
+
+
+def _resolve_name(name: str, package: str) -> str: ...
+def _load_module(name: str, package: str) -> ModuleType: ...
+
+
+class _LazyModule(ModuleType):
+    _orig_module: ModuleType
+    _lazy_attrs: Dict[str, str]
+    __all__: List[str]
+    def __init__(self: ..., orig_module: ModuleType, lazy_attrs: Dict[str, str]) -> None: ...
+    def __getattr__(self: ..., name: str) -> Any: ...
+    def __dir__(self: ...) -> List[str]: ...
+
+
+def lazy_module(
+    module_name: str,
+    submodules: Tuple[Tuple[str, Tuple[str, ...]], ...],
+    star_modules: Tuple[str, ...] = (),
+) -> _LazyModule: ...
+def get_import_cost() -> Dict[str, float]: ...
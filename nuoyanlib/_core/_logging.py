@@ -12,7 +12,7 @@
 #   Author        : 诺言Nuoyan
 #   Email         : 1279735247@qq.com
 #   Gitee         : https://gitee.com/charming-lee
-#   Last Modified : 2024-07-06
+#   Last Modified : 2026-10-18
 #
 # ====================================================
 
@@ -22,35 +22,335 @@ from time import (
     strftime as _strftime,
     localtime as _localtime,
 )
+from collections import deque as _deque
+from threading import Lock as _Lock
 
 
 __all__ = [
+    "DEBUG",
+    "INFO",
+    "WARNING",
+    "ERROR",
     "log",
+    "debug",
+    "info",
+    "warning",
+    "error",
+    "set_log_level",
+    "set_log_file",
+    "flush_log",
+    "set_log_buffered",
+    "get_log_history",
 ]
 
 
-def log(msg, cls=None, level="INFO"):
-    ct = _time()
-    t = _strftime("%Y-%m-%d %H:%M:%S", _localtime(ct))
-    msecs = (ct - long(ct)) * 1000
-    s = "%s,%03d" % (t, msecs)
+DEBUG = 10
+INFO = 20
+WARNING = 30
+ERROR = 40
+_LEVEL_NAMES = {
+    DEBUG: "DEBUG",
+    INFO: "INFO",
+    WARNING: "WARNING",
+    ERROR: "ERROR",
+}
+_NAME_LEVELS = {v: k for k, v in _LEVEL_NAMES.items()}
+
+
+_MAX_PENDING = 256
+_HISTORY_SIZE = 512
+
+
+_level = INFO
+_module_levels = {}
+_module_level_cache = {}
+# 全局与各模块阈值中的最小值，低于该值的日志只需一次整数比较即可丢弃
+_min_level = INFO
+_pending = []
+# 日志可能来自McTimer等后台线程，暂存的日志与限流状态均需在锁内读写
+_lock = _Lock()
+# 有库系统每tick刷新时才暂存日志，否则立即输出
+_buffered = 0
+_history = _deque(maxlen=_HISTORY_SIZE)
+_last_record = None
+_repeat_count = 0
+# 限流：同一条日志（相同级别、类与格式字符串）在每个时间窗口内最多输出的条数，为0时不限流
+_rate_limit = 20
+_rate_window = 1.0
+_window_start = 0.0
+# (级别, 类名, 格式字符串) -> 当前窗口内的次数
+_window_counts = {}
+_file = None
+_time_str_cache = [-1, ""]
+
+
+def _to_level(level):
+    if isinstance(level, str):
+        return _NAME_LEVELS.get(level.upper(), INFO)
+    return level
+
+
+def _module_level(module):
+    if module in _module_level_cache:
+        return _module_level_cache[module]
+    level = _level
+    name = module
+    while name:
+        if name in _module_levels:
+            level = _module_levels[name]
+            break
+        name = name.rpartition(".")[0]
+    _module_level_cache[module] = level
+    return level
+
+
+def _format_time(ct):
+    sec = int(ct)
+    if _time_str_cache[0] != sec:
+        _time_str_cache[0] = sec
+        _time_str_cache[1] = _strftime("%Y-%m-%d %H:%M:%S", _localtime(sec))
+    return "%s,%03d" % (_time_str_cache[1], (ct - sec) * 1000)
+
+
+def _emit(lines):
+    for line in lines:
+        print line
+    if _file:
+        _file.write("\n".join(lines) + "\n")
+        _file.flush()
+
+
+def _record(msg, cls, level, args):
+    global _last_record, _repeat_count
+    threshold = _module_level(cls.__module__) if cls else _level
+    if level < threshold:
+        return
+    key = (level, cls.__name__ if cls else "", msg)
+    if args:
+        msg = msg % args
     if cls:
         msg = "%s: %s" % (cls.__name__, msg)
-    print "[%s] [%s] [nuoyanlib] %s" % (s, level, msg)
+    now = _time()
+    with _lock:
+        if not _admit(key, now):
+            return
+        # 连续重复的相同日志只保留一条，在下一条不同日志到来或刷新时汇总重复次数
+        if _last_record == (level, msg):
+            _repeat_count += 1
+            return
+        _flush_repeat()
+        _last_record = (level, msg)
+        _pending.append((now, level, msg))
+        if not _buffered or level >= ERROR or len(_pending) >= _MAX_PENDING:
+            _flush_pending()
+
+
+def _admit(key, now):
+    if _rate_limit <= 0:
+        return True
+    if now - _window_start >= _rate_window:
+        _close_window(now)
+    count = _window_counts.get(key, 0) + 1
+    _window_counts[key] = count
+    return count <= _rate_limit
+
+
+def _close_window(now):
+    # 汇总上一个窗口内被限流丢弃的日志
+    global _window_start
+    for (level, cls_name, msg), count in _window_counts.iteritems():
+        if count > _rate_limit:
+            prefix = "%s: " % cls_name if cls_name else ""
+            _pending.append((now, level, "%s(suppressed %d messages like '%s')" % (prefix, count - _rate_limit, msg)))
+    _window_counts.clear()
+    _window_start = now
+
+
+def _flush_repeat():
+    global _repeat_count
+    if _repeat_count:
+        level = _last_record[0]
+        _pending.append((_time(), level, "(last message repeated %d times)" % _repeat_count))
+        _repeat_count = 0
+
+
+def log(msg, cls=None, level=INFO, *args):
+    """
+    | 输出一条日志。级别低于阈值的日志会在格式化之前被丢弃。
+
+    -----
+
+    :param str msg: 日志内容，可包含%格式化占位符，由args延迟格式化
+    :param type|None cls: 日志所属的类，默认为None
+    :param int|str level: 日志级别，可使用DEBUG、INFO、WARNING、ERROR或对应的字符串，默认为INFO
+    :param Any args: 变长参数，格式化msg时使用，仅在日志实际输出时才进行格式化
+
+    :return: 无
+    :rtype: None
+    """
+    level = _to_level(level)
+    if level < _min_level:
+        return
+    _record(msg, cls, level, args)
+
+
+def debug(msg, cls=None, *args):
+    if DEBUG < _min_level:
+        return
+    _record(msg, cls, DEBUG, args)
+
+
+def info(msg, cls=None, *args):
+    if INFO < _min_level:
+        return
+    _record(msg, cls, INFO, args)
+
+
+def warning(msg, cls=None, *args):
+    if WARNING < _min_level:
+        return
+    _record(msg, cls, WARNING, args)
+
+
+def error(msg, cls=None, *args):
+    if ERROR < _min_level:
+        return
+    _record(msg, cls, ERROR, args)
+
+
+def set_log_level(level, module=""):
+    """
+    | 设置日志级别阈值。
+
+    -----
+
+    :param int|str|None level: 日志级别，低于该级别的日志将被丢弃；为模块设置时可传入None，表示移除该模块的阈值
+    :param str module: 模块名称，设置后仅对该模块及其子模块生效，默认为空字符串，表示设置全局阈值
+
+    :return: 无
+    :rtype: None
+    """
+    global _level, _min_level
+    if module:
+        if level is None:
+            _module_levels.pop(module, None)
+        else:
+            _module_levels[module] = _to_level(level)
+    elif level is not None:
+        _level = _to_level(level)
+    _module_level_cache.clear()
+    _min_level = min([_level] + _module_levels.values())
+
+
+def set_log_file(path):
+    """
+    | 设置日志文件，设置后日志将同时追加写入该文件。仅建议在本地调试时使用。
+
+    -----
+
+    :param str|None path: 日志文件路径，传入None时关闭当前的日志文件
+
+    :return: 无
+    :rtype: None
+    """
+    global _file
+    if _file:
+        _file.close()
+        _file = None
+    if path:
+        _file = open(path, "a")
+
+
+def flush_log():
+    """
+    | 输出所有暂存的日志。库系统每tick会自动调用一次。
+
+    -----
+
+    :return: 无
+    :rtype: None
+    """
+    with _lock:
+        _flush_pending()
+
+
+def _flush_pending():
+    _flush_repeat()
+    if _window_counts and _time() - _window_start >= _rate_window:
+        _close_window(_time())
+    if not _pending:
+        return
+    lines = [
+        "[%s] [%s] [nuoyanlib] %s" % (_format_time(ct), _LEVEL_NAMES.get(level, level), msg)
+        for ct, level, msg in _pending
+    ]
+    del _pending[:]
+    _history.extend(lines)
+    _emit(lines)
+
+
+def set_log_buffered(buffered):
+    """
+    | 设置是否暂存日志，暂存的日志在flush_log时统一输出，ERROR级别的日志总是立即输出。
+    | 库系统创建时开启、销毁时关闭，开启与关闭的次数相同时恢复为立即输出，因此在库系统创建之前输出的日志不会一直滞留。
+
+    -----
+
+    :param bool buffered: 是否暂存日志
+
+    :return: 无
+    :rtype: None
+    """
+    global _buffered
+    with _lock:
+        if buffered:
+            _buffered += 1
+        else:
+            _buffered = max(0, _buffered - 1)
+            if not _buffered:
+                _flush_pending()
+
+
+def _load_config():
+    global _rate_limit, _rate_window
+    try:
+        from .. import config
+    except (ImportError, ValueError):
+        return
+    set_log_level(getattr(config, "LOG_LEVEL", "INFO"))
+    set_log_file(getattr(config, "LOG_FILE", ""))
+    _rate_limit = getattr(config, "LOG_RATE_LIMIT", _rate_limit)
+    _rate_window = getattr(config, "LOG_RATE_WINDOW", _rate_window)
+
+
+def get_log_history():
+    """
+    | 获取最近输出的日志，最多保留512条。
+
+    -----
+
+    :return: 日志字符串列表
+    :rtype: list[str]
+    """
+    return list(_history)
+
+
+_load_config()
 
 
 if __name__ == "__main__":
     log("Hello, world!")
     class Test(object): pass
     log("Hello, world!", Test)
-    log("Hello, world!", Test, "ERROR")
-    import logging
-    lg = logging.getLogger()
-    lg.setLevel(logging.INFO)
-    hdlr = logging.StreamHandler()
-    hdlr.setFormatter(logging.Formatter("[%(asctime)s] [%(levelname)s] [nuoyanlib] %(message)s"))
-    lg.addHandler(hdlr)
-    lg.info("Hello, world!")
+    log("Hello, %s!", Test, "ERROR", "world")
+    debug("Invisible %s", Test, "debug")
+    set_log_level(DEBUG, __name__)
+    debug("Visible %s", Test, "debug")
+    for _ in range(5):
+        info("Repeated", Test)
+    warning("Done", Test)
+    flush_log()
+    print get_log_history()
 
 
 
@@ -12,12 +12,58 @@
 #   Author        : 诺言Nuoyan
 #   Email         : 1279735247@qq.com
 #   Gitee         : https://gitee.com/charming-lee
-#   Last Modified : 2024-07-06
+#   Last Modified : 2026-10-18
 #
 # ====================================================
 
 
-from typing import Any
+from typing import Any, Dict, List, Optional, Tuple, Union, Deque, IO
+from thread import LockType
 
 
-def log(msg: str, cls: Any = None, level: str = "INFO") -> None: ...
+DEBUG: int
+INFO: int
+WARNING: int
+ERROR: int
+_LEVEL_NAMES: Dict[int, str]
+_NAME_LEVELS: Dict[str, int]
+_MAX_PENDING: int
+_HISTORY_SIZE: int
+_level: int
+_module_levels: Dict[str, int]
+_module_level_cache: Dict[str, int]
+_min_level: int
+_pending: List[Tuple[float, int, str]]
+_lock: LockType
+_buffered: int
+_history: Deque[str]
+_last_record: Optional[Tuple[int, str]]
+_repeat_count: int
+_rate_limit: int
+_rate_window: float
+_window_start: float
+_window_counts: Dict[Tuple[int, str, str], int]
+_file: Optional[IO]
+_time_str_cache: List[Union[int, str]]
+
+
+def _to_level(level: Union[int, str]) -> int: ...
+def _module_level(module: str) -> int: ...
+def _format_time(ct: float) -> str: ...
+def _emit(lines: List[str]) -> None: ...
+def _record(msg: str, cls: Any, level: int, args: tuple) -> None: ...
+def _admit(key: Tuple[int, str, str], now: float) -> bool: ...
+def _close_window(now: float) -> None: ...
+def _flush_repeat() -> None: ...
+def log(msg: str, cls: Any = None, level: Union[int, str] = INFO, *args: Any) -> None: ...
+def debug(msg: str, cls: Any = None, *args: Any) -> None: ...
+def info(msg: str, cls: Any = None, *args: Any) -> None: ...
+def warning(msg: str, cls: Any = None, *args: Any) -> None: ...
+def error(msg: str, cls: Any = None, *args: Any) -> None: ...
+def set_log_level(level: Union[int, str, None], module: str = "") -> None: ...
+def set_log_file(path: Optional[str]) -> None: ...
+def flush_log() -> None: ...
+def _flush_pending() -> None: ...
+def set_log_buffered(buffered: bool) -> None: ...
+def _load_config() -> None: ...
+def get_log_history() -> List[str]: ...
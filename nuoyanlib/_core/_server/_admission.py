@@ -0,0 +1,208 @@
+# -*- coding: utf-8 -*-
+# ====================================================
+#
+#   Copyright (c) 2023 Nuoyan
+#   nuoyanlib is licensed under Mulan PSL v2.
+#   You can use this software according to the terms and conditions of the Mulan PSL v2.
+#   You may obtain a copy of Mulan PSL v2 at:
+#            http://license.coscl.org.cn/MulanPSL2
+#   THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY OR FIT FOR A PARTICULAR PURPOSE.
+#   See the Mulan PSL v2 for more details.
+#
+#   Author        : 诺言Nuoyan
+#   Email         : 1279735247@qq.com
+#   Gitee         : https://gitee.com/charming-lee
+#   Last Modified : 2026-10-18
+#
+# ====================================================
+
+
+from time import time as _time
+from collections import deque as _deque
+from .._sys import load_config as _load_config
+
+
+__all__ = [
+    "get_call_admission_stats",
+    "reset_call_admission_stats",
+    "admit_call",
+    "admit_evaluation",
+    "charge_evaluation",
+    "drain_call_queue",
+    "drop_call_queue",
+]
+
+
+# 每个玩家每秒可执行的调用数（令牌补充速度）与令牌上限，为0时不限制，默认不限制
+_rate = _load_config("CALL_RATE_LIMIT", 0)
+_burst = _load_config("CALL_RATE_BURST", 60)
+# 每个玩家排队等待执行的调用数上限，超出后直接拒绝
+_queue_size = _load_config("CALL_QUEUE_SIZE", 128)
+# 每tick执行的调用数与耗时（秒）上限，为0时不限制，默认不限制
+_tick_calls = _load_config("CALL_TICK_BUDGET", 0)
+_tick_time = _load_config("CALL_TICK_TIME_BUDGET", 0)
+
+# 玩家ID -> [令牌数, 上次补充的时间]
+_buckets = {}
+# 玩家ID -> 排队中的调用，每一项为(入队时间, 调用参数, 执行函数)
+_queues = {}
+# 有排队调用的玩家，按轮转顺序逐个执行，避免单个玩家占满每tick的预算
+_order = _deque()
+# 本tick已执行的调用数与耗时
+_tick_used = [0, 0.0]
+_stats = {
+    'executed': 0,
+    'deferred': 0,
+    'rejected': 0,
+    'max_queued': 0,
+    'total_wait': 0.0,
+    'max_wait': 0.0,
+    'deferred_evaluations': 0,
+}
+
+
+def get_call_admission_stats():
+    """
+    | 获取客户端调用服务端（call、call_batch等）的准入统计数据。
+    | 服务端为每个玩家维护一个令牌桶，并限制每tick执行的调用数与耗时，超出限制的调用会排队到之后的tick执行，排队数超出上限时直接拒绝，回调参数中 ``error`` 为"call queue full"。
+    | 各项限制默认关闭，可在config.py中通过CALL_RATE_LIMIT、CALL_RATE_BURST、CALL_QUEUE_SIZE、CALL_TICK_BUDGET、CALL_TICK_TIME_BUDGET开启与设置。
+
+    -----
+
+    :return: 统计字典，包含executed（已执行的调用数）、deferred（曾排队的调用数）、rejected（被拒绝的调用数）、deferred_evaluations（因超出限制而推迟的订阅评估次数）、queued（当前排队中的调用数）、max_queued（单个玩家排队数的最大值）、avg_wait（排队调用的平均等待时间，单位为秒）、max_wait（排队调用的最长等待时间，单位为秒）、players（各玩家当前的排队数）
+    :rtype: dict[str,Any]
+    """
+    stats = dict(_stats)
+    waited = stats.pop('total_wait')
+    dequeued = stats['deferred'] - sum(len(q) for q in _queues.values())
+    stats['avg_wait'] = waited / dequeued if dequeued > 0 else 0.0
+    stats['players'] = {player_id: len(q) for player_id, q in _queues.items() if q}
+    stats['queued'] = sum(stats['players'].values())
+    return stats
+
+
+def reset_call_admission_stats():
+    """
+    | 清零客户端调用服务端的准入统计数据，不影响排队中的调用。
+
+    -----
+
+    :return: 无
+    :rtype: None
+    """
+    for k in _stats:
+        _stats[k] = 0.0 if isinstance(_stats[k], float) else 0
+    # 已在排队中的调用出队时仍会计入等待时间，将其重新计为排队调用，保证平均值正确
+    _stats['deferred'] = sum(len(q) for q in _queues.values())
+
+
+def _take_token(player_id, now):
+    if _rate <= 0:
+        return True
+    bucket = _buckets.get(player_id)
+    if bucket is None:
+        bucket = _buckets[player_id] = [_burst, now]
+    else:
+        bucket[0] = min(_burst, bucket[0] + (now - bucket[1]) * _rate)
+        bucket[1] = now
+    if bucket[0] < 1:
+        return False
+    bucket[0] -= 1
+    return True
+
+
+def _has_tick_budget():
+    if _tick_calls > 0 and _tick_used[0] >= _tick_calls:
+        return False
+    if _tick_time > 0 and _tick_used[1] >= _tick_time:
+        return False
+    return True
+
+
+def _run(execute, args):
+    start = _time()
+    execute(args)
+    _tick_used[0] += 1
+    _tick_used[1] += _time() - start
+    _stats['executed'] += 1
+
+
+def admit_call(player_id, args, execute, reject):
+    queue = _queues.get(player_id)
+    now = _time()
+    # 已有排队的调用时新调用只能排在后面，保证同一玩家的调用按顺序执行
+    if not queue and _has_tick_budget() and _take_token(player_id, now):
+        _run(execute, args)
+        return
+    if queue is None:
+        queue = _queues[player_id] = _deque()
+    if _queue_size > 0 and len(queue) >= _queue_size:
+        _stats['rejected'] += 1
+        reject(args)
+        return
+    if not queue:
+        _order.append(player_id)
+    queue.append((now, args, execute))
+    _stats['deferred'] += 1
+    if len(queue) > _stats['max_queued']:
+        _stats['max_queued'] = len(queue)
+
+
+def admit_evaluation(player_ids):
+    # 订阅的评估与调用共用每tick的预算，并由任一订阅者支付一个令牌；不满足时推迟到之后的tick
+    if _has_tick_budget():
+        if _rate <= 0:
+            return True
+        now = _time()
+        for player_id in player_ids:
+            if _take_token(player_id, now):
+                return True
+    _stats['deferred_evaluations'] += 1
+    return False
+
+
+def charge_evaluation(cost):
+    _tick_used[0] += 1
+    _tick_used[1] += cost
+
+
+def drain_call_queue():
+    _tick_used[0] = 0
+    _tick_used[1] = 0.0
+    progress = True
+    while _order and progress:
+        progress = False
+        for _ in xrange(len(_order)):
+            if not _has_tick_budget():
+                return
+            player_id = _order.popleft()
+            queue = _queues.get(player_id)
+            if not queue:
+                continue
+            now = _time()
+            if _take_token(player_id, now):
+                enqueue_time, args, execute = queue.popleft()
+                wait = now - enqueue_time
+                _stats['total_wait'] += wait
+                if wait > _stats['max_wait']:
+                    _stats['max_wait'] = wait
+                _run(execute, args)
+                progress = True
+            if queue:
+                _order.append(player_id)
+
+
+def drop_call_queue(player_id):
+    _buckets.pop(player_id, None)
+    queue = _queues.pop(player_id, None)
+    if queue:
+        # 丢弃的调用不再计入平均等待时间
+        _stats['deferred'] -= len(queue)
+    if player_id in _order:
+        _order.remove(player_id)
+
+
+
+
+
+
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+# ====================================================
+#
+#   Copyright (c) 2023 Nuoyan
+#   nuoyanlib is licensed under Mulan PSL v2.
+#   You can use this software according to the terms and conditions of the Mulan PSL v2.
+#   You may obtain a copy of Mulan PSL v2 at:
+#            http://license.coscl.org.cn/MulanPSL2
+#   THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY OR FIT FOR A PARTICULAR PURPOSE.
+#   See the Mulan PSL v2 for more details.
+#
+#   Author        : 诺言Nuoyan
+#   Email         : 1279735247@qq.com
+#   Gitee         : https://gitee.com/charming-lee
+#   Last Modified : 2026-10-18
+#
+# ====================================================
+
+
+from typing import Dict, List, Tuple, Callable, Any, Deque, Iterable
+
+
+_rate: float
+_burst: int
+_queue_size: int
+_tick_calls: int
+_tick_time: float
+_buckets: Dict[str, List[float]]
+_queues: Dict[str, Deque[Tuple[float, dict, Callable[[dict], Any]]]]
+_order: Deque[str]
+_tick_used: List[float]
+_stats: Dict[str, float]
+
+
+def get_call_admission_stats() -> Dict[str, Any]: ...
+def reset_call_admission_stats() -> None: ...
+def _take_token(player_id: str, now: float) -> bool: ...
+def _has_tick_budget() -> bool: ...
+def _run(execute: Callable[[dict], Any], args: dict) -> None: ...
+def admit_call(
+    player_id: str,
+    args: dict,
+    execute: Callable[[dict], Any],
+    reject: Callable[[dict], Any],
+) -> None: ...
+def admit_evaluation(player_ids: Iterable[str]) -> bool: ...
+def charge_evaluation(cost: float) -> None: ...
+def drain_call_queue() -> None: ...
+def drop_call_queue(player_id: str) -> None: ...
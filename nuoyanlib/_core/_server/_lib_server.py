@@ -12,22 +12,44 @@
 #   Author        : 诺言Nuoyan
 #   Email         : 1279735247@qq.com
 #   Gitee         : https://gitee.com/charming-lee
-#   Last Modified : 2025-01-26
+#   Last Modified : 2026-10-18
 #
 # ====================================================
 
 
+from time import time as _time
+from copy import deepcopy as _deepcopy
+from itertools import count as _count
+from traceback import format_exc as _format_exc
 import mod.server.extraServerApi as _server_api
 from mod.common.minecraftEnum import (
     ItemPosType as _ItemPosType
 )
+from .._const import (
+    LIB_NAME as _LIB_NAME,
+    LIB_CLIENT_NAME as _LIB_CLIENT_NAME,
+)
 from ._comp import (
     CompFactory as _CompFactory,
     ServerSystem as _ServerSystem,
     LvComp as _LvComp,
+    release_entity_comp as _release_entity_comp,
+    EntityComp as _EntityComp,
+)
+from ._snapshot import (
+    clear_tick_snapshot as _clear_tick_snapshot,
+    invalidate_entity_snapshot as _invalidate_entity_snapshot,
+)
+from ._admission import (
+    admit_call as _admit_call,
+    admit_evaluation as _admit_evaluation,
+    charge_evaluation as _charge_evaluation,
+    drain_call_queue as _drain_call_queue,
+    drop_call_queue as _drop_call_queue,
 )
 from ._listener import (
     listen_custom as _listen_custom,
+    event as _event,
     lib_sys_event as _lib_sys_event,
 )
 from .._utils import (
@@ -39,16 +61,37 @@ from .._utils import (
 )
 from .._sys import (
     NuoyanLibBaseSystem as _NuoyanLibBaseSystem,
+    copy_msg_data as _copy_msg_data,
+    load_config as _load_config,
+    BATCH_EVENT_NAME as _BATCH_EVENT_NAME,
+    STREAM_CHUNK_EVENT_NAME as _STREAM_CHUNK_EVENT_NAME,
+    STREAM_CANCEL_EVENT_NAME as _STREAM_CANCEL_EVENT_NAME,
+)
+from ...utils.calculator import (
+    pos_distance as _pos_distance,
 )
 from ...utils.item import (
     is_empty_item as _is_empty_item,
     deepcopy_item_dict as _deepcopy_item_dict,
 )
-from .._logging import log as _log
+from .._codec import CALL_CODEC_KEYS as _CALL_CODEC_KEYS
+from .._logging import (
+    log as _log,
+    debug as _log_debug,
+    error as _log_error,
+    set_log_buffered as _set_log_buffered,
+)
 from ...utils.communicate import (
     call_local as _call_local,
     call_callback as _call_callback,
+    call_batch_local as _call_batch_local,
+    call_endpoint as _call_endpoint,
+    check_call_timeouts as _check_call_timeouts,
+    report_call_progress as _report_call_progress,
+    reset_side_cache as _reset_side_cache,
+    clear_missing_systems as _clear_missing_systems,
 )
+from ...utils.mc_timer import drain_timer_queue as _drain_timer_queue
 
 
 __all__ = [
@@ -59,6 +102,18 @@ __all__ = [
 
 _DATA_KEY_ITEMS_DATA = "_nuoyanlib_item_grid_data"
 _INV_POS_TYPE = _ItemPosType.INVENTORY
+_QUERY_CACHE_RADIUS = 64.0
+_QUERY_CACHE_CHUNK_SIZE = 32
+
+
+def _diff_value(topic_id, old, new):
+    # 字典只发送变化与删除的键，其余类型发送完整的新值
+    if isinstance(old, dict) and isinstance(new, dict):
+        changed = {k: v for k, v in new.iteritems() if k not in old or old[k] != v}
+        removed = [k for k in old if k not in new]
+        if len(changed) + len(removed) < len(new):
+            return {'t': topic_id, 'd': changed, 'r': removed}
+    return {'t': topic_id, 'v': new}
 
 
 _lib_sys = None
@@ -72,15 +127,42 @@ class NuoyanLibServerSystem(_NuoyanLibBaseSystem, _ServerSystem):
     def __init__(self, namespace, system_name):
         super(NuoyanLibServerSystem, self).__init__(namespace, system_name)
         self._query_cache = {}
+        self._query_cache_replay = {}
+        self._codec_players = set()
+        self._topics = {}
+        self._topic_keys = {}
+        self._topic_ids = _count(1)
+        self._sub_owners = {}
+        self._sub_stats = {'evaluations': 0, 'changes': 0, 'pushes': 0}
+        self._sub_min_interval = _load_config("SUBSCRIBE_MIN_INTERVAL", 0.1)
+        self._sub_max_per_player = _load_config("SUBSCRIBE_MAX_PER_PLAYER", 32)
+        self._sub_counts = {}
+        if self._compact_codec:
+            self.set_codec_keys(_CALL_CODEC_KEYS)
+        self._batch_relay = _ServerSystem(_LIB_NAME, _LIB_CLIENT_NAME)
         self._item_grid_items = _LvComp.ExtraData.GetExtraData(_DATA_KEY_ITEMS_DATA) or {}
         _LvComp.Game.AddTimer(0, _listen_custom, self)
         global _lib_sys
         _lib_sys = self
+        _reset_side_cache()
         _log("Inited", NuoyanLibServerSystem)
 
+    def Update(self):
+        super(NuoyanLibServerSystem, self).Update()
+        _drain_timer_queue(self._timer_budget, self._timer_time_budget)
+        _drain_call_queue()
+        _check_call_timeouts()
+        _clear_missing_systems()
+        if self._topics:
+            self._update_topics()
+        if self._query_cache_replay:
+            self._replay_query_cache()
+
     def Destroy(self):
+        self.flush_msgs()
         res = _LvComp.ExtraData.SetExtraData(_DATA_KEY_ITEMS_DATA, self._item_grid_items)
         _log("Saved item grid data (%s)" % res, NuoyanLibServerSystem, "INFO" if res else "ERROR")
+        _set_log_buffered(False)
 
     # General ==========================================================================================================
 
@@ -88,7 +170,75 @@ class NuoyanLibServerSystem(_NuoyanLibBaseSystem, _ServerSystem):
     def _on_ui_init_finished(self, args):
         player_id = args['__id__']
         if self._query_cache:
-            self.NotifyToClient(player_id, "_SetQueryCache", self._query_cache)
+            self._start_query_cache_replay(player_id)
+
+    # Message Batching =================================================================================================
+
+    def _send_msg(self, target, event_name, event_data):
+        _ServerSystem.NotifyToClient(self, target, event_name, event_data)
+
+    def _dispatch_msg(self, event_name, event_data):
+        self._batch_relay.BroadcastEvent(event_name, event_data)
+
+    def NotifyToClient(self, targetId, eventName, eventData, immediate=False):
+        self.post_msg(targetId, eventName, eventData, immediate)
+
+    def NotifyToMultiClients(self, targetIdList, eventName, eventData, immediate=False):
+        if not self._batch_msgs:
+            _ServerSystem.NotifyToMultiClients(self, targetIdList, eventName, eventData)
+            return
+        if not immediate:
+            # 只复制一次，各玩家的消息共用同一份副本
+            eventData = _copy_msg_data(eventData)
+        for player_id in targetIdList:
+            self.post_msg(player_id, eventName, eventData, immediate, False)
+
+    def BroadcastToAllClient(self, eventName, eventData, immediate=False):
+        if not self._batch_msgs:
+            _ServerSystem.BroadcastToAllClient(self, eventName, eventData)
+            return
+        self.NotifyToMultiClients(_server_api.GetPlayerList(), eventName, eventData, immediate)
+
+    @_lib_sys_event(_BATCH_EVENT_NAME)
+    def _on_batch(self, args):
+        self.dispatch_batch(args)
+
+    # Streaming ========================================================================================================
+
+    @_lib_sys_event(_STREAM_CHUNK_EVENT_NAME)
+    def _on_chunk(self, args):
+        self.receive_chunk(args)
+
+    @_lib_sys_event(_STREAM_CANCEL_EVENT_NAME)
+    def _on_chunk_cancel(self, args):
+        self.cancel_chunks(args)
+
+    def _on_stream_progress(self, event_name, tag, done, total, sender):
+        if event_name == "_NuoyanLibCallReturn":
+            _report_call_progress(tag, "recv", done, total, sender)
+
+    # EntityComp & Snapshot ============================================================================================
+
+    @_event("EntityRemoveEvent")
+    def _on_entity_remove(self, args):
+        _release_entity_comp(args['id'])
+        _invalidate_entity_snapshot(args['id'])
+        self._query_cache.pop(args['id'], None)
+
+    @_event("PlayerIntendLeaveServerEvent")
+    def _on_player_intend_leave(self, args):
+        _release_entity_comp(args['playerId'])
+        self._query_cache.pop(args['playerId'], None)
+        self._query_cache_replay.pop(args['playerId'], None)
+        self._remote_rpc_ids.pop(args['playerId'], None)
+        self._codec_players.discard(args['playerId'])
+        self.drop_streams(args['playerId'])
+        _drop_call_queue(args['playerId'])
+        self._drop_subscriber(args['playerId'])
+
+    @_event("OnScriptTickServer")
+    def _on_script_tick(self):
+        _clear_tick_snapshot()
 
     # BroadcastToAllClient =============================================================================================
 
@@ -125,29 +275,262 @@ class NuoyanLibServerSystem(_NuoyanLibBaseSystem, _ServerSystem):
         self._query_cache.setdefault(entity_id, {})[name] = value
         self.BroadcastToAllClient("_SetQueryVar", args)
 
+    def _start_query_cache_replay(self, player_id):
+        # 玩家附近的实体分批在之后的几个tick内发送，其余实体只发送ID，由客户端在实体加载时按需请求
+        player_pos = _EntityComp(player_id).Pos.GetFootPos()
+        player_dim = _EntityComp(player_id).Dimension.GetEntityDimensionId()
+        near = []
+        far = []
+        for entity_id in self._query_cache:
+            pos = _EntityComp(entity_id).Pos.GetFootPos()
+            if player_pos and pos and _EntityComp(entity_id).Dimension.GetEntityDimensionId() == player_dim:
+                dist = _pos_distance(pos, player_pos)
+                if dist <= _QUERY_CACHE_RADIUS:
+                    near.append((dist, entity_id))
+                    continue
+            far.append(entity_id)
+        if near:
+            # 由远及近排列，从末尾取出，使近处的实体先发送
+            near.sort(reverse=True)
+            self._query_cache_replay[player_id] = [i[1] for i in near]
+        if far:
+            self.NotifyToClient(player_id, "_QueryCachePending", {'ids': far})
+
+    def _replay_query_cache(self):
+        for player_id, entity_ids in self._query_cache_replay.items():
+            chunk = entity_ids[-_QUERY_CACHE_CHUNK_SIZE:]
+            del entity_ids[-_QUERY_CACHE_CHUNK_SIZE:]
+            if not entity_ids:
+                del self._query_cache_replay[player_id]
+            data = {i: self._query_cache[i] for i in chunk if i in self._query_cache}
+            if data:
+                self.NotifyToClient(player_id, "_SetQueryCache", data)
+
+    @_lib_sys_event("_RequestQueryCache")
+    def _on_request_query_cache(self, args):
+        player_id = args['__id__']
+        data = {i: self._query_cache[i] for i in args['ids'] if i in self._query_cache}
+        if data:
+            self.NotifyToClient(player_id, "_SetQueryCache", data)
+
     # call =============================================================================================================
 
+    def _on_rpc_registered(self, table):
+        self.BroadcastToAllClient("_RpcTable", {'table': table})
+
+    @_lib_sys_event("_RpcTable")
+    def _on_rpc_table(self, args):
+        player_id = args['__id__']
+        self.update_remote_rpc_ids(player_id, args['table'])
+        if args.get('full'):
+            data = {'table': self.get_rpc_table()}
+            if self._compact_codec:
+                # 下发键表后，发往该玩家的调用消息才能使用短标记
+                data['keys'] = list(_CALL_CODEC_KEYS)
+                self._codec_players.add(player_id)
+            self.NotifyToClient(player_id, "_RpcTable", data)
+
+    def _get_codec_key_ids(self, targets):
+        for player_id in targets:
+            if player_id not in self._codec_players:
+                return {}
+        return self._codec_key_ids
+
     @_lib_sys_event("_NuoyanLibCall")
     def _be_called(self, args):
-        namespace = args['namespace']
-        system_name = args['system_name']
-        method = args['method']
+        # 客户端的调用经过准入控制，超出限制时排队到之后的tick执行
+        _admit_call(args['__id__'], self.decode_call(args), self._run_call, self._reject_call)
+
+    def _reply_call(self, player_id, uuid, cb_args):
+        data = self.encode_return((player_id,), uuid, cb_args)
+        if not self.stream_msg((player_id,), "_NuoyanLibCallReturn", data, uuid):
+            self.NotifyToClient(player_id, "_NuoyanLibCallReturn", data)
+
+    def _reject_call(self, args):
+        self._reply_call(args['__id__'], args['uuid'], {
+            'success': False,
+            'ret': None,
+            'error': "call queue full",
+            'player_id': "",
+        })
+
+    def _run_call(self, args):
         delay_ret = args['delay_ret']
         call_args = args['args']
         call_kwargs = args['kwargs']
         uuid = args['uuid']
         playerId = args['__id__']
-        target_sys = _server_api.GetSystem(namespace, system_name)
         def callback(cb_args):
-            self.NotifyToClient(playerId, "_NuoyanLibCallReturn", {'uuid': uuid, 'cb_args': cb_args})
+            self._reply_call(playerId, uuid, cb_args)
+        if 'id' in args:
+            _call_endpoint(self.get_rpc_endpoint(args['id']), callback, delay_ret, call_args, call_kwargs)
+            return
+        if 'calls' in args:
+            _call_batch_local(args['calls'], callback, delay_ret, self.resolve_rpc)
+            return
+        namespace = args['namespace']
+        system_name = args['system_name']
+        method = args['method']
+        allowed, func = self.resolve_rpc(namespace, system_name, method)
+        if not allowed:
+            callback({'success': False, 'ret': None, 'error': "not whitelisted", 'player_id': ""})
+            return
+        if func is not None:
+            _call_endpoint(func, callback, delay_ret, call_args, call_kwargs)
+            return
+        target_sys = _server_api.GetSystem(namespace, system_name)
         _call_local(target_sys, method, callback, delay_ret, call_args, call_kwargs)
 
     @_lib_sys_event("_NuoyanLibCallReturn")
     def _call_return(self, args):
-        uuid = args['uuid']
-        cb_args = args['cb_args']
+        uuid, cb_args = self.decode_return(args)
         _call_callback(uuid, **cb_args)
 
+    @_lib_sys_event("_NuoyanLibCallCancel")
+    def _on_call_cancel(self, args):
+        self.cancel_streams(args['__id__'], "_NuoyanLibCallReturn", args['uuid'])
+
+    # Subscription ===================================================================================================
+
+    @_lib_sys_event("_Subscribe")
+    def _on_subscribe(self, args):
+        player_id = args['__id__']
+        group_id = args['s']
+        interval = args['interval']
+        if not isinstance(interval, (int, long, float)):
+            return
+        # 间隔来自客户端，需限制下限，避免单个玩家使服务端每tick执行被订阅函数
+        interval = max(interval, self._sub_min_interval)
+        topic_id = self._sub_owners.get((player_id, group_id))
+        if topic_id is not None:
+            # 同一订阅再次发送时只更新评估间隔
+            topic = self._topics[topic_id]
+            topic['intervals'][player_id] = interval
+            topic['interval'] = min(topic['intervals'].itervalues())
+            return
+        if 'namespace' not in args:
+            return
+        # 每个不同的参数都会产生一个需定期评估的主题，需限制单个玩家的订阅数
+        if self._sub_max_per_player and self._sub_counts.get(player_id, 0) >= self._sub_max_per_player:
+            _log("Subscribe '%s' rejected: too many subscriptions" % args['method'], NuoyanLibServerSystem, "WARNING")
+            return
+        namespace = args['namespace']
+        system_name = args['system_name']
+        method = args['method']
+        if not self.is_rpc_allowed(namespace, system_name, method):
+            _log("Subscribe '%s' rejected: not whitelisted" % method, NuoyanLibServerSystem, "WARNING")
+            return
+        call_args = args['args']
+        call_kwargs = args['kwargs']
+        key = (namespace, system_name, method, repr(call_args), repr(sorted(call_kwargs.items())) if call_kwargs else None)
+        topic_id = self._topic_keys.get(key)
+        if topic_id is None:
+            topic_id = self._topic_keys[key] = next(self._topic_ids)
+            self._topics[topic_id] = {
+                'key': key,
+                'namespace': namespace,
+                'system_name': system_name,
+                'method': method,
+                # 订阅名为rpc别名时按编号取得已注册的函数，否则按方法名查找
+                'rpc_id': self.get_rpc_id(namespace, system_name, method),
+                'args': call_args or (),
+                'kwargs': call_kwargs or {},
+                'interval': interval,
+                'intervals': {},
+                'next': 0,
+                'owners': {},
+                'ready': set(),
+                'value': None,
+                'has_value': False,
+            }
+        topic = self._topics[topic_id]
+        topic['intervals'][player_id] = interval
+        topic['interval'] = min(topic['intervals'].itervalues())
+        topic['owners'][player_id] = group_id
+        self._sub_owners[(player_id, group_id)] = topic_id
+        self._sub_counts[player_id] = self._sub_counts.get(player_id, 0) + 1
+        if topic['has_value']:
+            self.NotifyToClient(player_id, "_SubValue", {'s': group_id, 't': topic_id, 'v': topic['value']})
+            topic['ready'].add(player_id)
+
+    @_lib_sys_event("_Unsubscribe")
+    def _on_unsubscribe(self, args):
+        player_id = args['__id__']
+        topic_id = self._sub_owners.pop((player_id, args['s']), None)
+        if topic_id is not None:
+            self._remove_subscriber(topic_id, player_id)
+
+    def _remove_subscriber(self, topic_id, player_id):
+        count = self._sub_counts.pop(player_id, 0) - 1
+        if count > 0:
+            self._sub_counts[player_id] = count
+        topic = self._topics[topic_id]
+        topic['owners'].pop(player_id, None)
+        topic['intervals'].pop(player_id, None)
+        topic['ready'].discard(player_id)
+        if not topic['owners']:
+            del self._topics[topic_id]
+            del self._topic_keys[topic['key']]
+        else:
+            # 按剩余订阅者重新计算间隔
+            topic['interval'] = min(topic['intervals'].itervalues())
+
+    def _drop_subscriber(self, player_id):
+        for owner in self._sub_owners.keys():
+            if owner[0] == player_id:
+                self._remove_subscriber(self._sub_owners.pop(owner), player_id)
+
+    def refresh_topics(self, namespace, system_name, method=""):
+        count = 0
+        for topic in self._topics.itervalues():
+            if topic['namespace'] == namespace and topic['system_name'] == system_name:
+                if not method or topic['method'] == method:
+                    topic['next'] = 0
+                    count += 1
+        return count
+
+    def _update_topics(self):
+        now = _time()
+        for topic_id, topic in self._topics.items():
+            if topic['next'] > now:
+                continue
+            # 评估计入客户端调用的准入预算，超出时保留到期时间，之后的tick再评估
+            if not _admit_evaluation(topic['owners']):
+                continue
+            topic['next'] = now + topic['interval']
+            start = _time()
+            try:
+                if topic['rpc_id'] is None:
+                    func = getattr(_server_api.GetSystem(topic['namespace'], topic['system_name']), topic['method'])
+                else:
+                    func = self.get_rpc_endpoint(topic['rpc_id'])
+                value = func(*topic['args'], **topic['kwargs'])
+            except:
+                _log_error("Evaluate subscription '%s' failed:\n%s", NuoyanLibServerSystem, topic['method'], _format_exc())
+                continue
+            finally:
+                _charge_evaluation(_time() - start)
+            self._sub_stats['evaluations'] += 1
+            ready = topic['ready']
+            if topic['has_value'] and ready and value != topic['value']:
+                self._sub_stats['changes'] += 1
+                self._sub_stats['pushes'] += len(ready)
+                self.NotifyToMultiClients(list(ready), "_SubDelta", _diff_value(topic_id, topic['value'], value))
+            # 被订阅的函数可能返回同一个容器并原地修改，需保存副本才能与下次的结果比较
+            topic['value'] = _deepcopy(value)
+            topic['has_value'] = True
+            for player_id, group_id in topic['owners'].iteritems():
+                if player_id not in ready:
+                    ready.add(player_id)
+                    self._sub_stats['pushes'] += 1
+                    self.NotifyToClient(player_id, "_SubValue", {'s': group_id, 't': topic_id, 'v': topic['value']})
+
+    def get_subscription_stats(self):
+        stats = dict(self._sub_stats)
+        stats['topics'] = len(self._topics)
+        stats['subscribers'] = len(self._sub_owners)
+        return stats
+
     # Item Grid （已废弃） ===============================================================================================
 
     @_lib_sys_event("_RegisterItemGrid")
@@ -177,9 +560,10 @@ class NuoyanLibServerSystem(_NuoyanLibBaseSystem, _ServerSystem):
             for key, items in self._item_grid_items[player_id].items()
             if key in keys
         }
-        update_inv = filter(_is_inv_key, keys)
+        # keys可能为元组，filter会返回元组
+        update_inv = [key for key in keys if _is_inv_key(key)]
         self.NotifyToClient(player_id, "_UpdateItemGrids", {'data': data, 'update_inv': update_inv})
-        _log("Updated item grids: %s" % (data.keys() + update_inv), NuoyanLibServerSystem)
+        _log_debug("Updated item grids: %s", NuoyanLibServerSystem, data.keys() + update_inv)
         return True
 
     @_lib_sys_event("_ThrowItem")
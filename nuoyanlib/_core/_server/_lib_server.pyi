@@ -12,39 +12,102 @@
 #   Author        : 诺言Nuoyan
 #   Email         : 1279735247@qq.com
 #   Gitee         : https://gitee.com/charming-lee
-#   Last Modified : 2025-01-29
+#   Last Modified : 2026-10-18
 #
 # ====================================================
 
 
-from typing import List, Dict, Optional, Union, overload
+from typing import List, Dict, Set, Optional, Union, Any, Tuple, Iterator, overload
 from mod.server.system.serverSystem import ServerSystem
 from .._typing import ItemDict, ItemCellPos, EventArgs
 from ._listener import event, lib_sys_event
-from .._sys import NuoyanLibBaseSystem
+from .._sys import NuoyanLibBaseSystem, STREAM_CHUNK_EVENT_NAME, STREAM_CANCEL_EVENT_NAME
 
 
 _DATA_KEY_ITEMS_DATA: str
 _INV_POS_TYPE: int
+_QUERY_CACHE_RADIUS: float
+_QUERY_CACHE_CHUNK_SIZE: int
+
+
+def _diff_value(topic_id: int, old: Any, new: Any) -> Dict[str, Any]: ...
 
 
 class NuoyanLibServerSystem(NuoyanLibBaseSystem, ServerSystem):
     _item_grid_items: Dict[str, Dict[str, List[ItemDict]]]
     _query_cache: Dict[str, Dict[str, float]]
+    _query_cache_replay: Dict[str, List[str]]
+    _codec_players: Set[str]
+    _topics: Dict[int, Dict[str, Any]]
+    _topic_keys: Dict[Tuple[str, str, str, str, Optional[str]], int]
+    _topic_ids: Iterator[int]
+    _sub_owners: Dict[Tuple[str, int], int]
+    _sub_stats: Dict[str, int]
+    _sub_min_interval: float
+    _sub_max_per_player: int
+    _sub_counts: Dict[str, int]
+    _batch_relay: ServerSystem
     def __init__(self: ..., namespace: str, system_name: str) -> None: ...
+    def Update(self: ...) -> None: ...
     def Destroy(self: ...): ...
+    def _on_rpc_registered(self: ..., table: List[List[Union[str, int]]]) -> None: ...
+    @lib_sys_event("_RpcTable")
+    def _on_rpc_table(self: ..., args: EventArgs) -> None: ...
+    def _get_codec_key_ids(self: ..., targets: List[str]) -> Dict[str, str]: ...
     @lib_sys_event("_NuoyanLibCall")
     def _be_called(self: ..., args: EventArgs) -> None: ...
     @lib_sys_event("_NuoyanLibCallReturn")
     def _call_return(self: ..., args: EventArgs) -> None: ...
+    def _reply_call(self: ..., player_id: str, uuid: int, cb_args: Dict[str, Any]) -> None: ...
+    def _reject_call(self: ..., args: Dict[str, Any]) -> None: ...
+    def _run_call(self: ..., args: Dict[str, Any]) -> None: ...
+    @lib_sys_event("_NuoyanLibCallCancel")
+    def _on_call_cancel(self: ..., args: EventArgs) -> None: ...
+    @lib_sys_event("_Subscribe")
+    def _on_subscribe(self: ..., args: EventArgs) -> None: ...
+    @lib_sys_event("_Unsubscribe")
+    def _on_unsubscribe(self: ..., args: EventArgs) -> None: ...
+    def _remove_subscriber(self: ..., topic_id: int, player_id: str) -> None: ...
+    def _drop_subscriber(self: ..., player_id: str) -> None: ...
+    def refresh_topics(self: ..., namespace: str, system_name: str, method: str = "") -> int: ...
+    def _update_topics(self: ...) -> None: ...
+    def get_subscription_stats(self: ...) -> Dict[str, int]: ...
     @lib_sys_event("_BroadcastToAllClient")
     def _on_broadcast_to_all_client(self: ..., args: EventArgs) -> None: ...
     @lib_sys_event("_NotifyToMultiClients")
     def _notify_to_multi_clients(self: ..., args: EventArgs) -> None: ...
     @event("UiInitFinished")
     def _on_ui_init_finished(self: ..., args: EventArgs) -> None: ...
+    def _send_msg(self: ..., target: str, event_name: str, event_data: Any) -> None: ...
+    def _dispatch_msg(self: ..., event_name: str, event_data: Any) -> None: ...
+    def NotifyToClient(self: ..., targetId: str, eventName: str, eventData: Any, immediate: bool = False) -> None: ...
+    def NotifyToMultiClients(
+        self: ...,
+        targetIdList: List[str],
+        eventName: str,
+        eventData: Any,
+        immediate: bool = False,
+    ) -> None: ...
+    def BroadcastToAllClient(self: ..., eventName: str, eventData: Any, immediate: bool = False) -> None: ...
+    @lib_sys_event("_NuoyanLibBatch")
+    def _on_batch(self: ..., args: EventArgs) -> None: ...
+    @lib_sys_event(STREAM_CHUNK_EVENT_NAME)
+    def _on_chunk(self: ..., args: EventArgs) -> None: ...
+    @lib_sys_event(STREAM_CANCEL_EVENT_NAME)
+    def _on_chunk_cancel(self: ..., args: EventArgs) -> None: ...
+    def _on_stream_progress(self: ..., event_name: str, tag: Any, done: int, total: int, sender: str) -> None: ...
+    @event("EntityRemoveEvent")
+    def _on_entity_remove(self: ..., args: EventArgs) -> None: ...
+    @event("PlayerIntendLeaveServerEvent")
+    def _on_player_intend_leave(self: ..., args: EventArgs) -> None: ...
+    @event("OnScriptTickServer")
+    def _on_script_tick(self: ...) -> None: ...
     @lib_sys_event("_SetQueryVar")
     def on_set_query_var(self: ..., args: EventArgs) -> None: ...
+    def _start_query_cache_replay(self: ..., player_id: str) -> None: ...
+    def _replay_query_cache(self: ...) -> None: ...
+    @lib_sys_event("_RequestQueryCache")
+    def _on_request_query_cache(self: ..., args: EventArgs) -> None: ...
     @lib_sys_event("_ThrowItem")
     def _on_throw_item(self: ..., args: EventArgs) -> None: ...
     def _set_grid(self, player_id: str, args: tuple) -> None: ...
@@ -12,7 +12,7 @@
 #   Author        : 诺言Nuoyan
 #   Email         : 1279735247@qq.com
 #   Gitee         : https://gitee.com/charming-lee
-#   Last Modified : 2025-01-08
+#   Last Modified : 2026-10-18
 #
 # ====================================================
 
@@ -28,6 +28,10 @@ from .._sys import (
 from ...utils.utils import (
     is_method_overridden as _is_method_overridden
 )
+from .._utils import (
+    add_listen_args as _add_listen_args,
+    get_cls_listen_args as _get_cls_listen_args,
+)
 from .._logging import log as _log
 
 
@@ -36,6 +40,8 @@ __all__ = [
     "listen_custom",
     "listen_engine_and_lib",
     "lib_sys_event",
+    "listen_keyed",
+    "unlisten_keyed",
 ]
 
 
@@ -208,17 +214,38 @@ _ALL_SERVER_LIB_EVENTS = {
 }
 
 
-_lsn_func_args = []
-
-
 _SERVER_ENGINE_NAMESPACE = _server_api.GetEngineNamespace()
 _SERVER_ENGINE_SYSTEM_NAME = _server_api.GetEngineSystemName()
 
 
-def event(event_name="", namespace="", system_name="", priority=0):
+def _resolve_source(event_name, namespace, system_name):
+    if not namespace and not system_name and event_name in _ALL_SERVER_ENGINE_EVENTS:
+        return _SERVER_ENGINE_NAMESPACE, _SERVER_ENGINE_SYSTEM_NAME
+    return namespace, system_name
+
+
+def event(event_name="", namespace="", system_name="", priority=0, key="", value=None):
     """
     | 函数装饰器，通过对函数进行装饰即可实现事件监听。用于服务端。
     | 监听引擎事件（ ``event_name`` 为引擎事件名）时，可省略 ``namespace`` 和 ``system_name`` 参数。
+    | 传入 ``key`` 后，同一事件的所有同键监听共用一个引擎监听，事件触发时只调用 ``value`` 与事件参数中该键的取值相同的函数，无需在每个函数中自行过滤。
+
+    -----
+
+    【示例】
+
+    ::
+
+        class MySystem(NuoyanServerSystem):
+            # 只在方块名为minecraft:stone或minecraft:dirt时调用
+            @event("DestroyBlockEvent", key="fullName", value=["minecraft:stone", "minecraft:dirt"])
+            def on_destroy_stone(self, args):
+                pass
+
+            # 嵌套的键使用"."分隔
+            @event("ServerItemUseOnEvent", key="itemDict.newItemName", value="minecraft:diamond_sword")
+            def on_use_sword(self, args):
+                pass
 
     -----
 
@@ -226,17 +253,16 @@ def event(event_name="", namespace="", system_name="", priority=0):
     :param str namespace: 命名空间，默认为当前服务端的命名空间
     :param str system_name: 系统名称，默认为config.py中配置的与当前服务端绑定的客户端的系统名称
     :param int priority: 优先级，默认为0
+    :param str key: 路由键，即事件参数中用于分发的键名，嵌套的键使用"."分隔；默认为空字符串，表示不使用路由
+    :param str|int|list|tuple|None value: 路由键的取值，可传入多个取值的列表；为None或"*"时作为通配，仅在事件的取值没有对应的监听函数时调用；默认为None
     """
     def add_listener(func):
         if event_name and isinstance(event_name, str):
             _event_name = event_name
         else:
             _event_name = func.__name__
-        _namespace, _system_name = namespace, system_name
-        if not _namespace and not _system_name and _event_name in _ALL_SERVER_ENGINE_EVENTS:
-            _namespace = _SERVER_ENGINE_NAMESPACE
-            _system_name = _SERVER_ENGINE_SYSTEM_NAME
-        _lsn_func_args.append((_namespace, _system_name, _event_name, func, priority))
+        _namespace, _system_name = _resolve_source(_event_name, namespace, system_name)
+        _add_listen_args(func, _namespace, _system_name, _event_name, priority, key, value)
         return func
     if isinstance(event_name, str):
         return add_listener
@@ -252,21 +278,70 @@ def listen_custom(self):
     from ._lib_server import get_lib_system
     lib_sys = get_lib_system()
     listened = []
-    for namespace, system_name, event_name, func, priority in _lsn_func_args:
-        method = getattr(self, func.__name__, None)
-        if method and method.__func__ is func:
-            if not namespace:
-                namespace = self.namespace
-            if not system_name:
-                system_name = _get_opposite_system(self.systemName)
+    for namespace, system_name, event_name, func_name, priority, key, value in _get_cls_listen_args(self.__class__):
+        method = getattr(self, func_name)
+        if not namespace:
+            namespace = self.namespace
+        if not system_name:
+            system_name = _get_opposite_system(self.systemName)
+        if key:
+            lib_sys.listen_keyed(namespace, system_name, event_name, key, value, method, priority)
+        else:
             lib_sys.ListenForEvent(namespace, system_name, event_name, self, method, priority)
-            listened.append(event_name)
+        listened.append(event_name)
     if listened:
         _log("Listen custom events finished: %s" % listened, self.__class__)
     else:
         _log("No custom event to listen", self.__class__)
 
 
+def listen_keyed(event_name, key, value, func, namespace="", system_name="", priority=0):
+    """
+    | 动态添加按键路由的事件监听，效果与使用 ``event`` 装饰器并传入 ``key`` 参数相同，适用于取值在运行时才能确定的情况（如玩家ID、实体ID）。用于服务端。
+    | 监听引擎事件时，可省略 ``namespace`` 和 ``system_name`` 参数，监听自定义事件时必须传入。
+    | 不再需要时请调用 ``unlisten_keyed`` 移除，否则函数会一直被持有。
+
+    -----
+
+    :param str event_name: 事件名称
+    :param str key: 路由键，即事件参数中用于分发的键名，嵌套的键使用"."分隔
+    :param str|int|list|tuple|None value: 路由键的取值，可传入多个取值的列表；为None或"*"时作为通配，仅在事件的取值没有对应的监听函数时调用
+    :param function func: 监听函数
+    :param str namespace: 命名空间，默认为空字符串
+    :param str system_name: 系统名称，默认为空字符串
+    :param int priority: 优先级，默认为0
+
+    :return: 无
+    :rtype: None
+    """
+    from ._lib_server import get_lib_system
+    namespace, system_name = _resolve_source(event_name, namespace, system_name)
+    get_lib_system().listen_keyed(namespace, system_name, event_name, key, value, func, priority)
+
+
+def unlisten_keyed(event_name, key, value, func, namespace="", system_name="", priority=0):
+    """
+    | 移除通过 ``listen_keyed`` 添加的事件监听，参数须与添加时相同。用于服务端。
+    | 同一事件同一路由键的全部监听均被移除后，会同时移除对应的引擎监听。
+
+    -----
+
+    :param str event_name: 事件名称
+    :param str key: 路由键
+    :param str|int|list|tuple|None value: 路由键的取值
+    :param function func: 监听函数
+    :param str namespace: 命名空间，默认为空字符串
+    :param str system_name: 系统名称，默认为空字符串
+    :param int priority: 优先级，默认为0
+
+    :return: 是否成功移除
+    :rtype: bool
+    """
+    from ._lib_server import get_lib_system
+    namespace, system_name = _resolve_source(event_name, namespace, system_name)
+    return get_lib_system().unlisten_keyed(namespace, system_name, event_name, key, value, func, priority)
+
+
 def listen_engine_and_lib(self):
     from ...server.server_system import NuoyanServerSystem
     cls = self.__class__
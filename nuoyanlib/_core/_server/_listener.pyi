@@ -12,7 +12,7 @@
 #   Author        : 诺言Nuoyan
 #   Email         : 1279735247@qq.com
 #   Gitee         : https://gitee.com/charming-lee
-#   Last Modified : 2024-07-06
+#   Last Modified : 2026-10-18
 #
 # ====================================================
 
@@ -23,7 +23,6 @@ from ...server.server_system import NuoyanServerSystem
 
 _ALL_SERVER_ENGINE_EVENTS: Tuple[str, ...]
 _ALL_SERVER_LIB_EVENTS: Dict[str, str]
-_lsn_func_args: List[Tuple[str, str, str, Callable, int]]
 _SERVER_ENGINE_NAMESPACE: str
 _SERVER_ENGINE_SYSTEM_NAME: str
 
@@ -33,7 +32,28 @@ def event(
     namespace: str = "",
     system_name: str = "",
     priority: int = 0,
+    key: str = "",
+    value: Union[str, int, List[Union[str, int]], Tuple[Union[str, int], ...], None] = None,
 ) -> Callable: ...
+def _resolve_source(event_name: str, namespace: str, system_name: str) -> Tuple[str, str]: ...
+def listen_keyed(
+    event_name: str,
+    key: str,
+    value: Union[str, int, List[Union[str, int]], Tuple[Union[str, int], ...], None],
+    func: Callable[[dict], Any],
+    namespace: str = "",
+    system_name: str = "",
+    priority: int = 0,
+) -> None: ...
+def unlisten_keyed(
+    event_name: str,
+    key: str,
+    value: Union[str, int, List[Union[str, int]], Tuple[Union[str, int], ...], None],
+    func: Callable[[dict], Any],
+    namespace: str = "",
+    system_name: str = "",
+    priority: int = 0,
+) -> bool: ...
 def listen_custom(self: Any) -> None: ...
 def listen_engine_and_lib(self: NuoyanServerSystem) -> None: ...
 def lib_sys_event(name: str) -> Callable: ...
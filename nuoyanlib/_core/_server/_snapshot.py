@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+# ====================================================
+#
+#   Copyright (c) 2023 Nuoyan
+#   nuoyanlib is licensed under Mulan PSL v2.
+#   You can use this software according to the terms and conditions of the Mulan PSL v2.
+#   You may obtain a copy of Mulan PSL v2 at:
+#            http://license.coscl.org.cn/MulanPSL2
+#   THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY OR FIT FOR A PARTICULAR PURPOSE.
+#   See the Mulan PSL v2 for more details.
+#
+#   Author        : 诺言Nuoyan
+#   Email         : 1279735247@qq.com
+#   Gitee         : https://gitee.com/charming-lee
+#   Last Modified : 2026-10-18
+#
+# ====================================================
+
+
+from mod.common.minecraftEnum import (
+    AttrType as _AttrType,
+)
+from ._comp import (
+    EntityComp as _EntityComp,
+)
+
+
+__all__ = [
+    "enable_tick_snapshot",
+    "is_tick_snapshot_enabled",
+    "get_tick_snapshot_stats",
+    "clear_tick_snapshot",
+    "invalidate_entity_snapshot",
+    "get_foot_pos",
+    "get_rot",
+    "get_dim",
+    "get_health",
+    "get_engine_type",
+    "get_engine_type_str",
+]
+
+
+_MISSING = object()
+_enabled = False
+_foot_pos = {}
+_rot = {}
+_dim = {}
+_health = {}
+_engine_type = {}
+_engine_type_str = {}
+_all_snapshots = (_foot_pos, _rot, _dim, _health, _engine_type, _engine_type_str)
+_stats = {
+    'reads': 0,
+    'engine_reads': 0,
+}
+
+
+def enable_tick_snapshot(enable=True):
+    """
+    | 开启或关闭实体状态快照，默认关闭。
+    | 开启后，同一tick内nuoyanlib.server各接口对同一实体的坐标、角度、维度、生命值、类型的读取只会调用一次引擎接口，下一tick（OnScriptTickServer）开始时自动失效。
+    | 快照只减少引擎接口的调用次数，查表本身也有开销，并不保证更快；仅在同一tick内有多个接口反复读取同一批实体，且引擎接口调用开销较大时才可能有收益，请在实际环境中测量后再决定是否开启。
+    | nuoyanlib自身修改生命值（如 ``hurt`` ）时会自动使快照失效；其余代码在同一tick内通过引擎接口修改实体的坐标（ ``SetFootPos`` 、 ``SetPos`` ）、角度（ ``SetRot`` ）、维度（ ``ChangePlayerDimension`` 等）或生命值（ ``SetAttrValue`` ）后，nuoyanlib在本tick内读到的仍是旧值，需手动调用 ``invalidate_entity_snapshot`` 。
+
+    -----
+
+    :param bool enable: 是否开启，默认为True
+
+    :return: 无
+    :rtype: None
+    """
+    global _enabled
+    _enabled = bool(enable)
+    clear_tick_snapshot()
+
+
+def is_tick_snapshot_enabled():
+    """
+    | 实体状态快照是否已开启。
+
+    -----
+
+    :return: 是否已开启
+    :rtype: bool
+    """
+    return _enabled
+
+
+def get_tick_snapshot_stats():
+    """
+    | 获取实体状态快照的统计数据（关闭期间的读取不计入）。
+
+    -----
+
+    :return: 统计字典，包含reads（读取次数）、engine_reads（实际调用引擎接口的次数）、saved（节省的引擎接口调用次数）
+    :rtype: dict[str,int]
+    """
+    stats = dict(_stats)
+    stats['saved'] = stats['reads'] - stats['engine_reads']
+    return stats
+
+
+def clear_tick_snapshot():
+    """
+    | 清空实体状态快照。
+
+    -----
+
+    :return: 无
+    :rtype: None
+    """
+    for snapshot in _all_snapshots:
+        if snapshot:
+            snapshot.clear()
+
+
+def invalidate_entity_snapshot(entity_id):
+    """
+    | 使指定实体的状态快照失效，下次读取时将重新调用引擎接口。
+
+    -----
+
+    :param str entity_id: 实体ID
+
+    :return: 无
+    :rtype: None
+    """
+    for snapshot in _all_snapshots:
+        snapshot.pop(entity_id, None)
+
+
+def _read(snapshot, entity_id, reader):
+    _stats['reads'] += 1
+    value = snapshot.get(entity_id, _MISSING)
+    if value is _MISSING:
+        _stats['engine_reads'] += 1
+        value = snapshot[entity_id] = reader(entity_id)
+    return value
+
+
+def _read_foot_pos(entity_id):
+    return _EntityComp(entity_id).Pos.GetFootPos()
+
+
+def _read_rot(entity_id):
+    return _EntityComp(entity_id).Rot.GetRot()
+
+
+def _read_dim(entity_id):
+    return _EntityComp(entity_id).Dimension.GetEntityDimensionId()
+
+
+def _read_health(entity_id):
+    return _EntityComp(entity_id).Attr.GetAttrValue(_AttrType.HEALTH)
+
+
+def _read_engine_type(entity_id):
+    return _EntityComp(entity_id).EngineType.GetEngineType()
+
+
+def _read_engine_type_str(entity_id):
+    return _EntityComp(entity_id).EngineType.GetEngineTypeStr()
+
+
+def get_foot_pos(entity_id):
+    if not _enabled:
+        return _read_foot_pos(entity_id)
+    return _read(_foot_pos, entity_id, _read_foot_pos)
+
+
+def get_rot(entity_id):
+    if not _enabled:
+        return _read_rot(entity_id)
+    return _read(_rot, entity_id, _read_rot)
+
+
+def get_dim(entity_id):
+    if not _enabled:
+        return _read_dim(entity_id)
+    return _read(_dim, entity_id, _read_dim)
+
+
+def get_health(entity_id):
+    if not _enabled:
+        return _read_health(entity_id)
+    return _read(_health, entity_id, _read_health)
+
+
+def get_engine_type(entity_id):
+    if not _enabled:
+        return _read_engine_type(entity_id)
+    return _read(_engine_type, entity_id, _read_engine_type)
+
+
+def get_engine_type_str(entity_id):
+    if not _enabled:
+        return _read_engine_type_str(entity_id)
+    return _read(_engine_type_str, entity_id, _read_engine_type_str)
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
+
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+# ====================================================
+#
+#   Copyright (c) 2023 Nuoyan
+#   nuoyanlib is licensed under Mulan PSL v2.
+#   You can use this software according to the terms and conditions of the Mulan PSL v2.
+#   You may obtain a copy of Mulan PSL v2 at:
+#            http://license.coscl.org.cn/MulanPSL2
+#   THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY OR FIT FOR A PARTICULAR PURPOSE.
+#   See the Mulan PSL v2 for more details.
+#
+#   Author        : 诺言Nuoyan
+#   Email         : 1279735247@qq.com
+#   Gitee         : https://gitee.com/charming-lee
+#   Last Modified : 2026-10-18
+#
+# ====================================================
+
+
+from typing import Dict, Tuple, Callable, Any, Optional
+
+
+_MISSING: object
+_enabled: bool
+_foot_pos: Dict[str, Optional[Tuple[float, float, float]]]
+_rot: Dict[str, Optional[Tuple[float, float]]]
+_dim: Dict[str, int]
+_health: Dict[str, float]
+_engine_type: Dict[str, int]
+_engine_type_str: Dict[str, str]
+_all_snapshots: Tuple[Dict[str, Any], ...]
+_stats: Dict[str, int]
+
+
+def enable_tick_snapshot(enable: bool = True) -> None: ...
+def is_tick_snapshot_enabled() -> bool: ...
+def get_tick_snapshot_stats() -> Dict[str, int]: ...
+def clear_tick_snapshot() -> None: ...
+def invalidate_entity_snapshot(entity_id: str) -> None: ...
+def _read(snapshot: Dict[str, Any], entity_id: str, reader: Callable[[str], Any]) -> Any: ...
+def _read_foot_pos(entity_id: str) -> Optional[Tuple[float, float, float]]: ...
+def _read_rot(entity_id: str) -> Optional[Tuple[float, float]]: ...
+def _read_dim(entity_id: str) -> int: ...
+def _read_health(entity_id: str) -> float: ...
+def _read_engine_type(entity_id: str) -> int: ...
+def _read_engine_type_str(entity_id: str) -> str: ...
+def get_foot_pos(entity_id: str) -> Optional[Tuple[float, float, float]]: ...
+def get_rot(entity_id: str) -> Optional[Tuple[float, float]]: ...
+def get_dim(entity_id: str) -> int: ...
+def get_health(entity_id: str) -> float: ...
+def get_engine_type(entity_id: str) -> int: ...
+def get_engine_type_str(entity_id: str) -> str: ...
@@ -12,11 +12,34 @@
 #   Author        : 诺言Nuoyan
 #   Email         : 1279735247@qq.com
 #   Gitee         : https://gitee.com/charming-lee
-#   Last Modified : 2025-01-07
+#   Last Modified : 2026-10-18
 #
 # ====================================================
 
 
+from traceback import format_exc as _format_exc
+from itertools import count as _count
+from time import time as _time
+from json import (
+    dumps as _json_dumps,
+    loads as _json_loads,
+)
+from ._utils import get_cls_rpc_methods as _get_cls_rpc_methods
+from ._call_stats import CallStats as _CallStats
+from ._codec import (
+    build_codec_tables as _build_codec_tables,
+    pack_call as _pack_call,
+    unpack_call as _unpack_call,
+    pack_return as _pack_return,
+    unpack_return as _unpack_return,
+)
+from ._logging import (
+    flush_log as _flush_log,
+    set_log_buffered as _set_log_buffered,
+    error as _log_error,
+)
+
+
 __all__ = [
     "is_apollo",
     "get_opposite_system",
@@ -52,13 +75,16 @@ if is_apollo():
     #         if name2 == sys_name:
     #             return name1
 else:
+    _opposite_systems = None
     def get_opposite_system(sys_name):
-        from nuoyanlib.config import SYSTEM_BINDINGS
-        for sys1, sys2 in SYSTEM_BINDINGS:
-            if sys1 == sys_name:
-                return sys2
-            if sys2 == sys_name:
-                return sys1
+        global _opposite_systems
+        if _opposite_systems is None:
+            from nuoyanlib.config import SYSTEM_BINDINGS
+            _opposite_systems = {}
+            for sys1, sys2 in SYSTEM_BINDINGS:
+                _opposite_systems.setdefault(sys1, sys2)
+                _opposite_systems.setdefault(sys2, sys1)
+        return _opposite_systems.get(sys_name)
 
 
 def is_client():
@@ -85,37 +111,562 @@ def get_comp_factory():
 LEVEL_ID = get_api().GetLevelId()
 
 
+BATCH_EVENT_NAME = "_NuoyanLibBatch"
+_MAX_BATCH_SIZE = 64
+
+
+KEY_WILDCARD = "*"
+
+
+STREAM_CHUNK_EVENT_NAME = "_NuoyanLibChunk"
+STREAM_CANCEL_EVENT_NAME = "_NuoyanLibChunkCancel"
+
+
+def load_config(name, default):
+    try:
+        from .. import config
+    except (ImportError, ValueError):
+        return default
+    return getattr(config, name, default)
+
+
+class _KeyedRouter(object):
+    # 同一事件、同一路由键的全部处理器共用一个引擎监听，按事件参数中键的取值分发
+    __slots__ = ("path", "handlers", "wildcard")
+
+    def __init__(self, key):
+        self.path = tuple(key.split("."))
+        self.handlers = {}
+        self.wildcard = ()
+
+    def __len__(self):
+        return len(self.handlers) + (1 if self.wildcard else 0)
+
+    def add(self, value, func):
+        for v in _iter_key_values(value):
+            if v == KEY_WILDCARD:
+                if func not in self.wildcard:
+                    self.wildcard += (func,)
+                continue
+            funcs = self.handlers.get(v, ())
+            if func not in funcs:
+                self.handlers[v] = funcs + (func,)
+
+    def remove(self, value, func):
+        removed = False
+        for v in _iter_key_values(value):
+            if v == KEY_WILDCARD:
+                funcs = self.wildcard
+            else:
+                funcs = self.handlers.get(v, ())
+            if func not in funcs:
+                continue
+            removed = True
+            funcs = tuple(f for f in funcs if f != func)
+            if v == KEY_WILDCARD:
+                self.wildcard = funcs
+            elif funcs:
+                self.handlers[v] = funcs
+            else:
+                del self.handlers[v]
+        return removed
+
+    def remove_owner(self, owner):
+        def keep(funcs):
+            return tuple(f for f in funcs if getattr(f, '__self__', None) is not owner)
+        for v, funcs in self.handlers.items():
+            funcs = keep(funcs)
+            if funcs:
+                self.handlers[v] = funcs
+            else:
+                del self.handlers[v]
+        self.wildcard = keep(self.wildcard)
+
+    def dispatch(self, args):
+        value = args
+        for k in self.path:
+            if not isinstance(value, dict):
+                value = None
+                break
+            value = value.get(k)
+        try:
+            funcs = self.handlers.get(value)
+        except TypeError:
+            # 键的取值不可哈希（如列表），只能交给通配处理器
+            funcs = None
+        if not funcs:
+            funcs = self.wildcard
+        # 处理器元组在增删时整体替换，回调中增删处理器不影响本次分发
+        for func in funcs:
+            try:
+                func(args)
+            except Exception:
+                _log_error("Keyed handler %s failed:\n%s", NuoyanLibBaseSystem, func, _format_exc())
+
+
+def _iter_key_values(value):
+    if value is None:
+        return (KEY_WILDCARD,)
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return value
+    return (value,)
+
+
+# 分片传输经json编码，json无法表示的类型用单键字典标记，保证与不分片时收到的数据类型一致
+_TAG_TUPLE = "\x00t"
+_TAG_DICT = "\x00d"
+_TAG_UNICODE = "\x00u"
+_STREAM_TAGS = (_TAG_TUPLE, _TAG_DICT, _TAG_UNICODE)
+
+
+def _pack_stream_value(obj):
+    if isinstance(obj, str):
+        return obj
+    if isinstance(obj, list):
+        return [_pack_stream_value(i) for i in obj]
+    if isinstance(obj, tuple):
+        return {_TAG_TUPLE: [_pack_stream_value(i) for i in obj]}
+    if isinstance(obj, unicode):
+        return {_TAG_UNICODE: obj}
+    if isinstance(obj, dict):
+        # 键不全为str（如int、tuple）或与标记冲突时，按键值对列表编码
+        if all(type(k) is str and k not in _STREAM_TAGS for k in obj):
+            return {k: _pack_stream_value(v) for k, v in obj.iteritems()}
+        return {_TAG_DICT: [[_pack_stream_value(k), _pack_stream_value(v)] for k, v in obj.iteritems()]}
+    return obj
+
+
+def _unpack_stream_value(obj):
+    # json解码得到的字符串为unicode，未标记的转回与引擎事件数据一致的str
+    if isinstance(obj, unicode):
+        return obj.encode("utf-8")
+    if isinstance(obj, list):
+        return [_unpack_stream_value(i) for i in obj]
+    if isinstance(obj, dict):
+        if len(obj) == 1:
+            tag, value = next(obj.iteritems())
+            if tag == _TAG_TUPLE:
+                return tuple([_unpack_stream_value(i) for i in value])
+            if tag == _TAG_DICT:
+                return {_unpack_stream_value(k): _unpack_stream_value(v) for k, v in value}
+            if tag == _TAG_UNICODE:
+                return value
+        return {k.encode("utf-8"): _unpack_stream_value(v) for k, v in obj.iteritems()}
+    return obj
+
+
+def _estimate_size(obj, limit):
+    # 粗略估计json编码后的长度（偏大），超过limit即返回，避免为每个小数据都完整编码一次
+    size = 0
+    stack = [obj]
+    pop = stack.pop
+    push = stack.append
+    while stack:
+        obj = pop()
+        t = type(obj)
+        if t is dict:
+            size += 2
+            for k, v in obj.iteritems():
+                tk = type(k)
+                size += len(k) * 2 + 4 if tk is str or tk is unicode else 24
+                tv = type(v)
+                if tv is str or tv is unicode:
+                    size += len(v) * 2 + 2
+                elif tv is dict or tv is list or tv is tuple:
+                    push(v)
+                else:
+                    size += 24
+        elif t is list or t is tuple:
+            size += 2
+            for v in obj:
+                tv = type(v)
+                if tv is str or tv is unicode:
+                    size += len(v) * 2 + 3
+                elif tv is dict or tv is list or tv is tuple:
+                    push(v)
+                else:
+                    size += 25
+        elif t is str or t is unicode:
+            size += len(obj) * 2 + 2
+        else:
+            size += 24
+        if size > limit:
+            break
+    return size
+
+
+def copy_msg_data(obj):
+    # 只复制容器，其余值不可变或由引擎按值序列化，比copy.deepcopy快得多
+    if isinstance(obj, dict):
+        return {k: copy_msg_data(v) for k, v in obj.iteritems()}
+    if isinstance(obj, list):
+        return [copy_msg_data(v) for v in obj]
+    if isinstance(obj, tuple):
+        return tuple([copy_msg_data(v) for v in obj])
+    return obj
+
+
 class NuoyanLibBaseSystem(object):
     def __init__(self, namespace, system_name):
         super(NuoyanLibBaseSystem, self).__init__(namespace, system_name)
+        # 由Update每tick刷新日志，销毁时由子类关闭
+        _set_log_buffered(True)
         self._cond_func = {}
         self._cond_state = {}
+        self._cond_buckets = {}
+        self._cond_next_id = 0
         self.__tick = 0
+        self._batch_msgs = load_config("BATCH_LIB_MESSAGES", True)
+        self._outbox = {}
+        self._routers = {}
+        self._rpc_endpoints = []
+        self._rpc_ids = {}
+        self._remote_rpc_ids = {}
+        self._rpc_whitelist = load_config("RPC_WHITELIST", False)
+        self._compact_codec = load_config("COMPACT_CALL_CODEC", False)
+        self._codec_key_ids = {}
+        self._codec_tokens = {}
+        self._chunk_size = load_config("CALL_CHUNK_SIZE", 8192)
+        self._stream_budget = load_config("CALL_STREAM_BUDGET", 32768)
+        self._stream_ids = _count(1)
+        self._streams_out = []
+        self._streams_in = {}
+        max_payload = load_config("CALL_MAX_PAYLOAD", 4194304)
+        self._max_stream_chunks = -(-max_payload // self._chunk_size) if self._chunk_size > 0 else 0
+        self._max_streams = load_config("CALL_MAX_STREAMS", 8)
+        self._stream_timeout = load_config("CALL_STREAM_TIMEOUT", 30.0)
+        self.call_stats = _CallStats(load_config("CALL_STATS", False))
+        self._timer_budget = load_config("TIMER_TICK_BUDGET", 64)
+        self._timer_time_budget = load_config("TIMER_TICK_TIME_BUDGET", 0.005)
 
     def Update(self):
         self.__tick += 1
-        for cond_id, (cond, func, freq) in self._cond_func.items():
-            if self.__tick % freq:
+        _flush_log()
+        if self._streams_out:
+            self._pump_streams()
+        if self._streams_in and self.__tick % 20 == 0:
+            self._expire_streams(_time())
+        self.flush_msgs()
+        due = self._cond_buckets.pop(self.__tick, None)
+        if not due:
+            return
+        for cond_id in due:
+            if cond_id not in self._cond_func:
+                # 已被移除的条件，惰性删除
                 continue
+            cond, func, freq = self._cond_func[cond_id]
+            self._cond_buckets.setdefault(self.__tick + freq, []).append(cond_id)
             curr_state = cond()
-            old_state = self._cond_state[cond_id]
-            if curr_state != old_state:
-                func(curr_state)
+            if curr_state != self._cond_state[cond_id]:
                 self._cond_state[cond_id] = curr_state
+                func(curr_state)
 
-    def add_condition_to_func(self, cond, func, freq):
-        cond_id = max(self._cond_func.iterkeys()) + 1 if self._cond_func else 0
+    def add_condition_to_func(self, cond, func, freq, offset=-1):
+        cond_id = self._cond_next_id
+        self._cond_next_id += 1
+        if offset < 0:
+            # 自动错峰，避免同频率的条件集中在同一tick判断
+            offset = cond_id % freq
         self._cond_func[cond_id] = (cond, func, freq)
         self._cond_state[cond_id] = False
+        self._cond_buckets.setdefault(self.__tick + 1 + offset % freq, []).append(cond_id)
         return cond_id
 
     def remove_condition_to_func(self, cond_id):
         if cond_id in self._cond_func:
+            # 对应的桶在到期时会跳过该ID
             del self._cond_func[cond_id]
             del self._cond_state[cond_id]
             return True
         return False
 
+    # Message Batching =================================================================================================
+
+    # _send_msg与_dispatch_msg由客户端与服务端的库系统分别实现
+
+    def post_msg(self, target, event_name, event_data, immediate=False, copy=True):
+        if immediate or not self._batch_msgs:
+            # 先发出排队中的消息，保证同一目标收到消息的顺序与发送顺序一致
+            self.flush_msgs(target)
+            self._send_msg(target, event_name, event_data)
+            return
+        if copy:
+            # 消息在tick结束时才由引擎序列化，排队时复制一份，之后对原数据的修改不会影响已发送的消息
+            event_data = copy_msg_data(event_data)
+        msgs = self._outbox.get(target)
+        if msgs is None:
+            msgs = self._outbox[target] = []
+        msgs.append((event_name, event_data))
+
+    def flush_msgs(self, target=None):
+        if not self._outbox:
+            return
+        if target is None:
+            outbox, self._outbox = self._outbox, {}
+            items = outbox.items()
+        else:
+            msgs = self._outbox.pop(target, None)
+            if not msgs:
+                return
+            items = ((target, msgs),)
+        for target, msgs in items:
+            if len(msgs) == 1:
+                self._send_msg(target, *msgs[0])
+                continue
+            for i in xrange(0, len(msgs), _MAX_BATCH_SIZE):
+                self._send_msg(target, BATCH_EVENT_NAME, {'msgs': msgs[i:i + _MAX_BATCH_SIZE]})
+
+    def dispatch_batch(self, args):
+        sender = args.get('__id__')
+        for event_name, event_data in args['msgs']:
+            if sender is not None and isinstance(event_data, dict):
+                event_data['__id__'] = sender
+            self._dispatch_msg(event_name, event_data)
+
+    # Keyed Event Routing ==============================================================================================
+
+    def listen_keyed(self, namespace, system_name, event_name, key, value, func, priority=0):
+        route = (namespace, system_name, event_name, key, priority)
+        router = self._routers.get(route)
+        if router is None:
+            router = self._routers[route] = _KeyedRouter(key)
+            self.ListenForEvent(namespace, system_name, event_name, router, router.dispatch, priority)
+        router.add(value, func)
+
+    def unlisten_keyed(self, namespace, system_name, event_name, key, value, func, priority=0):
+        route = (namespace, system_name, event_name, key, priority)
+        router = self._routers.get(route)
+        if router is None:
+            return False
+        removed = router.remove(value, func)
+        if not router:
+            self._drop_router(route)
+        return removed
+
+    def unlisten_keyed_owner(self, owner):
+        for route, router in self._routers.items():
+            router.remove_owner(owner)
+            if not router:
+                self._drop_router(route)
+
+    def _drop_router(self, route):
+        router = self._routers.pop(route)
+        namespace, system_name, event_name, _, priority = route
+        self.UnListenForEvent(namespace, system_name, event_name, router, router.dispatch, priority)
+
+    # RPC ==============================================================================================================
+
+    def _on_rpc_registered(self, table):
+        pass
+
+    def register_rpc(self, system):
+        table = []
+        for rpc_name, func_name in _get_cls_rpc_methods(system.__class__):
+            key = (system.namespace, system.systemName, rpc_name)
+            endpoint_id = self._rpc_ids.get(key)
+            if endpoint_id is None:
+                # 编号只增不减，系统重建后沿用原编号，对端已缓存的编号始终有效
+                endpoint_id = self._rpc_ids[key] = len(self._rpc_endpoints)
+                self._rpc_endpoints.append(None)
+            self._rpc_endpoints[endpoint_id] = getattr(system, func_name)
+            table.append(list(key) + [endpoint_id])
+        if table:
+            self._on_rpc_registered(table)
+        return len(table)
+
+    def unregister_rpc(self, system):
+        for i, func in enumerate(self._rpc_endpoints):
+            if func is not None and getattr(func, '__self__', None) is system:
+                self._rpc_endpoints[i] = None
+
+    def get_rpc_endpoint(self, endpoint_id):
+        if 0 <= endpoint_id < len(self._rpc_endpoints):
+            return self._rpc_endpoints[endpoint_id]
+        return None
+
+    def get_rpc_table(self):
+        return [list(key) + [endpoint_id] for key, endpoint_id in self._rpc_ids.items()]
+
+    def resolve_rpc(self, namespace, system_name, method):
+        # 调用名可能是rpc装饰器指定的别名，与实际的方法名不同，需先解析为已注册的函数再检查与执行
+        # 返回(是否允许调用, 已注册的函数)，未注册时函数为None，由调用方按方法名查找
+        endpoint_id = self._rpc_ids.get((namespace, system_name, method))
+        if endpoint_id is not None:
+            return True, self._rpc_endpoints[endpoint_id]
+        return not self._rpc_whitelist, None
+
+    def get_rpc_id(self, namespace, system_name, method):
+        return self._rpc_ids.get((namespace, system_name, method))
+
+    def is_rpc_allowed(self, namespace, system_name, method):
+        return not self._rpc_whitelist or (namespace, system_name, method) in self._rpc_ids
+
+    def update_remote_rpc_ids(self, target, table):
+        ids = self._remote_rpc_ids.get(target)
+        if ids is None:
+            ids = self._remote_rpc_ids[target] = {}
+        for namespace, system_name, method, endpoint_id in table:
+            ids[(namespace, system_name, method)] = endpoint_id
+
+    def get_remote_rpc_id(self, namespace, system_name, method, targets):
+        # 发往多个客户端时，只有各客户端的编号一致才能使用编号
+        key = (namespace, system_name, method)
+        endpoint_id = None
+        for target in targets:
+            ids = self._remote_rpc_ids.get(target)
+            if ids is None:
+                return None
+            i = ids.get(key)
+            if i is None or (endpoint_id is not None and i != endpoint_id):
+                return None
+            endpoint_id = i
+        return endpoint_id
+
+    # Call Codec =======================================================================================================
+
+    def set_codec_keys(self, keys):
+        self._codec_key_ids, self._codec_tokens = _build_codec_tables(keys)
+
+    def _get_codec_key_ids(self, targets):
+        return self._codec_key_ids
+
+    def encode_call(self, targets, notify_args):
+        if not self._compact_codec:
+            return notify_args
+        return _pack_call(notify_args, self._get_codec_key_ids(targets))
+
+    def decode_call(self, data):
+        if 'c' not in data:
+            return data
+        return _unpack_call(data, self._codec_tokens)
+
+    def encode_return(self, targets, uuid, cb_args):
+        if not self._compact_codec:
+            return {'uuid': uuid, 'cb_args': cb_args}
+        return _pack_return(uuid, cb_args, self._get_codec_key_ids(targets))
+
+    def decode_return(self, data):
+        if 'r' not in data:
+            return data['uuid'], data['cb_args']
+        return _unpack_return(data, self._codec_tokens)
+
+    # Streaming ========================================================================================================
+
+    def stream_msg(self, targets, event_name, event_data, tag=None, on_progress=None):
+        if self._chunk_size <= 0 or _estimate_size(event_data, self._chunk_size) <= self._chunk_size:
+            return False
+        try:
+            text = _json_dumps(_pack_stream_value(event_data), separators=(",", ":"))
+        except (TypeError, ValueError):
+            return False
+        if len(text) <= self._chunk_size:
+            return False
+        total = (len(text) + self._chunk_size - 1) // self._chunk_size
+        for target in targets:
+            self._streams_out.append([next(self._stream_ids), target, event_name, text, 0, total, tag, on_progress])
+        return True
+
+    def _pump_streams(self):
+        # 按先后顺序发送分片，每tick发送的数据量不超过预算，但至少发送一个分片，保证传输总能推进
+        budget = self._stream_budget
+        size = self._chunk_size
+        while self._streams_out:
+            stream = self._streams_out[0]
+            stream_id, target, event_name, text, seq, total, tag, on_progress = stream
+            piece = text[seq * size:(seq + 1) * size]
+            data = {'s': stream_id, 'e': event_name, 'i': seq, 'n': total, 'd': piece}
+            if tag is not None:
+                data['t'] = tag
+            self.post_msg(target, STREAM_CHUNK_EVENT_NAME, data)
+            seq += 1
+            stream[4] = seq
+            if seq >= total:
+                self._streams_out.pop(0)
+            if on_progress:
+                on_progress(target, seq, total)
+            budget -= len(piece)
+            if budget <= 0:
+                break
+
+    def cancel_streams(self, target, event_name, tag):
+        kept = []
+        count = 0
+        for stream in self._streams_out:
+            if stream[1] == target and stream[2] == event_name and stream[6] == tag:
+                if stream[4] > 0:
+                    # 接收方已收到部分分片，通知其丢弃
+                    self.post_msg(target, STREAM_CANCEL_EVENT_NAME, {'s': stream[0]})
+                count += 1
+            else:
+                kept.append(stream)
+        self._streams_out = kept
+        return count
+
+    def drop_streams(self, target):
+        self._streams_out = [s for s in self._streams_out if s[1] != target]
+        for key in self._streams_in.keys():
+            if key[0] == target:
+                del self._streams_in[key]
+
+    def _on_stream_progress(self, event_name, tag, done, total, sender):
+        pass
+
+    def _expire_streams(self, now):
+        # 丢弃长时间未收到新分片的重组缓冲
+        deadline = now - self._stream_timeout
+        for key, buf in self._streams_in.items():
+            if buf[2] < deadline:
+                del self._streams_in[key]
+                _log_error("Stream %s from '%s' timed out", NuoyanLibBaseSystem, key[1], key[0])
+
+    def receive_chunk(self, args):
+        sender = args.get('__id__', "")
+        key = (sender, args['s'])
+        n = args.get('n')
+        i = args.get('i')
+        # 分片的字段来自对端，需校验后才能用于分配与下标
+        if (
+                not isinstance(n, (int, long)) or not isinstance(i, (int, long))
+                or n < 1 or (self._max_stream_chunks and n > self._max_stream_chunks) or not 0 <= i < n
+        ):
+            _log_error("Rejected invalid chunk (%s/%s) from '%s'", NuoyanLibBaseSystem, i, n, sender)
+            self._streams_in.pop(key, None)
+            return
+        now = _time()
+        buf = self._streams_in.get(key)
+        if buf is None:
+            self._expire_streams(now)
+            if self._max_streams and sum(1 for k in self._streams_in if k[0] == sender) >= self._max_streams:
+                _log_error("Too many open streams from '%s'", NuoyanLibBaseSystem, sender)
+                return
+            buf = self._streams_in[key] = [[None] * n, 0, now]
+        elif len(buf[0]) != n:
+            _log_error("Rejected chunk of stream %s from '%s': size mismatch", NuoyanLibBaseSystem, key[1], sender)
+            del self._streams_in[key]
+            return
+        buf[2] = now
+        chunks = buf[0]
+        if chunks[i] is None:
+            chunks[i] = args['d']
+            buf[1] += 1
+        event_name = args['e']
+        if 't' in args:
+            self._on_stream_progress(event_name, args['t'], buf[1], len(chunks), sender)
+        if buf[1] < len(chunks):
+            return
+        del self._streams_in[key]
+        try:
+            event_data = _unpack_stream_value(_json_loads("".join(chunks)))
+        except (ValueError, TypeError, AttributeError):
+            _log_error("Failed to decode stream '%s' from '%s'", NuoyanLibBaseSystem, event_name, sender)
+            return
+        if sender and isinstance(event_data, dict):
+            event_data['__id__'] = sender
+        self._dispatch_msg(event_name, event_data)
+
+    def cancel_chunks(self, args):
+        self._streams_in.pop((args.get('__id__', ""), args['s']), None)
+
 
 
 
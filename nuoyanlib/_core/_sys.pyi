@@ -12,12 +12,13 @@
 #   Author        : 诺言Nuoyan
 #   Email         : 1279735247@qq.com
 #   Gitee         : https://gitee.com/charming-lee
-#   Last Modified : 2025-01-08
+#   Last Modified : 2026-10-18
 #
 # ====================================================
 
 
-from typing import Union, Dict, Tuple, Callable, Any, Optional
+from typing import Union, Dict, Tuple, Callable, Any, Optional, List, Iterator
+from ._call_stats import CallStats
 import mod.client.extraClientApi as client_api
 import mod.server.extraServerApi as server_api
 from mod.client.component.engineCompFactoryClient import EngineCompFactoryClient
@@ -25,6 +26,7 @@ from mod.server.component.engineCompFactoryServer import EngineCompFactoryServer
 
 
 mod_config: Dict[str, Any]
+_opposite_systems: Optional[Dict[str, str]]
 
 
 def is_apollo() -> bool: ...
@@ -35,12 +37,69 @@ def get_comp_factory() -> Union[EngineCompFactoryClient, EngineCompFactoryServer
 
 
 LEVEL_ID: str
+BATCH_EVENT_NAME: str
+_MAX_BATCH_SIZE: int
+KEY_WILDCARD: str
+STREAM_CHUNK_EVENT_NAME: str
+STREAM_CANCEL_EVENT_NAME: str
+_KeyValue = Union[str, int, None, List[Union[str, int]], Tuple[Union[str, int], ...]]
+
+
+def load_config(name: str, default: Any) -> Any: ...
+
+
+class _KeyedRouter(object):
+    path: Tuple[str, ...]
+    handlers: Dict[Any, Tuple[Callable[[dict], Any], ...]]
+    wildcard: Tuple[Callable[[dict], Any], ...]
+    def __init__(self, key: str) -> None: ...
+    def __len__(self) -> int: ...
+    def add(self, value: _KeyValue, func: Callable[[dict], Any]) -> None: ...
+    def remove(self, value: _KeyValue, func: Callable[[dict], Any]) -> bool: ...
+    def remove_owner(self, owner: Any) -> None: ...
+    def dispatch(self, args: dict) -> None: ...
+
+
+def _iter_key_values(value: _KeyValue) -> Tuple[Any, ...]: ...
+_TAG_TUPLE: str
+_TAG_DICT: str
+_TAG_UNICODE: str
+_STREAM_TAGS: Tuple[str, str, str]
+def _pack_stream_value(obj: Any) -> Any: ...
+def _unpack_stream_value(obj: Any) -> Any: ...
+def _estimate_size(obj: Any, limit: int) -> int: ...
+
+
+def copy_msg_data(obj: Any) -> Any: ...
 
 
 class NuoyanLibBaseSystem(object):
     _cond_func: Dict[int, Tuple[Callable[[], bool], Callable[[bool], Any], int]]
     _cond_state: Dict[int, bool]
+    _cond_buckets: Dict[int, List[int]]
+    _cond_next_id: int
     __tick: int
+    _batch_msgs: bool
+    _outbox: Dict[str, List[Tuple[str, Any]]]
+    _routers: Dict[Tuple[str, str, str, str, int], _KeyedRouter]
+    _rpc_endpoints: List[Optional[Callable]]
+    _rpc_ids: Dict[Tuple[str, str, str], int]
+    _remote_rpc_ids: Dict[str, Dict[Tuple[str, str, str], int]]
+    _rpc_whitelist: bool
+    _compact_codec: bool
+    _codec_key_ids: Dict[str, str]
+    _codec_tokens: Dict[str, str]
+    _chunk_size: int
+    _stream_budget: int
+    _stream_ids: Iterator[int]
+    _streams_out: List[list]
+    _streams_in: Dict[Tuple[str, int], list]
+    _max_stream_chunks: int
+    _max_streams: int
+    _stream_timeout: float
+    call_stats: CallStats
+    _timer_budget: int
+    _timer_time_budget: float
     def __init__(self: ..., namespace: str, system_name: str) -> None: ...
     def Update(self: ...): ...
     def add_condition_to_func(
@@ -48,5 +107,75 @@ class NuoyanLibBaseSystem(object):
         cond: Callable[[], bool],
         func: Callable[[bool], Any],
         freq: int,
+        offset: int = -1,
     ) -> int: ...
     def remove_condition_to_func(self, cond_id: int) -> bool: ...
+    def post_msg(
+        self: ...,
+        target: str,
+        event_name: str,
+        event_data: Any,
+        immediate: bool = False,
+        copy: bool = True,
+    ) -> None: ...
+    def flush_msgs(self: ..., target: Optional[str] = None) -> None: ...
+    def dispatch_batch(self: ..., args: Dict[str, Any]) -> None: ...
+    def listen_keyed(
+        self: ...,
+        namespace: str,
+        system_name: str,
+        event_name: str,
+        key: str,
+        value: _KeyValue,
+        func: Callable[[dict], Any],
+        priority: int = 0,
+    ) -> None: ...
+    def unlisten_keyed(
+        self: ...,
+        namespace: str,
+        system_name: str,
+        event_name: str,
+        key: str,
+        value: _KeyValue,
+        func: Callable[[dict], Any],
+        priority: int = 0,
+    ) -> bool: ...
+    def unlisten_keyed_owner(self: ..., owner: Any) -> None: ...
+    def _drop_router(self: ..., route: Tuple[str, str, str, str, int]) -> None: ...
+    def _on_rpc_registered(self: ..., table: List[List[Union[str, int]]]) -> None: ...
+    def register_rpc(self: ..., system: Any) -> int: ...
+    def unregister_rpc(self: ..., system: Any) -> None: ...
+    def get_rpc_endpoint(self: ..., endpoint_id: int) -> Optional[Callable]: ...
+    def get_rpc_table(self: ...) -> List[List[Union[str, int]]]: ...
+    def resolve_rpc(self: ..., namespace: str, system_name: str, method: str) -> Tuple[bool, Optional[Callable]]: ...
+    def get_rpc_id(self: ..., namespace: str, system_name: str, method: str) -> Optional[int]: ...
+    def is_rpc_allowed(self: ..., namespace: str, system_name: str, method: str) -> bool: ...
+    def update_remote_rpc_ids(self: ..., target: str, table: List[List[Union[str, int]]]) -> None: ...
+    def get_remote_rpc_id(
+        self: ...,
+        namespace: str,
+        system_name: str,
+        method: str,
+        targets: List[str],
+    ) -> Optional[int]: ...
+    def set_codec_keys(self: ..., keys: Union[List[str], Tuple[str, ...]]) -> None: ...
+    def _get_codec_key_ids(self: ..., targets: List[str]) -> Dict[str, str]: ...
+    def encode_call(self: ..., targets: List[str], notify_args: Dict[str, Any]) -> Dict[str, Any]: ...
+    def decode_call(self: ..., data: Dict[str, Any]) -> Dict[str, Any]: ...
+    def encode_return(self: ..., targets: List[str], uuid: int, cb_args: Dict[str, Any]) -> Dict[str, Any]: ...
+    def decode_return(self: ..., data: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]: ...
+    def stream_msg(
+        self: ...,
+        targets: Union[List[str], Tuple[str, ...]],
+        event_name: str,
+        event_data: Any,
+        tag: Any = None,
+        on_progress: Optional[Callable[[str, int, int], Any]] = None,
+    ) -> bool: ...
+    def _pump_streams(self: ...) -> None: ...
+    def cancel_streams(self: ..., target: str, event_name: str, tag: Any) -> int: ...
+    def drop_streams(self: ..., target: str) -> None: ...
+    def _on_stream_progress(self: ..., event_name: str, tag: Any, done: int, total: int, sender: str) -> None: ...
+    def _expire_streams(self: ..., now: float) -> None: ...
+    def receive_chunk(self: ..., args: Dict[str, Any]) -> None: ...
+    def cancel_chunks(self: ..., args: Dict[str, Any]) -> None: ...
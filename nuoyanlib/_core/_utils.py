@@ -12,11 +12,13 @@
 #   Author        : 诺言Nuoyan
 #   Email         : 1279735247@qq.com
 #   Gitee         : https://gitee.com/charming-lee
-#   Last Modified : 2024-07-05
+#   Last Modified : 2026-10-18
 #
 # ====================================================
 
 
+from types import FunctionType as _FunctionType
+from itertools import count as _count
 from ._const import (
     SHORTCUT as _SHORTCUT,
     INV27 as _INV27,
@@ -30,9 +32,22 @@ __all__ = [
     "is_shortcut_key",
     "is_inv_key",
     "is_not_inv_key",
+    "add_listen_args",
+    "get_cls_listen_args",
+    "set_rpc_name",
+    "get_rpc_name",
+    "get_cls_rpc_methods",
 ]
 
 
+_LSN_ARGS_ATTR = "_nyl_listen_args"
+_cls_lsn_args = {}
+# 监听按装饰器执行的顺序注册（即源码中的定义顺序，父类先于子类），与旧版全局列表的顺序一致
+_lsn_seq = _count()
+_RPC_NAME_ATTR = "_nyl_rpc_name"
+_cls_rpc_methods = {}
+
+
 def is_inv36_key(k):
     return k.endswith(_INV36)
 
@@ -53,6 +68,65 @@ def is_not_inv_key(k):
     return not is_inv_key(k)
 
 
+def add_listen_args(func, namespace, system_name, event_name, priority, key="", value=None):
+    lsn_args = getattr(func, _LSN_ARGS_ATTR, None)
+    if lsn_args is None:
+        lsn_args = []
+        setattr(func, _LSN_ARGS_ATTR, lsn_args)
+    lsn_args.append((next(_lsn_seq), namespace, system_name, event_name, priority, key, value))
+
+
+def get_cls_listen_args(cls):
+    # 首次实例化时按MRO解析一次并缓存，只保留最终生效（未被子类覆盖）的被装饰方法
+    if cls in _cls_lsn_args:
+        return _cls_lsn_args[cls]
+    found = []
+    visited = set()
+    for c in cls.__mro__:
+        for name, attr in c.__dict__.items():
+            if name in visited:
+                continue
+            visited.add(name)
+            if not isinstance(attr, _FunctionType):
+                continue
+            for seq, namespace, system_name, event_name, priority, key, value in getattr(attr, _LSN_ARGS_ATTR, ()):
+                found.append((seq, (namespace, system_name, event_name, name, priority, key, value)))
+    # 类的__dict__在Python2中无序，按装饰顺序排序，保证监听的注册顺序稳定
+    found.sort(key=lambda i: i[0])
+    res = [i[1] for i in found]
+    _cls_lsn_args[cls] = res
+    return res
+
+
+def set_rpc_name(func, name):
+    setattr(func, _RPC_NAME_ATTR, name)
+
+
+def get_rpc_name(func):
+    return getattr(func, _RPC_NAME_ATTR, None) or func.__name__
+
+
+def get_cls_rpc_methods(cls):
+    if cls in _cls_rpc_methods:
+        return _cls_rpc_methods[cls]
+    res = []
+    visited = set()
+    for c in cls.__mro__:
+        for name, attr in c.__dict__.items():
+            if name in visited:
+                continue
+            visited.add(name)
+            if not isinstance(attr, _FunctionType):
+                continue
+            rpc_name = getattr(attr, _RPC_NAME_ATTR, None)
+            if rpc_name:
+                res.append((rpc_name, name))
+    _cls_rpc_methods[cls] = res
+    return res
+
+
+
+
 
 
 
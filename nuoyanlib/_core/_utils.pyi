@@ -12,13 +12,36 @@
 #   Author        : 诺言Nuoyan
 #   Email         : 1279735247@qq.com
 #   Gitee         : https://gitee.com/charming-lee
-#   Last Modified : 2024-07-05
+#   Last Modified : 2026-10-18
 #
 # ====================================================
 
 
+from typing import Callable, Dict, List, Tuple, Any, Iterator
+
+
+_LSN_ARGS_ATTR: str
+_cls_lsn_args: Dict[type, List[Tuple[str, str, str, str, int, str, Any]]]
+_lsn_seq: Iterator[int]
+_RPC_NAME_ATTR: str
+_cls_rpc_methods: Dict[type, List[Tuple[str, str]]]
+
+
 def is_inv36_key(k: str) -> bool: ...
 def is_inv27_key(k: str) -> bool: ...
 def is_shortcut_key(k: str) -> bool: ...
 def is_inv_key(k: str) -> bool: ...
 def is_not_inv_key(k: str) -> bool: ...
+def add_listen_args(
+    func: Callable,
+    namespace: str,
+    system_name: str,
+    event_name: str,
+    priority: int,
+    key: str = "",
+    value: Any = None,
+) -> None: ...
+def get_cls_listen_args(cls: type) -> List[Tuple[str, str, str, str, int, str, Any]]: ...
+def set_rpc_name(func: Callable, name: str) -> None: ...
+def get_rpc_name(func: Callable) -> str: ...
+def get_cls_rpc_methods(cls: type) -> List[Tuple[str, str]]: ...
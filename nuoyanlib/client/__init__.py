@@ -12,7 +12,7 @@
 #   Author        : 诺言Nuoyan
 #   Email         : 1279735247@qq.com
 #   Gitee         : https://gitee.com/charming-lee
-#   Last Modified : 2025-01-29
+#   Last Modified : 2026-10-18
 #
 # ====================================================
 
@@ -44,19 +44,53 @@ from .._core._client._comp import (
     LEVEL_ID,
     PlrComp,
     LvComp,
+    EntityComp,
+    set_entity_comp_cache_size,
+    get_entity_comp_stats,
 )
 from .._core._client._listener import (
     event,
+    listen_keyed,
+    unlisten_keyed,
 )
 
 
-from .client_system import *
-from .effect import *
-from .player import *
-from .setting import *
-from .sound import *
-from .render import *
-from .camera import *
+from .._core._lazy import lazy_module as _lazy_module
 
 
-from ..utils import *
+# 子模块在首次访问其中的名称时才会导入，新增或修改子模块的__all__时需同步修改此处，打包时scripts/pack/check_exports.py会检查两者是否一致
+_lazy_module(__name__, (
+    (".client_system", (
+        "NuoyanClientSystem",
+    )),
+    (".effect", (
+        "NeteaseParticle",
+        "NeteaseFrameAnim",
+    )),
+    (".player", (
+        "player_plunge",
+    )),
+    (".setting", (
+        "save_setting",
+        "read_setting",
+        "check_setting",
+    )),
+    (".sound", (
+        "play_custom_sound",
+        "stop_custom_sound",
+    )),
+    (".render", (
+        "set_query_mod_var",
+        "add_player_render_resources",
+        "add_entity_render_resources",
+    )),
+    (".camera", (
+        "get_entities_within_view",
+    )),
+    (".subscribe", (
+        "subscribe",
+        "unsubscribe",
+    )),
+), (
+    "..utils",
+))
@@ -12,7 +12,7 @@
 #   Author        : 诺言Nuoyan
 #   Email         : 1279735247@qq.com
 #   Gitee         : https://gitee.com/charming-lee
-#   Last Modified : 2025-01-29
+#   Last Modified : 2026-10-18
 #
 # ====================================================
 
@@ -21,7 +21,7 @@ from math import pi as _pi
 import mod.client.extraClientApi as _client_api
 from mod.common.minecraftEnum import RayFilterType as _RayFilterType
 from .._core._client._comp import (
-    CompFactory as _CompFactory,
+    EntityComp as _EntityComp,
     PLAYER_ID as _PLAYER_ID,
     LvComp as _LvComp,
 )
@@ -69,7 +69,7 @@ def get_entities_within_view(world_dist=50, screen_dist=100, angle_dist=_pi / 5,
     for eid in all_ents:
         if eid == _PLAYER_ID:
             continue
-        ent_pos = _CompFactory.CreatePos(eid).GetFootPos()
+        ent_pos = _EntityComp(eid).Pos.GetFootPos()
         target_dir = _vec_p2p(center, ent_pos)
         angle = _vec_angle(camera_dir, target_dir)
         w_dist = _pos_distance(center, ent_pos)
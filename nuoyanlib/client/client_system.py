@@ -12,7 +12,7 @@
 #   Author        : 诺言Nuoyan
 #   Email         : 1279735247@qq.com
 #   Gitee         : https://gitee.com/charming-lee
-#   Last Modified : 2025-01-26
+#   Last Modified : 2026-10-18
 #
 # ====================================================
 
@@ -57,6 +57,7 @@ class NuoyanClientSystem(_ClientSystem):
         self.__system_name = system_name
         _listen_engine_and_lib(self)
         _listen_custom(self)
+        self.__lib_sys.register_rpc(self)
         self._set_print_log()
         _log("Inited: %s" % self.__class__.__module__, NuoyanClientSystem)
 
@@ -79,6 +80,8 @@ class NuoyanClientSystem(_ClientSystem):
         """
         super(NuoyanClientSystem, self).Destroy()
         self.UnListenAllEvents()
+        self.__lib_sys.unlisten_keyed_owner(self)
+        self.__lib_sys.unregister_rpc(self)
 
     # Engine Event Callbacks ===========================================================================================
 
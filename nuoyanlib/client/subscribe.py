@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+# ====================================================
+#
+#   Copyright (c) 2023 Nuoyan
+#   nuoyanlib is licensed under Mulan PSL v2.
+#   You can use this software according to the terms and conditions of the Mulan PSL v2.
+#   You may obtain a copy of Mulan PSL v2 at:
+#            http://license.coscl.org.cn/MulanPSL2
+#   THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY OR FIT FOR A PARTICULAR PURPOSE.
+#   See the Mulan PSL v2 for more details.
+#
+#   Author        : 诺言Nuoyan
+#   Email         : 1279735247@qq.com
+#   Gitee         : https://gitee.com/charming-lee
+#   Last Modified : 2026-10-18
+#
+# ====================================================
+
+
+from .._core._client._lib_client import (
+    get_lib_system as _get_lib_system,
+)
+
+
+__all__ = [
+    "subscribe",
+    "unsubscribe",
+]
+
+
+def subscribe(namespace, system_name, method, callback, args=None, kwargs=None, interval=1.0):
+    """
+    | 订阅服务端系统函数的返回值，用于代替定时调用 ``call`` 轮询服务端数据（如商店库存、Boss血量等）。
+    | 服务端对所有玩家相同的订阅（相同的系统、函数与参数）每隔 ``interval`` 秒只执行一次被订阅的函数，与上次的结果比较，仅在结果变化时推送给订阅的玩家；结果为字典时只推送变化的键。
+    | 订阅后，首次获得结果时以及之后每次结果变化时，会以最新的结果调用 ``callback`` ；本端已有相同的订阅时，会立即以已有的结果调用一次。
+    | 被订阅的函数返回值的类型仅支持python基本数据类型；回调中请勿修改传入的结果。开启RPC_WHITELIST后，只能订阅使用rpc装饰器注册的函数。
+    | 每个玩家的订阅数不能超过config.py中的SUBSCRIBE_MAX_PER_PLAYER，超出的订阅会被服务端拒绝；被订阅函数的执行与跨端调用共用服务端的准入限制（CALL_RATE_LIMIT等）。
+
+    -----
+
+    【示例】
+
+    ::
+
+        class ShopUI(ScreenNode):
+            def Create(self):
+                self.sub = subscribe("MyMod", "ShopServerSystem", "get_stock", self.on_stock, args=("weapon",))
+
+            def Destroy(self):
+                unsubscribe(self.sub)
+
+            def on_stock(self, stock):
+                # stock为get_stock("weapon")的最新返回值
+                self.refresh_goods(stock)
+
+    -----
+
+    :param str namespace: 被订阅函数所在服务端系统的命名空间
+    :param str system_name: 被订阅函数所在服务端系统的名称
+    :param str method: 被订阅函数名
+    :param function callback: 回调函数，接受一个参数，即被订阅函数的返回值
+    :param tuple|None args: 位置参数元组，展开后传入被订阅函数中，默认为None
+    :param dict[str,Any]|None kwargs: 关键字参数字典，展开后传入被订阅函数中，默认为None
+    :param float interval: 服务端执行被订阅函数的间隔，单位为秒，多个玩家订阅同一函数时取最小值，且不小于config.py中的SUBSCRIBE_MIN_INTERVAL；默认为1.0
+
+    :return: 订阅ID，用于取消订阅；获取客户端nuoyanlib系统失败时返回-1
+    :rtype: int
+    """
+    lib_sys = _get_lib_system()
+    if not lib_sys:
+        return -1
+    return lib_sys.subscribe(namespace, system_name, method, callback, args, kwargs, interval)
+
+
+def unsubscribe(sub_id):
+    """
+    | 取消订阅。
+
+    -----
+
+    :param int sub_id: 订阅ID，即subscribe的返回值
+
+    :return: 是否成功
+    :rtype: bool
+    """
+    lib_sys = _get_lib_system()
+    if not lib_sys:
+        return False
+    return lib_sys.unsubscribe(sub_id)
+
+
+
+
+
+
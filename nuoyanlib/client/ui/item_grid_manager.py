@@ -12,7 +12,7 @@
 #   Author        : 诺言Nuoyan
 #   Email         : 1279735247@qq.com
 #   Gitee         : https://gitee.com/charming-lee
-#   Last Modified : 2024-07-06
+#   Last Modified : 2026-10-18
 #
 # ====================================================
 
@@ -114,7 +114,10 @@ from ...utils.item import (
 from .ui_utils import (
     get_direct_children_path as _get_direct_children_path,
 )
-from ..._core._logging import log as _log
+from ..._core._logging import (
+    log as _log,
+    debug as _log_debug,
+)
 
 
 __all__ = [
@@ -204,7 +207,7 @@ class ItemGridManager(object):
                 self._set_grid_ui_item(key, item_list)
         if update_inv:
             self._update_inv_grids(update_inv)
-        _log("Updated item grids: %s" % (data.keys() + update_inv), ItemGridManager)
+        _log_debug("Updated item grids: %s", ItemGridManager, data.keys() + update_inv)
 
     @_event("InventoryItemChangedClientEvent")
     def _on_inv_item_changed(self, args):
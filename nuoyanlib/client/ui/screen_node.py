@@ -12,7 +12,7 @@
 #   Author        : 诺言Nuoyan
 #   Email         : 1279735247@qq.com
 #   Gitee         : https://gitee.com/charming-lee
-#   Last Modified : 2024-07-06
+#   Last Modified : 2026-10-18
 #
 # ====================================================
 
@@ -43,7 +43,10 @@ from .ui_utils import (
 from .item_fly_anim import ItemFlyAnim as _ItemFlyAnim
 from .item_tips_box import ItemTipsBox as _ItemTipsBox
 from .item_grid_manager import ItemGridManager as _ItemGridManager
-from ..._core._logging import log as _log
+from ..._core._logging import (
+    log as _log,
+    debug as _log_debug,
+)
 
 
 __all__ = [
@@ -156,7 +159,7 @@ class NuoyanScreenNode(_ScreenNode):
                 ui = self.__screen_node.GetBaseUIControl(bp)
                 if ui:
                     ui.SetPosition(tuple(pos))
-        _log("Ui position data: %s" % data, self.__class__)
+        _log_debug("Ui position data: %s", self.__class__, data)
 
     def Update(self):
         """
@@ -219,6 +222,7 @@ class NuoyanScreenNode(_ScreenNode):
             _CLIENT_ENGINE_NAMESPACE, _CLIENT_ENGINE_SYSTEM_NAME, "ScreenSizeChangedClientEvent",
             self, self._on_screen_size_changed
         )
+        self.__lib_sys.unlisten_keyed_owner(self)
 
     @_event("ScreenSizeChangedClientEvent")
     def _on_screen_size_changed(self, args):
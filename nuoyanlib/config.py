@@ -12,7 +12,7 @@
 #   Author        : 诺言Nuoyan
 #   Email         : 1279735247@qq.com
 #   Gitee         : https://gitee.com/charming-lee
-#   Last Modified : 2025-01-29
+#   Last Modified : 2026-10-18
 #
 # ====================================================
 
@@ -24,3 +24,75 @@ SYSTEM_BINDINGS = [
     # (服务端2系统名称, 客户端2系统名称),
     # ...
 ]
+
+
+# 日志级别，可选值为"DEBUG"、"INFO"、"WARNING"、"ERROR"，低于该级别的日志不会输出
+LOG_LEVEL = "INFO"
+
+
+# 日志文件路径，设置后日志会同时追加写入该文件，仅建议在本地调试时使用；为空字符串时不写入文件
+LOG_FILE = ""
+
+
+# 日志限流：相同的日志（相同级别、类与格式字符串）在每LOG_RATE_WINDOW秒内最多输出LOG_RATE_LIMIT条，超出的日志会被丢弃并在窗口结束时汇总条数；为0时不限流
+LOG_RATE_LIMIT = 20
+LOG_RATE_WINDOW = 1.0
+
+
+# 是否合并nuoyanlib内部的跨端消息，开启后同一tick内发往同一目标的消息会合并为一个事件发送，可减少网络包数量，但消息最多会延迟一个tick送达
+BATCH_LIB_MESSAGES = True
+
+
+# 是否只允许跨端调用（call、call_batch等）调用使用rpc装饰器注册的函数，开启后其他函数的调用会直接返回失败
+RPC_WHITELIST = False
+
+
+# 是否对跨端调用（call、call_batch等）的消息进行紧凑编码，开启后消息改为按位置排列，并将物品信息字典等常见的键替换为短标记，可明显减少跨端调用的数据量
+COMPACT_CALL_CODEC = False
+
+
+# 跨端调用（call、call_batch等）的参数或返回值编码后超过该字节数时，拆分为多个该大小的分片在之后的几个tick内发送，到达对端后重组；为0时不分片
+CALL_CHUNK_SIZE = 8192
+
+
+# 每tick发送跨端调用分片的字节数上限，每tick至少发送一个分片
+CALL_STREAM_BUDGET = 32768
+
+
+# 接收跨端调用分片时的限制：重组后的最大字节数、每个发送方同时重组的消息数上限、超过该秒数未收到新分片的消息会被丢弃；超出限制的分片会被拒绝
+CALL_MAX_PAYLOAD = 4194304
+CALL_MAX_STREAMS = 8
+CALL_STREAM_TIMEOUT = 30.0
+
+
+# 服务端对每个玩家的调用（call、call_batch等）的限流：每秒可执行的调用数与可累积的上限，超出的调用排队到之后的tick执行
+# 默认不限流（CALL_RATE_LIMIT为0）；如需开启，可参考设置为CALL_RATE_LIMIT = 30.0、CALL_RATE_BURST = 60
+CALL_RATE_LIMIT = 0
+CALL_RATE_BURST = 60
+
+
+# 服务端每个玩家排队等待执行的调用数上限，超出后新的调用直接返回失败（error为"call queue full"）；为0时不限制
+CALL_QUEUE_SIZE = 128
+
+
+# 服务端每tick执行客户端调用的数量上限与耗时上限（秒），超出后剩余的调用排队到之后的tick执行；为0时不限制
+# 默认不限制；如需开启，可参考设置为CALL_TICK_BUDGET = 200、CALL_TICK_TIME_BUDGET = 0.01
+CALL_TICK_BUDGET = 0
+CALL_TICK_TIME_BUDGET = 0
+
+
+# 是否统计跨端调用的次数、成功率、延迟、执行耗时与数据量，可通过get_call_stats、dump_call_stats获取；也可在运行时通过enable_call_stats开启
+CALL_STATS = False
+
+
+# 客户端订阅（subscribe）时服务端执行被订阅函数的最小间隔（秒），客户端请求的更小的间隔会被提高到该值
+SUBSCRIBE_MIN_INTERVAL = 0.1
+
+
+# 每个玩家同时存在的订阅数上限，超出后新的订阅会被拒绝；为0时不限制
+SUBSCRIBE_MAX_PER_PLAYER = 32
+
+
+# 每tick执行游戏线程模式的McTimer定时器（见McTimer.RunInGameThread）的数量上限与耗时上限（秒），超出后剩余的留到之后的tick执行；为0时不限制
+TIMER_TICK_BUDGET = 64
+TIMER_TICK_TIME_BUDGET = 0.005
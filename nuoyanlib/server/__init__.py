@@ -12,7 +12,7 @@
 #   Author        : 诺言Nuoyan
 #   Email         : 1279735247@qq.com
 #   Gitee         : https://gitee.com/charming-lee
-#   Last Modified : 2025-01-29
+#   Last Modified : 2026-10-18
 #
 # ====================================================
 
@@ -36,14 +36,85 @@ del server_api, LIB_NAME, LIB_SERVER_NAME, LIB_SERVER_PATH
 
 
 from .._core._server._comp import *
+from .._core._server._snapshot import (
+    enable_tick_snapshot,
+    is_tick_snapshot_enabled,
+    get_tick_snapshot_stats,
+    clear_tick_snapshot,
+    invalidate_entity_snapshot,
+)
+from .._core._server._admission import (
+    get_call_admission_stats,
+    reset_call_admission_stats,
+)
 from .._core._server._listener import (
     event,
+    listen_keyed,
+    unlisten_keyed,
 )
 
 
-from .server_system import *
-from .entity import *
-from .hurt import *
-from .inv import *
-from .structure import *
-from ..utils import *
+from .._core._lazy import lazy_module as _lazy_module
+
+
+# 子模块在首次访问其中的名称时才会导入，新增或修改子模块的__all__时需同步修改此处，打包时scripts/pack/check_exports.py会检查两者是否一致
+_lazy_module(__name__, (
+    (".server_system", (
+        "NuoyanServerSystem",
+    )),
+    (".entity", (
+        "set_query_mod_var",
+        "clear_effects",
+        "bounce_entities",
+        "attract_entities",
+        "is_mob",
+        "all_mob",
+        "any_mob",
+        "entity_filter",
+        "is_entity_type",
+        "sort_entity_list_by_dist",
+        "launch_projectile",
+        "entity_plunge",
+        "entity_plunge_by_dir",
+        "entity_plunge_by_rot",
+        "get_all_entities",
+        "get_entities_by_name",
+        "get_entities_by_type",
+        "get_entities_in_area",
+        "get_entities_by_locking",
+        "get_nearest_entity",
+        "attack_nearest_mob",
+        "has_effect",
+        "get_entities_by_ray",
+        "entity_distance",
+    )),
+    (".hurt", (
+        "EntityFilter",
+        "explode_hurt",
+        "aoe_damage",
+        "sector_aoe_damage",
+        "rectangle_aoe_damage",
+        "hurt_by_set_health",
+        "hurt",
+        "percent_damage",
+        "line_damage",
+    )),
+    (".inv", (
+        "set_items_to_item_grid",
+        "get_items_from_item_grid",
+        "update_item_grids",
+        "deduct_inv_item",
+        "clear_items",
+        "get_item_pos",
+        "change_item_count",
+    )),
+    (".structure", (
+        "place_large_structure",
+    )),
+    (".subscribe", (
+        "refresh_subscriptions",
+        "get_subscription_stats",
+    )),
+), (
+    "..utils",
+))
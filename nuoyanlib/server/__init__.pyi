@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+# ====================================================
+#
+#   Copyright (c) 2023 Nuoyan
+#   nuoyanlib is licensed under Mulan PSL v2.
+#   You can use this software according to the terms and conditions of the Mulan PSL v2.
+#   You may obtain a copy of Mulan PSL v2 at:
+#            http://license.coscl.org.cn/MulanPSL2
+#   THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY OR FIT FOR A PARTICULAR PURPOSE.
+#   See the Mulan PSL v2 for more details.
+#
+#   Author        : 诺言Nuoyan
+#   Email         : 1279735247@qq.com
+#   Gitee         : https://gitee.com/charming-lee
+#   Last Modified : 2026-10-18
+#
+# ====================================================
+
+
+from .._core._server._comp import *
+from .._core._server._snapshot import (
+    enable_tick_snapshot,
+    is_tick_snapshot_enabled,
+    get_tick_snapshot_stats,
+    clear_tick_snapshot,
+    invalidate_entity_snapshot,
+)
+from .._core._server._admission import (
+    get_call_admission_stats,
+    reset_call_admission_stats,
+)
+from .._core._server._listener import (
+    event,
+    listen_keyed,
+    unlisten_keyed,
+)
+
+
+from .server_system import *
+from .entity import *
+from .hurt import *
+from .inv import *
+from .structure import *
+from .subscribe import *
+from ..utils import *
@@ -12,7 +12,7 @@
 #   Author        : 诺言Nuoyan
 #   Email         : 1279735247@qq.com
 #   Gitee         : https://gitee.com/charming-lee
-#   Last Modified : 2024-07-03
+#   Last Modified : 2026-10-18
 #
 # ====================================================
 
@@ -20,9 +20,16 @@
 import mod.server.extraServerApi as api
 from mod.common.minecraftEnum import EntityType as _EntityType
 from .._core._server._comp import (
-    CompFactory as _CompFactory,
+    EntityComp as _EntityComp,
     LvComp as _LvComp,
 )
+from .._core._server._snapshot import (
+    get_foot_pos as _get_foot_pos,
+    get_rot as _get_rot,
+    get_dim as _get_dim,
+    get_engine_type as _get_engine_type,
+    get_engine_type_str as _get_engine_type_str,
+)
 from .._core._server._lib_server import (
     get_lib_system as _get_lib_system,
 )
@@ -96,7 +103,7 @@ def clear_effects(entity_id):
     :return: 无
     :rtype: None
     """
-    comp = _CompFactory.CreateEffect(entity_id)
+    comp = _EntityComp(entity_id).Effect
     effects = comp.GetAllEffects()
     if effects:
         for eff in effects:
@@ -167,15 +174,15 @@ def attract_entities(
     )
     res = []
     for eid in ents:
-        epos = _CompFactory.CreatePos(eid).GetFootPos()
+        epos = _get_foot_pos(eid)
         if not epos:
             continue
-        comp = _CompFactory.CreateActorMotion(eid)
+        comp = _EntityComp(eid).ActorMotion
         orig_motion = comp.GetMotion()
         vec = _vec_p2p(epos, pos)
         vec = tuple(i * power for i in vec)
         res_motion = _vec_composite(orig_motion, vec)
-        etype = _CompFactory.CreateEngineType(eid).GetEngineType()
+        etype = _get_engine_type(eid)
         if etype == _EntityType.Player:
             if comp.SetPlayerMotion(res_motion):
                 res.append(eid)
@@ -196,7 +203,7 @@ def is_mob(entity_id):
     :return: 是生物返回True，否则返回False
     :rtype: bool
     """
-    type_str = _CompFactory.CreateEngineType(entity_id).GetEngineType()
+    type_str = _get_engine_type(entity_id)
     return type_str & _EntityType.Mob == _EntityType.Mob
 
 
@@ -286,12 +293,12 @@ def entity_filter(entity_list, *args):
     :rtype: list[str]
     """
     def _filter(eid):
-        ent_pos = _CompFactory.CreatePos(eid).GetFootPos()
-        ent_type = _CompFactory.CreateEngineType(eid).GetEngineType()
-        ent_type_str = _CompFactory.CreateEngineType(eid).GetEngineTypeStr()
-        ent_dim = str(_CompFactory.CreateDimension(eid).GetEntityDimensionId())
+        ent_pos = _get_foot_pos(eid)
         if not ent_pos:
             return False
+        ent_type = _get_engine_type(eid)
+        ent_type_str = _get_engine_type_str(eid)
+        ent_dim = str(_get_dim(eid))
         for arg in args:
             if not arg:
                 continue
@@ -334,9 +341,9 @@ def is_entity_type(entity_id, etype):
     :rtype: bool
     """
     if isinstance(etype, int):
-        return _CompFactory.CreateEngineType(entity_id).GetEngineType() & etype == etype
+        return _get_engine_type(entity_id) & etype == etype
     else:
-        return _CompFactory.CreateEngineType(entity_id).GetEngineTypeStr() == etype
+        return _get_engine_type_str(entity_id) == etype
 
 
 def sort_entity_list_by_dist(entity_list, pos):
@@ -355,7 +362,7 @@ def sort_entity_list_by_dist(entity_list, pos):
         return []
     not_exist = []
     def func(eid):
-        ep = _CompFactory.CreatePos(eid).GetFootPos()
+        ep = _get_foot_pos(eid)
         if not ep:
             not_exist.append(eid)
         return _pos_distance(ep, pos)
@@ -394,12 +401,12 @@ def launch_projectile(
     :rtype: str
     """
     if not position:
-        position = _CompFactory.CreatePos(spawner_id).GetFootPos()
+        position = _get_foot_pos(spawner_id)
         if not position:
             return "-1"
         position = (position[0], position[1] + 1.6, position[2])
     if not direction:
-        rot = _CompFactory.CreateRot(spawner_id).GetRot()
+        rot = _get_rot(spawner_id)
         if not rot:
             return "-1"
         direction = api.GetDirFromRot(rot)
@@ -432,7 +439,7 @@ def entity_plunge(entity_id1, entity_id2, speed):
     :return: 无
     :rtype: None
     """
-    rot = _CompFactory.CreateRot(entity_id2).GetRot()
+    rot = _get_rot(entity_id2)
     if not rot:
         return
     entity_plunge_by_rot(entity_id1, rot, speed)
@@ -452,8 +459,8 @@ def entity_plunge_by_dir(entity_id, direction, speed):
     :rtype: None
     """
     motion = tuple(map(lambda x: x * speed, direction))
-    comp = _CompFactory.CreateActorMotion(entity_id)
-    etype = _CompFactory.CreateEngineType(entity_id).GetEngineType()
+    comp = _EntityComp(entity_id).ActorMotion
+    etype = _get_engine_type(entity_id)
     if etype == _EntityType.Player:
         comp.SetPlayerMotion(motion)
     else:
@@ -566,7 +573,7 @@ def get_entities_by_name(name):
     """
     result = []
     for i in get_all_entities():
-        en = _CompFactory.CreateName(i).GetName()
+        en = _EntityComp(i).Name.GetName()
         if en == name:
             result.append(i)
     return result
@@ -586,7 +593,7 @@ def get_entities_by_locking(entity_id, dist=-1.0, filter_ids=None, filter_types=
     :return: 实体ID列表
     :rtype: list[str]
     """
-    pos = _CompFactory.CreatePos(entity_id).GetFootPos()
+    pos = _get_foot_pos(entity_id)
     if not pos:
         return []
     if filter_ids is None:
@@ -599,7 +606,7 @@ def get_entities_by_locking(entity_id, dist=-1.0, filter_ids=None, filter_types=
     ents = entity_filter(ents, r, _EntityType.Mob, filter_ids, filter_types)
     return [
         eid for eid in ents
-        if _CompFactory.CreateAction(eid).GetAttackTarget() == entity_id
+        if _EntityComp(eid).Action.GetAttackTarget() == entity_id
     ]
 
 
@@ -633,8 +640,8 @@ def get_nearest_entity(
     else:
         filter_ids = filter_ids[:]
     if isinstance(obj, str):
-        pos = _CompFactory.CreatePos(obj).GetFootPos()
-        dim = _CompFactory.CreateDimension(obj).GetEntityDimensionId()
+        pos = _get_foot_pos(obj)
+        dim = _get_dim(obj)
         filter_ids.append(obj)
     else:
         pos = obj
@@ -669,7 +676,7 @@ def attack_nearest_mob(entity_id, r=15.0, filter_ids=None, filter_types=None):
         entity_id, radius=r, filter_ids=filter_ids, filter_types=filter_types, filter_abiotic=True
     )
     if nearest:
-        _CompFactory.CreateAction(entity_id).SetAttackTarget(nearest)
+        _EntityComp(entity_id).Action.SetAttackTarget(nearest)
     return nearest
 
 
@@ -685,7 +692,7 @@ def has_effect(entity_id, effect_id):
     :return: 存在返回True，否则返回False
     :rtype: bool
     """
-    effects = _CompFactory.CreateEffect(entity_id).GetAllEffects()
+    effects = _EntityComp(entity_id).Effect.GetAllEffects()
     for eff in effects:
         if eff['effectName'] == effect_id:
             return True
@@ -737,13 +744,13 @@ def get_entities_by_ray(
     entities = entity_filter(
         entities, fa, filter_ids, filter_types, filter_type_str, {str(dimension)}
     )
-    entities.sort(key=lambda x: _pos_distance(_CompFactory.CreatePos(x).GetFootPos(), start_pos))
+    entities.sort(key=lambda x: _pos_distance(_get_foot_pos(x), start_pos))
     ent_list = []
     for entity_id in entities:
-        size = _CompFactory.CreateCollisionBox(entity_id).GetSize()
+        size = _EntityComp(entity_id).CollisionBox.GetSize()
         if not size:
             continue
-        ent_pos = _CompFactory.CreatePos(entity_id).GetFootPos()
+        ent_pos = _get_foot_pos(entity_id)
         center = (ent_pos[0], ent_pos[1] + size[1] / 2.0, ent_pos[2])
         cube_size = (size[0], size[1], size[0])
         intersection = _ray_aabb_intersection(start_pos, direction, length, center, cube_size)
@@ -771,8 +778,8 @@ def entity_distance(ent1, ent2):
     :return: 两个实体的距离
     :rtype: float
     """
-    pos1 = _CompFactory.CreatePos(ent1).GetFootPos()
-    pos2 = _CompFactory.CreatePos(ent2).GetFootPos()
+    pos1 = _get_foot_pos(ent1)
+    pos2 = _get_foot_pos(ent2)
     return _pos_distance(pos1, pos2)
 
 
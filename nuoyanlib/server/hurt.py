@@ -12,7 +12,7 @@
 #   Author        : 诺言Nuoyan
 #   Email         : 1279735247@qq.com
 #   Gitee         : https://gitee.com/charming-lee
-#   Last Modified : 2025-01-25
+#   Last Modified : 2026-10-18
 #
 # ====================================================
 
@@ -25,9 +25,18 @@ from mod.common.minecraftEnum import (
     ActorDamageCause as _ActorDamageCause,
 )
 from .._core._server._comp import (
-    CompFactory as _CompFactory,
+    EntityComp as _EntityComp,
     LvComp as _LvComp,
 )
+from .._core._server._snapshot import (
+    get_foot_pos as _get_foot_pos,
+    get_rot as _get_rot,
+    get_dim as _get_dim,
+    get_engine_type as _get_engine_type,
+    get_health as _get_health,
+    is_tick_snapshot_enabled as _is_tick_snapshot_enabled,
+    invalidate_entity_snapshot as _invalidate_entity_snapshot,
+)
 from ..utils.calculator import (
     is_in_sector as _is_in_sector,
     pos_distance_to_line as _pos_distance_to_line,
@@ -74,7 +83,7 @@ class EntityFilter:
         :return: 返回True时表示该实体为生物实体
         :rtype: bool
         """
-        return _CompFactory.CreateEngineType(eid).GetEngineType() & _EntityType.Mob == _EntityType.Mob
+        return _get_engine_type(eid) & _EntityType.Mob == _EntityType.Mob
 
 
     @staticmethod
@@ -103,7 +112,7 @@ class EntityFilter:
         :return: 返回True时表示该实体当前生命值>0
         :rtype: bool
         """
-        return _CompFactory.CreateAttr(eid).GetAttrValue(_AttrType.HEALTH) > 0
+        return _get_health(eid) > 0
 
 
 def explode_hurt(
@@ -136,14 +145,14 @@ def explode_hurt(
     :rtype: None
     """
     for plr in _server_api.GetPlayerList():
-        if _CompFactory.CreateDimension(plr).GetEntityDimensionId() == dim:
+        if _get_dim(plr) == dim:
             player_id = plr
             break
     else:
         return
     orig_rule = _LvComp.Game.GetGameRulesInfoServer()
     _LvComp.Game.SetGameRulesInfoServer({'option_info': {'tile_drops': tile_drops, 'mob_loot': mob_loot}})
-    comp = _CompFactory.CreateHurt(source_id)
+    comp = _EntityComp(source_id).Hurt
     try:
         if not hurt_source:
             comp.ImmuneDamage(True)
@@ -209,7 +218,7 @@ def line_damage(
     )
     hurt_ents = []
     for eid in entities:
-        ep = _CompFactory.CreatePos(eid).GetFootPos()
+        ep = _get_foot_pos(eid)
         dis = _pos_distance_to_line(ep, start_pos, end_pos)
         if dis > radius:
             continue
@@ -354,13 +363,13 @@ def sector_aoe_damage(
         filter_ids = []
     filter_ids = _copy(filter_ids)
     filter_ids.append(attacker_id)
-    attacker_pos = _CompFactory.CreatePos(attacker_id).GetFootPos()
-    attacker_rot = _CompFactory.CreateRot(attacker_id).GetRot()[1]
-    dim = _CompFactory.CreateDimension(attacker_id).GetEntityDimensionId()
+    attacker_pos = _get_foot_pos(attacker_id)
+    attacker_rot = _get_rot(attacker_id)[1]
+    dim = _get_dim(attacker_id)
     entity_list = _get_entities_in_area(attacker_pos, sector_radius, dim, filter_ids, filter_types, True)
     result = []
     for eid in entity_list:
-        pos = _CompFactory.CreatePos(eid).GetFootPos()
+        pos = _get_foot_pos(eid)
         test = _is_in_sector(
             (pos[0], attacker_pos[1], pos[2]), attacker_pos, sector_radius, sector_angle, attacker_rot
         )
@@ -431,10 +440,12 @@ def hurt_by_set_health(entity_id, damage):
     :return: 无
     :rtype: None
     """
-    attr = _CompFactory.CreateAttr(entity_id)
+    attr = _EntityComp(entity_id).Attr
     health = attr.GetAttrValue(_AttrType.HEALTH)
     new_health = int(health) - int(damage)
     attr.SetAttrValue(_AttrType.HEALTH, new_health)
+    if _is_tick_snapshot_enabled():
+        _invalidate_entity_snapshot(entity_id)
 
 
 def hurt(
@@ -467,9 +478,11 @@ def hurt(
     else:
         custom_tag = cause
         cause = _ActorDamageCause.Custom
-    hurt_result = _CompFactory.CreateHurt(entity_id).Hurt(int(damage), cause, attacker, child_id, knocked, custom_tag)
+    hurt_result = _EntityComp(entity_id).Hurt.Hurt(int(damage), cause, attacker, child_id, knocked, custom_tag)
     if not hurt_result and force:
         hurt_by_set_health(entity_id, damage)
+    elif _is_tick_snapshot_enabled():
+        _invalidate_entity_snapshot(entity_id)
 
 
 def percent_damage(
@@ -499,16 +512,16 @@ def percent_damage(
     :return: 无
     :rtype: None
     """
-    attr = _CompFactory.CreateAttr(entity_id)
+    attr = _EntityComp(entity_id).Attr
     value = 0
     if type_name == "max_health":
         value = attr.GetAttrMaxValue(_AttrType.HEALTH)
     elif type_name == "health":
-        value = attr.GetAttrValue(_AttrType.HEALTH)
+        value = _get_health(entity_id)
     elif type_name == "hunger":
         value = attr.GetAttrValue(_AttrType.HUNGER)
     elif type_name == "attacker_damage" and attacker:
-        value = _CompFactory.CreateAttr(attacker).GetAttrValue(_AttrType.DAMAGE)
+        value = _EntityComp(attacker).Attr.GetAttrValue(_AttrType.DAMAGE)
     if value > 0:
         damage = int(value * percent)
         if damage > 999999999:
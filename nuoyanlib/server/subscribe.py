@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+# ====================================================
+#
+#   Copyright (c) 2023 Nuoyan
+#   nuoyanlib is licensed under Mulan PSL v2.
+#   You can use this software according to the terms and conditions of the Mulan PSL v2.
+#   You may obtain a copy of Mulan PSL v2 at:
+#            http://license.coscl.org.cn/MulanPSL2
+#   THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY OR FIT FOR A PARTICULAR PURPOSE.
+#   See the Mulan PSL v2 for more details.
+#
+#   Author        : 诺言Nuoyan
+#   Email         : 1279735247@qq.com
+#   Gitee         : https://gitee.com/charming-lee
+#   Last Modified : 2026-10-18
+#
+# ====================================================
+
+
+from .._core._server._lib_server import (
+    get_lib_system as _get_lib_system,
+)
+
+
+__all__ = [
+    "refresh_subscriptions",
+    "get_subscription_stats",
+]
+
+
+def refresh_subscriptions(namespace, system_name, method=""):
+    """
+    | 使客户端对指定函数的订阅（见客户端的 ``subscribe`` ）在下一tick立即重新执行，而不必等待订阅的间隔。适合在数据发生变化时调用，使玩家尽快收到更新。
+
+    -----
+
+    :param str namespace: 被订阅函数所在系统的命名空间
+    :param str system_name: 被订阅函数所在系统的名称
+    :param str method: 被订阅函数名，默认为空字符串，表示该系统的所有被订阅函数
+
+    :return: 被刷新的订阅数量
+    :rtype: int
+    """
+    lib_sys = _get_lib_system()
+    if not lib_sys:
+        return 0
+    return lib_sys.refresh_topics(namespace, system_name, method)
+
+
+def get_subscription_stats():
+    """
+    | 获取客户端订阅的统计数据。
+
+    -----
+
+    :return: 统计字典，包含topics（当前不同的订阅数量）、subscribers（当前的订阅者数量，同一玩家的相同订阅只计一次）、evaluations（执行被订阅函数的次数）、changes（结果变化的次数）、pushes（推送给玩家的消息数）
+    :rtype: dict[str,int]
+    """
+    lib_sys = _get_lib_system()
+    if not lib_sys:
+        return {}
+    return lib_sys.get_subscription_stats()
+
+
+
+
+
+
@@ -12,7 +12,7 @@
 #   Author        : 诺言Nuoyan
 #   Email         : 1279735247@qq.com
 #   Gitee         : https://gitee.com/charming-lee
-#   Last Modified : 2025-01-25
+#   Last Modified : 2026-10-18
 #
 # ====================================================
 
@@ -22,12 +22,124 @@ nuoyanlib工具库。
 """
 
 
-from .calculator import *
-from .enum import *
-from .item import *
-from .mc_random import *
-# from .mc_timer import *
-from .utils import *
-from .vector import *
-from .time_ease import *
-from .communicate import *
+from .._core._lazy import lazy_module as _lazy_module
+
+
+# 子模块在首次访问其中的名称时才会导入，新增或修改子模块的__all__时需同步修改此处，打包时scripts/pack/check_exports.py会检查两者是否一致
+_lazy_module(__name__, (
+    (".calculator", (
+        "pos_block_facing",
+        "to_polar_coordinate",
+        "to_cartesian_coordinate",
+        "probability_true_i",
+        "probability_true_f",
+        "pos_distance_to_line",
+        "pos_floor",
+        "pos_distance",
+        "to_relative_pos",
+        "to_screen_pos",
+        "pos_rotate",
+        "straight_pos_list",
+        "midpoint",
+        "camera_rot_p2p",
+        "circle_pos_list",
+        "pos_entity_facing",
+        "pos_forward_rot",
+        "n_quantiles_index_list",
+        "cube_center",
+        "cube_longest_side_len",
+        "is_in_sector",
+        "sphere_pos_list",
+        "cube_pos_list",
+        "spiral_pos_list",
+        "is_in_cube",
+        "rot_diff",
+        "ray_aabb_intersection",
+    )),
+    (".enum", (
+        "search_data",
+        "ITEM_LIST",
+        "BLOCK_LIST",
+        "STRUCTURE_DICT",
+        "BIOME_DICT",
+        "EFFECT_DICT",
+        "ENTITY_ID_DICT",
+        "ATTACKABLE_MOB_LIST",
+        "HOSTILE_MOB_LIST",
+        "FRIENDLY_MOB_LIST",
+        "MOB_LIST",
+        "ENTITY_LIST",
+    )),
+    (".item", (
+        "deepcopy_item_dict",
+        "gen_item_dict",
+        "get_item_count",
+        "set_namespace",
+        "is_same_item",
+        "is_empty_item",
+        "are_same_item",
+        "get_max_stack",
+    )),
+    (".mc_random", (
+        "random_pos",
+        "random_string",
+        "random_even_poses",
+    )),
+    # (".mc_timer", ("McTimer",)),
+    (".utils", (
+        "add_condition_to_func",
+        "remove_condition_to_func",
+        "all_indexes",
+        "check_string",
+        "check_string2",
+        "turn_dict_value_to_tuple",
+        "turn_list_to_tuple",
+        "is_method_overridden",
+        "translate_time",
+    )),
+    (".vector", (
+        "vec_entity_left",
+        "vec_entity_right",
+        "vec_entity_front",
+        "vec_entity_back",
+        "vec_normalize",
+        "vec_rot_p2p",
+        "vec_p2p",
+        "vec_length",
+        "vec_angle",
+        "vec_euler_rotate",
+        "vec_rotate_around",
+        "outgoing_vec",
+        "vec_composite",
+        "vec_scale",
+    )),
+    (".time_ease", (
+        "TimeEaseFunc",
+        "TimeEase",
+        "TimeEaseManager",
+        "ease_lut",
+    )),
+    (".communicate", (
+        "call_callback",
+        "call_local",
+        "call_endpoint",
+        "call_batch_local",
+        "call",
+        "call_batch",
+        "flush_lib_messages",
+        "check_call_timeouts",
+        "get_in_flight_call_count",
+        "report_call_progress",
+        "cancel_call",
+        "clear_call_cache",
+        "enable_call_stats",
+        "get_call_stats",
+        "reset_call_stats",
+        "dump_call_stats",
+        "CallFuture",
+        "call_async",
+        "gather",
+        "rpc",
+        "register_rpc",
+    )),
+))
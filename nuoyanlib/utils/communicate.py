@@ -12,38 +12,96 @@
 #   Author        : 诺言Nuoyan
 #   Email         : 1279735247@qq.com
 #   Gitee         : https://gitee.com/charming-lee
-#   Last Modified : 2025-01-26
+#   Last Modified : 2026-10-18
 #
 # ====================================================
 
 
-from uuid import uuid4 as _uuid4
+from itertools import count as _count
+from collections import OrderedDict as _OrderedDict
+from json import dumps as _json_dumps
 from traceback import format_exc as _format_exc
+from time import time as _time
+from heapq import (
+    heappush as _heappush,
+    heappop as _heappop,
+)
 from .._core._sys import (
     get_api as _get_api,
     is_client as _is_client,
     get_comp_factory as _get_comp_factory,
     LEVEL_ID as _LEVEL_ID,
 )
+from .._core._utils import (
+    set_rpc_name as _set_rpc_name,
+    get_rpc_name as _get_rpc_name,
+)
+from .._core._call_stats import payload_size as _payload_size
 
 
 __all__ = [
     "call_callback",
     "call_local",
+    "call_endpoint",
+    "call_batch_local",
     "call",
+    "call_batch",
+    "flush_lib_messages",
+    "check_call_timeouts",
+    "get_in_flight_call_count",
+    "report_call_progress",
+    "cancel_call",
+    "clear_call_cache",
+    "enable_call_stats",
+    "get_call_stats",
+    "reset_call_stats",
+    "dump_call_stats",
+    "CallFuture",
+    "call_async",
+    "gather",
+    "rpc",
+    "register_rpc",
 ]
 
 
 _callback_data = {}
+# 调用编号只需在发起方唯一，使用自增整数代替uuid字符串以缩短消息
+_call_ids = _count(1)
+# (截止时间, uuid)组成的最小堆；调用完成时不从堆中删除，到期弹出时发现uuid已不在_callback_data中则直接跳过
+_deadlines = []
+# 合并中的调用，键为(是否为客户端, 命名空间, 系统名称, 函数名, 玩家实体ID, 参数)，值为[调用编号, [(回调函数, 延迟返回时间), ...]]
+_inflight = {}
+# 键同上，值为(过期时间, 回调参数字典)，按写入顺序排列，超出上限时先淘汰最早写入的
+_result_cache = _OrderedDict()
+_MAX_CACHED_RESULTS = 256
+# 本地联机时两端运行在同一解释器中，因此每次调用仍判断当前端，其余信息按端缓存；库系统创建时会重置
+# 是否为客户端 -> (是否为客户端, 引擎接口模块, 本地玩家实体ID)
+_sides = {}
+# 是否为客户端 -> 该端的库系统
+_lib_systems = {}
+# (是否为客户端, 命名空间, 系统名称) -> 该端的系统对象
+_local_systems = {}
+# 该端不存在的系统，键同上；库系统每tick清空一次，以便发现之后注册的系统
+_missing_systems = set()
 
 
 def call_callback(cb_or_uuid, delay_ret=-1, success=True, ret=None, error="", player_id=""):
-    if isinstance(cb_or_uuid, str):
-        data = _callback_data[cb_or_uuid]
+    if isinstance(cb_or_uuid, (int, str)):
+        data = _callback_data.get(cb_or_uuid)
+        if data is None:
+            # 调用已超时，迟到的返回值直接丢弃
+            return
         callback = data['callback']
-        data['count'] -= 1
-        if data['count'] <= 0:
+        pending = data['pending']
+        if player_id in pending:
+            pending.remove(player_id)
+        elif pending:
+            # 返回方与预期不符时按到达顺序扣减，保证调用最终能够结束
+            pending.pop()
+        if not pending:
             del _callback_data[cb_or_uuid]
+        if 'endpoint' in data:
+            _record_result(data, success, error, _time() - data['start'], _payload_size(ret))
     else:
         callback = cb_or_uuid
     if not callback:
@@ -55,11 +113,64 @@ def call_callback(cb_or_uuid, delay_ret=-1, success=True, ret=None, error="", pl
         callback(cb_args)
 
 
+def _resolve_side():
+    client = _is_client()
+    side = _sides.get(client)
+    if side is None:
+        api = _get_api()
+        side = _sides[client] = (client, api, api.GetLocalPlayerId() if client else "")
+    return side
+
+
+def _get_local_system(namespace, system_name):
+    client, api, _ = _resolve_side()
+    key = (client, namespace, system_name)
+    system = _local_systems.get(key)
+    if system is None and key not in _missing_systems:
+        system = api.GetSystem(namespace, system_name)
+        if system is None:
+            _missing_systems.add(key)
+        else:
+            _local_systems[key] = system
+    return system
+
+
+def reset_side_cache():
+    """
+    | 清除已缓存的两端信息、库系统与系统对象，下次调用时重新获取。
+    | nuoyanlib的库系统创建时会自动调用，一般无需手动调用。
+
+    -----
+
+    :return: 无
+    :rtype: None
+    """
+    _sides.clear()
+    _lib_systems.clear()
+    _local_systems.clear()
+    _missing_systems.clear()
+
+
+def clear_missing_systems():
+    """
+    | 清除“系统不存在”的缓存记录，使之后注册的系统能被调用到。
+    | nuoyanlib的库系统每tick会自动调用一次，一般无需手动调用。
+
+    -----
+
+    :return: 无
+    :rtype: None
+    """
+    _missing_systems.clear()
+
+
 def call_local(target_sys, method, cb_or_uuid, delay_ret, args, kwargs):
-    player_id = _get_api().GetLocalPlayerId() if _is_client() else ""
+    player_id = _resolve_side()[2]
     if not target_sys:
         call_callback(cb_or_uuid, delay_ret, False, player_id=player_id)
     else:
+        stats = _get_call_stats()
+        start = _time()
         try:
             if args is None:
                 args = ()
@@ -67,33 +178,424 @@ def call_local(target_sys, method, cb_or_uuid, delay_ret, args, kwargs):
                 kwargs = {}
             ret = getattr(target_sys, method)(*args, **kwargs)
         except:
+            if stats and stats.enabled:
+                stats.record_exec(_endpoint_name(target_sys, method), False, _time() - start)
             call_callback(cb_or_uuid, delay_ret, False, error=_format_exc(), player_id=player_id)
         else:
+            if stats and stats.enabled:
+                stats.record_exec(_endpoint_name(target_sys, method), True, _time() - start)
             call_callback(cb_or_uuid, delay_ret, True, ret, player_id=player_id)
 
 
-def _notify_call(namespace, system_name, method, player_id, callback, delay_ret, args, kwargs):
-    uuid = str(_uuid4())
-    notify_args = {
-        'namespace': namespace,
-        'system_name': system_name,
-        'method': method,
-        'uuid': uuid,
-        'delay_ret': delay_ret,
-        'args': args,
-        'kwargs': kwargs,
-    }
-    _callback_data[uuid] = {'callback': callback, 'count': len(player_id) if player_id else 1}
-    if _is_client():
-        from .._core._client._lib_client import get_lib_system
+def call_endpoint(func, cb_or_uuid, delay_ret, args, kwargs):
+    player_id = _resolve_side()[2]
+    if func is None:
+        call_callback(cb_or_uuid, delay_ret, False, error="rpc endpoint not found", player_id=player_id)
+        return
+    stats = _get_call_stats()
+    start = _time()
+    try:
+        ret = func(*(args or ()), **(kwargs or {}))
+    except:
+        if stats and stats.enabled:
+            stats.record_exec(_endpoint_name(func.__self__, _get_rpc_name(func)), False, _time() - start)
+        call_callback(cb_or_uuid, delay_ret, False, error=_format_exc(), player_id=player_id)
+    else:
+        if stats and stats.enabled:
+            stats.record_exec(_endpoint_name(func.__self__, _get_rpc_name(func)), True, _time() - start)
+        call_callback(cb_or_uuid, delay_ret, True, ret, player_id=player_id)
+
+
+def call_batch_local(calls, cb_or_uuid, delay_ret, resolve=None):
+    results = []
+    for c in calls:
+        namespace, system_name, method = c[:3]
+        args = c[3] if len(c) > 3 else None
+        kwargs = c[4] if len(c) > 4 else None
+        if resolve:
+            allowed, func = resolve(namespace, system_name, method)
+            if not allowed:
+                results.append({'success': False, 'ret': None, 'error': "not whitelisted", 'player_id': ""})
+                continue
+            if func is not None:
+                call_endpoint(func, results.append, -1, args, kwargs)
+                continue
+        call_local(_get_local_system(namespace, system_name), method, results.append, -1, args, kwargs)
+    call_callback(cb_or_uuid, delay_ret, True, results, player_id=_resolve_side()[2])
+
+
+def check_call_timeouts(now=None):
+    """
+    | 检查跨端调用是否超时。对超时的调用，每个尚未返回的被调用方各触发一次回调，参数中 ``success`` 为False， ``error`` 为"timeout"，并释放该调用占用的数据。
+    | nuoyanlib每tick会自动调用一次，一般无需手动调用。
+
+    -----
+
+    :param float|None now: 当前时间戳，默认为None，即使用time.time()
+
+    :return: 本次超时的调用数量
+    :rtype: int
+    """
+    if not _deadlines:
+        return 0
+    if now is None:
+        now = _time()
+    count = 0
+    while _deadlines and _deadlines[0][0] <= now:
+        uuid = _heappop(_deadlines)[1]
+        data = _callback_data.get(uuid)
+        if data is None or data['deadline'] > now:
+            # 截止时间因分片传输被顺延过，以堆中较晚的记录为准
+            continue
+        del _callback_data[uuid]
+        count += 1
+        if 'endpoint' in data:
+            for _ in data['pending']:
+                _record_result(data, False, "timeout", 0.0, 0)
+        callback = data['callback']
+        if not callback:
+            continue
+        # 多人调用中已返回的结果已经回调过，这里只补发未返回的部分
+        for player_id in data['pending']:
+            call_callback(callback, -1, False, error="timeout", player_id=player_id)
+    return count
+
+
+def get_in_flight_call_count():
+    """
+    | 获取已发出但尚未全部返回（且未超时）的跨端调用数量。
+
+    -----
+
+    :return: 进行中的跨端调用数量
+    :rtype: int
+    """
+    return len(_callback_data)
+
+
+def report_call_progress(uuid, stage, done, total, player_id=""):
+    """
+    | 报告分片传输的跨端调用的进度，触发调用时传入的 ``on_progress`` 回调，并以当前时间为起点顺延该调用的超时。
+    | nuoyanlib在发送与接收分片时会自动调用，一般无需手动调用。
+
+    -----
+
+    :param int uuid: 调用编号
+    :param str stage: 传输阶段，"send"表示发送参数，"recv"表示接收返回值
+    :param int done: 已传输的分片数
+    :param int total: 分片总数
+    :param str player_id: 对端的玩家实体ID，对端为服务端时为空字符串；默认为空字符串
+
+    :return: 无
+    :rtype: None
+    """
+    data = _callback_data.get(uuid)
+    if data is None:
+        return
+    if data['timeout'] is not None and data['timeout'] > 0:
+        data['deadline'] = _time() + data['timeout']
+        _heappush(_deadlines, (data['deadline'], uuid))
+    if data['progress']:
+        data['progress']({'stage': stage, 'done': done, 'total': total, 'player_id': player_id})
+
+
+def cancel_call(call_id):
+    """
+    | 取消进行中的跨端调用。
+    | 尚未发出的参数分片不再发送，被调用方正在分片发送的返回值也会停止发送；每个尚未返回的被调用方各触发一次回调，参数中 ``success`` 为False， ``error`` 为"cancelled"。
+
+    -----
+
+    :param int call_id: 调用编号，即call或call_batch的返回值
+
+    :return: 调用仍在进行中并被取消时返回True，否则返回False
+    :rtype: bool
+    """
+    data = _callback_data.pop(call_id, None)
+    if data is None:
+        return False
+    if 'endpoint' in data:
+        for _ in data['pending']:
+            _record_result(data, False, "cancelled", 0.0, 0)
+    lib_sys = _get_lib_system()
+    is_client = _resolve_side()[0]
+    for player_id in data['pending']:
+        lib_sys.cancel_streams(player_id, "_NuoyanLibCall", call_id)
+        # 客户端之间的调用经服务端转发，不进行分片传输
+        if not (is_client and player_id):
+            lib_sys.post_msg(player_id, "_NuoyanLibCallCancel", {'uuid': call_id})
+    if data['callback']:
+        for player_id in data['pending']:
+            call_callback(data['callback'], -1, False, error="cancelled", player_id=player_id)
+    return True
+
+
+def _get_lib_system():
+    client = _is_client()
+    lib_sys = _lib_systems.get(client)
+    if lib_sys is None:
+        if client:
+            from .._core._client._lib_client import get_lib_system
+        else:
+            from .._core._server._lib_server import get_lib_system
         lib_sys = get_lib_system()
+        if lib_sys is not None:
+            _lib_systems[client] = lib_sys
+    return lib_sys
+
+
+def _get_call_stats():
+    lib_sys = _get_lib_system()
+    return lib_sys.call_stats if lib_sys else None
+
+
+def _endpoint_name(system, method):
+    return "%s:%s:%s" % (getattr(system, 'namespace', ""), getattr(system, 'systemName', ""), method)
+
+
+def _record_result(data, success, error, latency, size):
+    stats = _get_call_stats()
+    if stats:
+        stats.record_result(data['endpoint'], success, error, latency, size)
+
+
+def enable_call_stats(enable=True):
+    """
+    | 开启或关闭本端的跨端调用统计。也可在config.py中设置CALL_STATS = True，使其默认开启。
+    | 开启后，本端发起的调用会按被调用的函数统计调用次数、成功、失败、超时、取消次数，往返延迟（直方图、平均值、最大值、p50、p95），以及请求与返回值的大小（按json编码后的长度估算）；本端被调用时会统计执行次数、执行中出现异常的次数与执行耗时。
+    | 关闭期间不进行任何统计，已有的统计数据保留。
+
+    -----
+
+    :param bool enable: 是否开启，默认为True
+
+    :return: 无
+    :rtype: None
+    """
+    stats = _get_call_stats()
+    if stats:
+        stats.enabled = bool(enable)
+
+
+def get_call_stats():
+    """
+    | 获取本端的跨端调用统计数据，需要先通过 ``enable_call_stats`` 开启统计。
+
+    -----
+
+    【示例】
+
+    ::
+
+        stats = get_call_stats()
+        # 'MyMod:MyServerSystem:get_money': {
+        #     'calls': 120, 'successes': 118, 'errors': 1, 'timeouts': 1, 'cancelled': 0,
+        #     'request_bytes': 9600, 'response_bytes': 480,
+        #     'latency': {'count': 119, 'avg': 0.061, 'max': 0.31, 'p50': 0.05, 'p95': 0.1, 'buckets': [[0.005, 0], ...]},
+        #     'executions': 0, 'exec_errors': 0, 'exec_time': {'avg': 0.0, 'max': 0.0},
+        # }
+
+    -----
+
+    :return: 统计字典，键为被调用的函数（"命名空间:系统名称:函数名"，批量调用为"batch"），值为该函数的统计数据，其中时间的单位为秒，延迟分位数只能精确到直方图的档位，超出最后一档时为None
+    :rtype: dict[str,dict[str,Any]]
+    """
+    stats = _get_call_stats()
+    return stats.snapshot() if stats else {}
+
+
+def reset_call_stats():
+    """
+    | 清空本端的跨端调用统计数据。
+
+    -----
+
+    :return: 无
+    :rtype: None
+    """
+    stats = _get_call_stats()
+    if stats:
+        stats.reset()
+
+
+def dump_call_stats(path=""):
+    """
+    | 将本端的跨端调用统计数据导出为json字符串，可同时写入文件。
+
+    -----
+
+    :param str path: 文件路径，默认为空字符串，即不写入文件
+
+    :return: json字符串
+    :rtype: str
+    """
+    text = _json_dumps(get_call_stats(), indent=4, sort_keys=True)
+    if path:
+        with open(path, "w") as f:
+            f.write(text)
+    return text
+
+
+def flush_lib_messages():
+    """
+    | 立即发送nuoyanlib内部排队中的跨端消息。
+    | nuoyanlib的内部跨端消息（如call、物品网格同步、set_query_mod_var等）默认会按目标合并，每tick统一发送一次；对延迟敏感时可在发送后调用此函数。
+    | 可在config.py中设置BATCH_LIB_MESSAGES = False关闭合并。
+
+    -----
+
+    :return: 无
+    :rtype: None
+    """
+    lib_sys = _get_lib_system()
+    if lib_sys:
+        lib_sys.flush_msgs()
+
+
+def _notify_call(
+        namespace,
+        system_name,
+        method,
+        player_id,
+        callback,
+        delay_ret,
+        timeout,
+        args,
+        kwargs,
+        calls=None,
+        on_progress=None,
+):
+    uuid = next(_call_ids)
+    lib_sys = _get_lib_system()
+    # 对端已注册的rpc函数只需发送编号，否则发送完整的系统与函数名称
+    endpoint_id = None
+    if calls is None:
+        endpoint_id = lib_sys.get_remote_rpc_id(namespace, system_name, method, player_id or ("",))
+    if endpoint_id is not None:
+        notify_args = {
+            'id': endpoint_id,
+            'uuid': uuid,
+            'delay_ret': delay_ret,
+            'args': args,
+            'kwargs': kwargs,
+        }
+    else:
+        notify_args = {
+            'namespace': namespace,
+            'system_name': system_name,
+            'method': method,
+            'uuid': uuid,
+            'delay_ret': delay_ret,
+            'args': args,
+            'kwargs': kwargs,
+        }
+        if calls is not None:
+            notify_args['calls'] = calls
+    # 调用服务端时，服务端返回的player_id为空字符串
+    data = _callback_data[uuid] = {
+        'callback': callback,
+        'pending': set(player_id) if player_id else {""},
+        'progress': on_progress,
+        'timeout': timeout,
+        'deadline': 0,
+    }
+    if timeout is not None and timeout > 0:
+        data['deadline'] = _time() + timeout
+        _heappush(_deadlines, (data['deadline'], uuid))
+    notify_args = lib_sys.encode_call(player_id or ("",), notify_args)
+    stats = lib_sys.call_stats
+    if stats.enabled:
+        data['endpoint'] = "batch" if calls is not None else "%s:%s:%s" % (namespace, system_name, method)
+        data['start'] = _time()
+        size = _payload_size(notify_args)
+        for _ in data['pending']:
+            stats.record_call(data['endpoint'], size)
+    def send_progress(target, done, total):
+        report_call_progress(uuid, "send", done, total, target)
+    if _resolve_side()[0]:
         if player_id is None:
-            lib_sys.NotifyToServer("_NuoyanLibCall", notify_args)
+            if not lib_sys.stream_msg(("",), "_NuoyanLibCall", notify_args, uuid, send_progress):
+                lib_sys.NotifyToServer("_NuoyanLibCall", notify_args)
         else:
             lib_sys.notify_to_multi_clients(player_id, "_NuoyanLibCall", notify_args)
-    else:
-        from .._core._server._lib_server import get_lib_system
-        get_lib_system().NotifyToMultiClients(player_id, "_NuoyanLibCall", notify_args)
+    elif not lib_sys.stream_msg(player_id, "_NuoyanLibCall", notify_args, uuid, send_progress):
+        lib_sys.NotifyToMultiClients(player_id, "_NuoyanLibCall", notify_args)
+    return uuid
+
+
+def _coalesced_call(
+        namespace,
+        system_name,
+        method,
+        player_id,
+        callback,
+        delay_ret,
+        timeout,
+        args,
+        kwargs,
+        on_progress,
+        coalesce,
+        cache_ttl,
+):
+    if not coalesce or (player_id and len(player_id) > 1):
+        return _notify_call(
+            namespace, system_name, method, player_id, callback, delay_ret, timeout, args, kwargs,
+            on_progress=on_progress,
+        )
+    key = (
+        _resolve_side()[0],
+        namespace,
+        system_name,
+        method,
+        player_id[0] if player_id else None,
+        repr(args),
+        repr(sorted(kwargs.items())) if kwargs else None,
+    )
+    if cache_ttl > 0:
+        cached = _result_cache.get(key)
+        if cached:
+            if cached[0] > _time():
+                call_callback(callback, delay_ret, **cached[1])
+                return None
+            del _result_cache[key]
+    flight = _inflight.get(key)
+    if flight is not None:
+        flight[1].append((callback, delay_ret))
+        return flight[0]
+    flight = _inflight[key] = [None, [(callback, delay_ret)]]
+    def done(cb_args):
+        if _inflight.get(key) is flight:
+            del _inflight[key]
+        if cache_ttl > 0 and cb_args['success']:
+            now = _time()
+            # 重新写入的键移到末尾
+            _result_cache.pop(key, None)
+            if len(_result_cache) >= _MAX_CACHED_RESULTS:
+                for k, v in _result_cache.items():
+                    if v[0] <= now:
+                        del _result_cache[k]
+                while len(_result_cache) >= _MAX_CACHED_RESULTS:
+                    _result_cache.popitem(False)
+            _result_cache[key] = (now + cache_ttl, cb_args)
+        for cb, cb_delay_ret in flight[1]:
+            call_callback(cb, cb_delay_ret, **cb_args)
+    flight[0] = _notify_call(
+        namespace, system_name, method, player_id, done, -1, timeout, args, kwargs,
+        on_progress=on_progress,
+    )
+    return flight[0]
+
+
+def clear_call_cache():
+    """
+    | 清空 ``call`` 通过 ``cache_ttl`` 缓存的调用结果。
+
+    -----
+
+    :return: 无
+    :rtype: None
+    """
+    _result_cache.clear()
 
 
 def call(
@@ -103,9 +605,12 @@ def call(
         player_id=None,
         callback=None,
         delay_ret=-1,
-        timeout=3.0, # todo
+        timeout=3.0,
         args=None,
         kwargs=None,
+        on_progress=None,
+        coalesce=False,
+        cache_ttl=0,
 ):
     """
     | 调用指定客户端或服务端系统的函数，可以通过回调函数获取被调用函数的返回值。
@@ -115,6 +620,14 @@ def call(
     - ``error`` – str，若调用时出现异常，异常信息将通过该参数给出
     - ``player_id`` – str，调用客户端时，该参数表示该客户端的玩家实体ID
     | 由于ModSDK接口限制，跨端调用时，被调用函数返回的数据类型和传入被调用函数的参数的类型仅支持python基本数据类型（str，int，float，list，tuple，dict）。
+    | 服务端与客户端之间的调用中，编码后超过config.py中CALL_CHUNK_SIZE字节（默认为8192）的参数或返回值会自动拆分为多个分片，在之后的几个tick内按CALL_STREAM_BUDGET（默认为32768）限制每tick发送的字节数，在对端重组后再执行被调用函数或回调，避免一次发送大量数据造成卡顿。分片数据经过json编码，元组会变为列表，字典的非字符串键会变为字符串。客户端之间的调用不进行分片。
+    | 分片传输时，每传输一个分片会触发一次 ``on_progress`` ，其参数字典说明如下：
+    - ``stage`` – str，"send"表示正在发送参数，"recv"表示正在接收返回值
+    - ``done`` – int，已传输的分片数
+    - ``total`` – int，分片总数
+    - ``player_id`` – str，对端的玩家实体ID，对端为服务端时为空字符串
+    | 分片传输期间，超时时间从最近一次传输分片时重新计算。
+    | 设置 ``coalesce`` 为True后，若已有相同目标、相同函数、相同参数（按repr比较）且同样开启了合并的调用正在进行中，则不再发送新的请求，而是等待该调用返回后用同一结果回调；可再通过 ``cache_ttl`` 将成功的结果缓存一段时间，期间相同的调用直接使用缓存结果回调。合并的调用共用同一返回值对象，回调中请勿修改。仅调用服务端或单个客户端时生效。
 
     -----
 
@@ -124,33 +637,41 @@ def call(
     :param str|list[str]|None player_id: 当被调用方为客户端时，可以指定玩家实体ID，传入玩家实体ID列表即可指定多个玩家，或用单字符"*"表示所有玩家；默认为None，表示被调用方为服务端
     :param function|None callback: 回调函数，默认为None；接受一个带有三个参数的字典，参数说明见上方
     :param float delay_ret: 延迟返回时间，单位为秒，若设置了该值，则callback触发前会延迟给定时间；但由于跨端调用本身存在不可避免的网络延迟，实际的延迟时间会大于此处给定的值；默认为-1，即无延迟
-    :param float timeout: 超时时间，单位为秒，若超时时间内未收到被调用函数的返回值，将判定为调用失败，默认为3.0
+    :param float|None timeout: 超时时间，单位为秒，若超时时间内未收到被调用函数的返回值，将判定为调用失败，回调参数中 ``error`` 为"timeout"；调用多个客户端时，已返回的结果正常回调，仅对未返回的客户端触发超时回调；超时后到达的返回值将被丢弃；传入None或不大于0的数表示不超时；默认为3.0
     :param tuple args: 位置参数元组，展开后传入被调用函数中
     :param dict[str,Any] kwargs: 关键字参数字典，展开后传入被调用函数中
+    :param function|None on_progress: 分片传输进度回调函数，默认为None；接受一个带有四个参数的字典，参数说明见上方
+    :param bool coalesce: 是否合并相同的进行中调用，默认为False
+    :param float cache_ttl: 开启合并时，成功结果的缓存时间，单位为秒；默认为0，即不缓存
 
-    :return: 无
-    :rtype: None
+    :return: 跨端调用的编号，可传入cancel_call取消调用，合并的调用返回同一编号，取消时所有合并的调用一同取消；仅调用本端系统或使用缓存结果时返回None
+    :rtype: int|None
     """
-    api = _get_api()
-    target_sys = api.GetSystem(namespace, system_name)
+    client, api, local_plr = _resolve_side()
+    target_sys = _get_local_system(namespace, system_name)
     if player_id == "*":
         player_id = api.GetPlayerList()
     elif isinstance(player_id, str):
         player_id = [player_id]
     elif isinstance(player_id, list):
         player_id = player_id[:]
-    if _is_client():
+    if client:
         # c to s
         if not target_sys and not player_id:
-            _notify_call(namespace, system_name, method, player_id, callback, delay_ret, args, kwargs)
+            return _coalesced_call(
+                namespace, system_name, method, player_id, callback, delay_ret, timeout, args, kwargs,
+                on_progress, coalesce, cache_ttl,
+            )
         # c to c
         else:
-            local_plr = api.GetLocalPlayerId()
             if local_plr in player_id:
                 call_local(target_sys, method, callback, delay_ret, args, kwargs)
                 player_id.remove(local_plr)
             if player_id:
-                _notify_call(namespace, system_name, method, player_id, callback, delay_ret, args, kwargs)
+                return _coalesced_call(
+                    namespace, system_name, method, player_id, callback, delay_ret, timeout, args, kwargs,
+                    on_progress, coalesce, cache_ttl,
+                )
     else:
         # s to s
         if target_sys:
@@ -159,7 +680,391 @@ def call(
             call_callback(callback, delay_ret, False)
         # s to c
         else:
-            _notify_call(namespace, system_name, method, player_id, callback, delay_ret, args, kwargs)
+            return _coalesced_call(
+                namespace, system_name, method, player_id, callback, delay_ret, timeout, args, kwargs,
+                on_progress, coalesce, cache_ttl,
+            )
+
+
+def call_batch(calls, callback=None, player_id=None, delay_ret=-1, timeout=3.0):
+    """
+    | 批量调用指定客户端或服务端系统的函数。所有调用合并为一条消息发送，在被调用方按顺序依次执行，全部结果通过一次回调返回。
+    | 回调函数的参数字典与 ``call`` 相同，其中 ``ret`` 为列表，按顺序对应每一项调用，每一项为包含 ``success`` 、 ``ret`` 、 ``error`` 、 ``player_id`` 的字典；某一项调用失败不影响其他项的执行。
+    | 调用多个客户端时，每个客户端各回调一次。
+
+    -----
+
+    【示例】
+
+    ::
+
+        # 打开界面时一次性获取多项数据
+        call_batch([
+            ("MyMod", "MyServerSystem", "get_money"),
+            ("MyMod", "MyServerSystem", "get_items", (player_id,)),
+            ("MyMod", "ShopServerSystem", "get_goods", None, {'page': 0}),
+        ], on_data_ready)
+
+    -----
+
+    :param list[tuple] calls: 调用列表，每一项为元组(namespace, system_name, method, args, kwargs)，args与kwargs可省略
+    :param function|None callback: 回调函数，默认为None
+    :param str|list[str]|None player_id: 当被调用方为客户端时，可以指定玩家实体ID，传入玩家实体ID列表即可指定多个玩家，或用单字符"*"表示所有玩家；默认为None，表示被调用方为服务端
+    :param float delay_ret: 延迟返回时间，单位为秒，默认为-1，即无延迟
+    :param float|None timeout: 超时时间，单位为秒，默认为3.0
+
+    :return: 跨端调用的编号，可传入cancel_call取消调用；仅调用本端系统时返回None
+    :rtype: int|None
+    """
+    calls = [list(c) for c in calls]
+    client, api, local_plr = _resolve_side()
+    if player_id == "*":
+        player_id = api.GetPlayerList()
+    elif isinstance(player_id, str):
+        player_id = [player_id]
+    elif isinstance(player_id, list):
+        player_id = player_id[:]
+    if client:
+        # c to s
+        if not player_id:
+            return _notify_call("", "", "", None, callback, delay_ret, timeout, None, None, calls)
+        # c to c
+        else:
+            if local_plr in player_id:
+                call_batch_local(calls, callback, delay_ret)
+                player_id.remove(local_plr)
+            if player_id:
+                return _notify_call("", "", "", player_id, callback, delay_ret, timeout, None, None, calls)
+    else:
+        # s to s
+        if not player_id:
+            call_batch_local(calls, callback, delay_ret)
+        # s to c
+        else:
+            return _notify_call("", "", "", player_id, callback, delay_ret, timeout, None, None, calls)
+
+
+def rpc(name=""):
+    """
+    | 函数装饰器，将系统的方法注册为跨端调用（ ``call`` 、 ``call_async`` 等）的端点。用于NuoyanServerSystem与NuoyanClientSystem的子类。
+    | 系统初始化时，被装饰的方法会登记到按整数编号的调用表中，调用表会在玩家进入游戏时与对端交换一次；之后调用这些方法时只需发送编号，被调用方通过列表下标直接取得函数，无需再查找系统与函数。
+    | 未注册的函数仍可按名称调用；在config.py中设置RPC_WHITELIST = True后，只有注册的函数允许被对端调用。
+
+    -----
+
+    【示例】
+
+    ::
+
+        class MyServerSystem(NuoyanServerSystem):
+            @rpc
+            def get_money(self, player_id):
+                return 100
+
+        # 客户端
+        call("MyMod", "MyServerSystem", "get_money", callback=on_money, args=(player_id,))
+
+    -----
+
+    :param str name: 端点名称，即调用时使用的函数名，默认为被装饰函数名
+    """
+    def decorator(func):
+        _set_rpc_name(func, name if name and isinstance(name, str) else func.__name__)
+        return func
+    if isinstance(name, str):
+        return decorator
+    else:
+        return decorator(name)
+
+
+def register_rpc(system):
+    """
+    | 手动登记系统中被 ``rpc`` 装饰的方法。NuoyanServerSystem与NuoyanClientSystem的子类会在初始化时自动登记，其他系统需在初始化时调用此函数。
+
+    -----
+
+    :param ServerSystem|ClientSystem system: 系统实例
+
+    :return: 登记的方法数量
+    :rtype: int
+    """
+    return _get_lib_system().register_rpc(system)
+
+
+_PENDING = 0
+_RESOLVED = 1
+_REJECTED = 2
+
+
+class CallFuture(object):
+    """
+    | 跨端调用的结果，由 ``call_async`` 与 ``gather`` 返回。
+    | 结果只会确定一次，确定后会被缓存，之后再通过 ``then`` 添加的回调将立即执行。
+
+    -----
+
+    【示例】
+
+    ::
+
+        # 服务端 -> 客户端 -> 服务端的链式调用
+        (
+            call_async("MyMod", "MyClientSystem", "get_setting", player_id)
+            .then(lambda setting: call_async("MyMod", "MyServerSystem", "apply_setting", args=(setting,)))
+            .then(lambda ret: on_applied(ret))
+            .catch(lambda error: on_failed(error))
+        )
+    """
+
+    __slots__ = ("_state", "_value", "_callbacks")
+
+    def __init__(self):
+        self._state = _PENDING
+        self._value = None
+        self._callbacks = []
+
+    def _settle(self, state, value):
+        if self._state != _PENDING:
+            return
+        self._state = state
+        self._value = value
+        callbacks, self._callbacks = self._callbacks, None
+        for cb in callbacks:
+            cb(self)
+
+    def _add_done(self, cb):
+        if self._state == _PENDING:
+            self._callbacks.append(cb)
+        else:
+            cb(self)
+
+    def resolve(self, value=None):
+        """
+        | 以成功状态确定结果。若传入另一个CallFuture，则跟随其结果。重复调用时仅第一次有效。
+
+        -----
+
+        :param Any value: 结果
+
+        :return: 无
+        :rtype: None
+        """
+        if isinstance(value, CallFuture):
+            value._add_done(lambda f: self._settle(f._state, f._value))
+        else:
+            self._settle(_RESOLVED, value)
+
+    def reject(self, error=""):
+        """
+        | 以失败状态确定结果。重复调用时仅第一次有效。
+
+        -----
+
+        :param str error: 错误信息
+
+        :return: 无
+        :rtype: None
+        """
+        self._settle(_REJECTED, error)
+
+    def then(self, on_success=None, on_error=None):
+        """
+        | 添加结果回调，返回一个新的CallFuture，其结果为回调函数的返回值；回调函数返回CallFuture时，新的CallFuture跟随其结果。
+        | 回调函数抛出异常时，新的CallFuture以失败状态确定，错误信息为异常堆栈。
+        | 未提供对应状态的回调函数时，结果原样传递给新的CallFuture。
+
+        -----
+
+        :param function|None on_success: 成功时的回调函数，接受一个参数，即调用结果
+        :param function|None on_error: 失败时的回调函数，接受一个参数，即错误信息
+
+        :return: 新的CallFuture
+        :rtype: CallFuture
+        """
+        nxt = CallFuture()
+        def on_done(f):
+            handler = on_success if f._state == _RESOLVED else on_error
+            if handler is None:
+                nxt._settle(f._state, f._value)
+                return
+            try:
+                ret = handler(f._value)
+            except Exception:
+                nxt.reject(_format_exc())
+            else:
+                nxt.resolve(ret)
+        self._add_done(on_done)
+        return nxt
+
+    def catch(self, on_error):
+        """
+        | 添加失败回调，等价于 ``then(None, on_error)`` 。
+
+        -----
+
+        :param function on_error: 失败时的回调函数，接受一个参数，即错误信息
+
+        :return: 新的CallFuture
+        :rtype: CallFuture
+        """
+        return self.then(None, on_error)
+
+    def done(self):
+        """
+        | 结果是否已经确定。
+
+        -----
+
+        :return: 结果已确定时返回True，否则返回False
+        :rtype: bool
+        """
+        return self._state != _PENDING
+
+    def succeeded(self):
+        """
+        | 是否以成功状态确定。
+
+        -----
+
+        :return: 以成功状态确定时返回True，否则返回False
+        :rtype: bool
+        """
+        return self._state == _RESOLVED
+
+    def result(self):
+        """
+        | 获取成功时的结果。
+
+        -----
+
+        :return: 以成功状态确定时返回结果，否则返回None
+        :rtype: Any
+        """
+        return self._value if self._state == _RESOLVED else None
+
+    def error(self):
+        """
+        | 获取失败时的错误信息。
+
+        -----
+
+        :return: 以失败状态确定时返回错误信息，否则返回None
+        :rtype: str|None
+        """
+        return self._value if self._state == _REJECTED else None
+
+
+def call_async(
+        namespace,
+        system_name,
+        method,
+        player_id=None,
+        delay_ret=-1,
+        timeout=3.0,
+        args=None,
+        kwargs=None,
+        coalesce=False,
+        cache_ttl=0,
+):
+    """
+    | 调用指定客户端或服务端系统的函数，返回一个CallFuture。参数含义与 ``call`` 相同。
+    | 调用服务端或单个客户端时，调用成功则CallFuture的结果为被调用函数的返回值，调用失败（包括超时）则错误信息为 ``call`` 回调参数中的 ``error`` ，若其为空则为"failed"。
+    | 调用多个客户端时，只发送一次请求，待所有客户端返回或超时后，CallFuture以成功状态确定，结果为按 ``player_id`` 顺序排列的列表，每一项为 ``call`` 的回调参数字典，可一次性处理全部结果。
+
+    -----
+
+    :param str namespace: 被调用函数所在系统的命名空间
+    :param str system_name: 被调用函数所在系统的名称
+    :param str method: 被调用函数名
+    :param str|list[str]|None player_id: 当被调用方为客户端时，可以指定玩家实体ID，传入玩家实体ID列表即可指定多个玩家，或用单字符"*"表示所有玩家；默认为None，表示被调用方为服务端
+    :param float delay_ret: 延迟返回时间，单位为秒，默认为-1，即无延迟
+    :param float|None timeout: 超时时间，单位为秒，默认为3.0
+    :param tuple args: 位置参数元组，展开后传入被调用函数中
+    :param dict[str,Any] kwargs: 关键字参数字典，展开后传入被调用函数中
+    :param bool coalesce: 是否合并相同的进行中调用，仅调用服务端或单个客户端时生效，默认为False
+    :param float cache_ttl: 开启合并时，成功结果的缓存时间，单位为秒；默认为0，即不缓存
+
+    :return: 调用结果
+    :rtype: CallFuture
+    """
+    future = CallFuture()
+    if player_id == "*":
+        player_id = _resolve_side()[1].GetPlayerList()
+    if not isinstance(player_id, list):
+        def callback(cb_args):
+            if cb_args['success']:
+                future.resolve(cb_args['ret'])
+            else:
+                future.reject(cb_args['error'] or "failed")
+        call(
+            namespace, system_name, method, player_id, callback, delay_ret, timeout, args, kwargs,
+            coalesce=coalesce, cache_ttl=cache_ttl,
+        )
+        return future
+    if not player_id:
+        future.resolve([])
+        return future
+    order = player_id[:]
+    targets = set(order)
+    remaining = set(order)
+    results = {}
+    def callback(cb_args):
+        if future.done():
+            return
+        pid = cb_args['player_id']
+        if pid not in targets:
+            # 被调用系统位于本端时为本地调用，只会回调一次
+            future.resolve([cb_args])
+            return
+        results[pid] = cb_args
+        remaining.discard(pid)
+        if not remaining:
+            future.resolve([results[i] for i in order if i in results])
+    call(namespace, system_name, method, player_id, callback, delay_ret, timeout, args, kwargs)
+    return future
+
+
+def gather(futures, timeout=None):
+    """
+    | 将多个CallFuture汇总为一个CallFuture，所有CallFuture确定后以成功状态确定，只触发一次回调。
+    | 结果为与 ``futures`` 顺序一致的列表，每一项为字典，包含 ``success`` 、 ``ret`` 、 ``error`` 三个键，含义与 ``call`` 的回调参数相同。
+
+    -----
+
+    :param list[CallFuture] futures: CallFuture列表
+    :param float|None timeout: 超时时间，单位为秒，超时后未确定的项记为失败，其 ``error`` 为"timeout"；默认为None，即不设置超时，此时依赖各调用自身的超时
+
+    :return: 汇总结果
+    :rtype: CallFuture
+    """
+    out = CallFuture()
+    futures = list(futures)
+    results = [None] * len(futures)
+    remaining = [len(futures)]
+    if not futures:
+        out.resolve(results)
+        return out
+    def make_done(i):
+        def on_done(f):
+            if out.done():
+                return
+            results[i] = {'success': f.succeeded(), 'ret': f.result(), 'error': f.error() or ""}
+            remaining[0] -= 1
+            if not remaining[0]:
+                out.resolve(results)
+        return on_done
+    for i, f in enumerate(futures):
+        f._add_done(make_done(i))
+    if not out.done() and timeout is not None and timeout > 0:
+        def on_timeout():
+            if out.done():
+                return
+            for i, res in enumerate(results):
+                if res is None:
+                    results[i] = {'success': False, 'ret': None, 'error': "timeout"}
+            out.resolve(results)
+        _get_comp_factory().CreateGame(_LEVEL_ID).AddTimer(timeout, on_timeout)
+    return out
 
 
 
@@ -12,38 +12,82 @@
 #   Author        : 诺言Nuoyan
 #   Email         : 1279735247@qq.com
 #   Gitee         : https://gitee.com/charming-lee
-#   Last Modified : 2025-01-26
+#   Last Modified : 2026-10-18
 #
 # ====================================================
 
 
-from  typing import Any, Callable, Union, List, Optional, Dict, Tuple
+from  typing import Any, Callable, Union, List, Optional, Dict, Tuple, Set, Iterator
 from mod.client.system.clientSystem import ClientSystem
 from mod.server.system.serverSystem import ServerSystem
+from .._core._client._lib_client import NuoyanLibClientSystem
+from .._core._server._lib_server import NuoyanLibServerSystem
+from collections import OrderedDict
+from .._core._call_stats import CallStats
 
 
 _CallbackType = Optional[Callable[[Dict[str, Any]], Any]]
 
 
-_callback_data: Dict[str, Dict[str, Union[int, _CallbackType]]]
+_callback_data: Dict[int, Dict[str, Union[Set[str], _CallbackType, Optional[float]]]]
+_call_ids: Iterator[int]
+_deadlines: List[Tuple[float, int]]
+_CallKey = Tuple[bool, str, str, str, Optional[str], str, Optional[str]]
+_inflight: Dict[_CallKey, List[Any]]
+_result_cache: OrderedDict[_CallKey, Tuple[float, Dict[str, Any]]]
+_MAX_CACHED_RESULTS: int
+_sides: Dict[bool, Tuple[bool, Any, str]]
+_lib_systems: Dict[bool, Union[NuoyanLibClientSystem, NuoyanLibServerSystem]]
+_local_systems: Dict[Tuple[bool, str, str], Union[ServerSystem, ClientSystem]]
+_missing_systems: Set[Tuple[bool, str, str]]
 
 
 def call_callback(
-    cb_or_uuid: Union[_CallbackType, str],
+    cb_or_uuid: Union[_CallbackType, int],
     delay_ret: float = -1,
     success: bool = Tuple,
     ret: Any = None,
     error: str = "",
     player_id: str = "",
 ) -> None: ...
+def _resolve_side() -> Tuple[bool, Any, str]: ...
+def _get_local_system(namespace: str, system_name: str) -> Union[ServerSystem, ClientSystem, None]: ...
+def reset_side_cache() -> None: ...
+def clear_missing_systems() -> None: ...
 def call_local(
     target_sys: Union[ClientSystem, ServerSystem],
     method: str,
-    cb_or_uuid: Union[_CallbackType, str],
+    cb_or_uuid: Union[_CallbackType, int],
     delay_ret: float,
     args: Optional[Tuple[Any, ...]],
     kwargs: Optional[Dict[str, Any]],
 ) -> None: ...
+def call_endpoint(
+    func: Optional[Callable],
+    cb_or_uuid: Union[_CallbackType, int],
+    delay_ret: float,
+    args: Optional[Tuple[Any, ...]],
+    kwargs: Optional[Dict[str, Any]],
+) -> None: ...
+def call_batch_local(
+    calls: List[List[Any]],
+    cb_or_uuid: Union[_CallbackType, int],
+    delay_ret: float,
+    resolve: Optional[Callable[[str, str, str], Tuple[bool, Optional[Callable]]]] = None,
+) -> None: ...
+def check_call_timeouts(now: Optional[float] = None) -> int: ...
+def get_in_flight_call_count() -> int: ...
+def report_call_progress(uuid: int, stage: str, done: int, total: int, player_id: str = "") -> None: ...
+def cancel_call(call_id: int) -> bool: ...
+def _get_lib_system() -> Union[NuoyanLibClientSystem, NuoyanLibServerSystem, None]: ...
+def _get_call_stats() -> Optional[CallStats]: ...
+def _endpoint_name(system: Any, method: str) -> str: ...
+def _record_result(data: Dict[str, Any], success: bool, error: str, latency: float, size: int) -> None: ...
+def enable_call_stats(enable: bool = True) -> None: ...
+def get_call_stats() -> Dict[str, Dict[str, Any]]: ...
+def reset_call_stats() -> None: ...
+def dump_call_stats(path: str = "") -> str: ...
+def flush_lib_messages() -> None: ...
 def _notify_call(
     namespace: str,
     system_name: str,
@@ -51,9 +95,27 @@ def _notify_call(
     player_id: Union[str, List[str], None],
     callback: _CallbackType,
     delay_ret: float,
+    timeout: Optional[float],
     args: Optional[Tuple[Any, ...]],
     kwargs: Optional[Dict[str, Any]],
-) -> None: ...
+    calls: Optional[List[List[Any]]] = None,
+    on_progress: _CallbackType = None,
+) -> int: ...
+def _coalesced_call(
+    namespace: str,
+    system_name: str,
+    method: str,
+    player_id: Optional[List[str]],
+    callback: _CallbackType,
+    delay_ret: float,
+    timeout: Optional[float],
+    args: Optional[Tuple[Any, ...]],
+    kwargs: Optional[Dict[str, Any]],
+    on_progress: _CallbackType,
+    coalesce: bool,
+    cache_ttl: float,
+) -> Optional[int]: ...
+def clear_call_cache() -> None: ...
 def call(
     namespace: str,
     system_name: str,
@@ -61,7 +123,62 @@ def call(
     player_id: Optional[Union[str, List[str]]] = None,
     callback: _CallbackType = None,
     delay_ret: float = -1,
-    timeout: float = 3.0,
+    timeout: Optional[float] = 3.0,
     args: Optional[Tuple[Any, ...]] = None,
     kwargs: Optional[Dict[str, Any]] = None,
-) -> None: ...
+    on_progress: _CallbackType = None,
+    coalesce: bool = False,
+    cache_ttl: float = 0,
+) -> Optional[int]: ...
+
+def call_batch(
+    calls: List[Tuple[Any, ...]],
+    callback: _CallbackType = None,
+    player_id: Optional[Union[str, List[str]]] = None,
+    delay_ret: float = -1,
+    timeout: Optional[float] = 3.0,
+) -> Optional[int]: ...
+
+def rpc(name: Union[str, Callable] = "") -> Callable: ...
+def register_rpc(system: Union[ServerSystem, ClientSystem]) -> int: ...
+
+
+_PENDING: int
+_RESOLVED: int
+_REJECTED: int
+
+
+class CallFuture(object):
+    _state: int
+    _value: Any
+    _callbacks: Optional[List[Callable[[CallFuture], Any]]]
+    def __init__(self: ...) -> None: ...
+    def _settle(self: ..., state: int, value: Any) -> None: ...
+    def _add_done(self: ..., cb: Callable[[CallFuture], Any]) -> None: ...
+    def resolve(self: ..., value: Any = None) -> None: ...
+    def reject(self: ..., error: str = "") -> None: ...
+    def then(
+        self: ...,
+        on_success: Optional[Callable[[Any], Any]] = None,
+        on_error: Optional[Callable[[str], Any]] = None,
+    ) -> CallFuture: ...
+    def catch(self: ..., on_error: Callable[[str], Any]) -> CallFuture: ...
+    def done(self: ...) -> bool: ...
+    def succeeded(self: ...) -> bool: ...
+    def result(self: ...) -> Any: ...
+    def error(self: ...) -> Optional[str]: ...
+
+
+def call_async(
+    namespace: str,
+    system_name: str,
+    method: str,
+    player_id: Optional[Union[str, List[str]]] = None,
+    delay_ret: float = -1,
+    timeout: Optional[float] = 3.0,
+    args: Optional[Tuple[Any, ...]] = None,
+    kwargs: Optional[Dict[str, Any]] = None,
+    coalesce: bool = False,
+    cache_ttl: float = 0,
+) -> CallFuture: ...
+def gather(futures: List[CallFuture], timeout: Optional[float] = None) -> CallFuture: ...
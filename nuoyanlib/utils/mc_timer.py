@@ -12,23 +12,148 @@
 #   Author        : 诺言Nuoyan
 #   Email         : 1279735247@qq.com
 #   Gitee         : https://gitee.com/charming-lee
-#   Last Modified : 2024-04-28
+#   Last Modified : 2026-10-18
 #
 # ====================================================
 
 
-from threading import Timer as _Timer
+from threading import (
+    Thread as _Thread,
+    Condition as _Condition,
+)
+from heapq import (
+    heappush as _heappush,
+    heappop as _heappop,
+)
+from itertools import count as _count
+from collections import deque as _deque
+from time import time as _time
+from traceback import format_exc as _format_exc
+from .._core._logging import error as _log_error
 
 
 __all__ = [
     "McTimer",
+    "get_timer_scheduler_stats",
+    "drain_timer_queue",
 ]
 
 
+_FIRE = 0
+_RESUME = 1
+
+
+class _Scheduler(object):
+    """
+    | 所有McTimer共用的调度器，只使用一个守护线程。
+    | 到期时间保存在最小堆中，线程等待至堆顶到期或被新加入的更早的定时器唤醒。定时器暂停、继续或取消时只增加其代数，堆中的旧记录弹出时发现代数不符即跳过，无需从堆中删除。
+    """
+
+    def __init__(self):
+        self.cond = _Condition()
+        self.heap = []
+        self.seq = _count()
+        self.thread = None
+        self.fired = 0
+        self.coalesced = 0
+        # 游戏线程模式的交接队列，调度线程append、游戏线程popleft，deque的这两个操作本身是线程安全的，无需加锁
+        self.handoff = _deque()
+
+    def push(self, when, timer, action):
+        # 调用方需持有self.cond
+        entry = (when, next(self.seq), timer, timer._gen, action)
+        _heappush(self.heap, entry)
+        if self.thread is None:
+            self.thread = _Thread(target=self._run, name="McTimerScheduler")
+            self.thread.daemon = True
+            self.thread.start()
+        elif self.heap[0] is entry:
+            self.cond.notify()
+
+    def _run(self):
+        cond = self.cond
+        heap = self.heap
+        while True:
+            with cond:
+                while True:
+                    if not heap:
+                        cond.wait()
+                        continue
+                    remaining = heap[0][0] - _time()
+                    if remaining <= 0:
+                        break
+                    cond.wait(remaining)
+                _, _, timer, gen, action = _heappop(heap)
+                if gen != timer._gen:
+                    continue
+                if action == _RESUME:
+                    timer._resume()
+                    continue
+                self.fired += 1
+                if timer._game_thread:
+                    timer._enqueue(gen)
+                    continue
+            timer._fire(gen)
+
+
+_scheduler = _Scheduler()
+
+
+def get_timer_scheduler_stats():
+    """
+    | 获取McTimer调度器的统计数据。
+
+    -----
+
+    :return: 统计字典，包含pending（堆中的记录数，含已失效但尚未弹出的记录）、fired（已触发的次数）、queued（等待游戏线程执行的数量）、coalesced（游戏线程积压时被合并跳过的执行次数）、thread_alive（调度线程是否已启动）
+    :rtype: dict[str,int|bool]
+    """
+    with _scheduler.cond:
+        return {
+            'pending': len(_scheduler.heap),
+            'fired': _scheduler.fired,
+            'queued': len(_scheduler.handoff),
+            'coalesced': _scheduler.coalesced,
+            'thread_alive': _scheduler.thread is not None and _scheduler.thread.is_alive(),
+        }
+
+
+def drain_timer_queue(max_count=0, max_time=0.0):
+    """
+    | 在当前线程中执行已到期的游戏线程模式定时器（见McTimer.RunInGameThread）。
+    | nuoyanlib的库系统每tick会自动调用一次，一般无需手动调用。
+
+    -----
+
+    :param int max_count: 本次最多执行的数量，超出的留到下次调用；为0时不限制
+    :param float max_time: 本次执行的耗时上限（秒），超出后剩余的留到下次调用，至少执行一个；为0时不限制
+
+    :return: 本次执行的数量
+    :rtype: int
+    """
+    handoff = _scheduler.handoff
+    if not handoff:
+        return 0
+    start = _time()
+    n = 0
+    while handoff:
+        if max_count and n >= max_count:
+            break
+        if max_time and n and _time() - start >= max_time:
+            break
+        timer, gen = handoff.popleft()
+        n += 1
+        timer._deliver(gen)
+    return n
+
+
 class McTimer(object):
     """
     | 客户端函数定时器。非重复执行的定时器在执行完毕后会自动销毁。
     | 与官方的定时器不同的是，该定时器使用threading标准库实现，比官方的定时器计时更精准。
+    | 所有定时器共用一个调度线程，按到期时间依次执行，可同时运行数千个定时器；函数在调度线程中执行，请勿在其中长时间阻塞，否则会推迟其他定时器。
+    | 重复定时器按固定的节拍执行，下一次的到期时间为上一次的到期时间加上间隔，不会因函数的执行耗时而累积误差；落后超过一个间隔时跳过错过的执行。
+    | 调用RunInGameThread后，函数改为在游戏线程（库系统的Update）中执行，可安全调用ModSDK接口，详见该方法的说明。
 
     -----
 
@@ -47,18 +172,104 @@ class McTimer(object):
         self.kwargs = kwargs
         self._pause = False
         self._cancel = False
-        self.__timer = _Timer(sec, self.__func)
+        self._started = False
+        self._gen = 0
+        self._deadline = 0.0
+        self._remaining = sec
+        self._game_thread = False
+        self._queued = None
+        self._firing = False
 
     def _execute(self):
         return self.func(*self.args, **self.kwargs)
 
-    def __func(self):
-        self._execute()
-        if self.type == "r" and not self._cancel:
-            self.__timer = _Timer(self.sec, self.__func)
-            self.__timer.start()
+    def _fire(self, gen):
+        with _scheduler.cond:
+            if gen != self._gen:
+                return
+            func, args, kwargs = self.func, self.args, self.kwargs
+            self._firing = True
+        try:
+            func(*args, **kwargs)
+        except:
+            _log_error("McTimer callback %s failed:\n%s", McTimer, func, _format_exc())
+        with _scheduler.cond:
+            self._firing = False
+            if gen != self._gen or self._cancel:
+                # 执行期间被暂停或取消
+                return
+            if self.type != "r":
+                self._release()
+                return
+            self._reschedule()
+
+    def _reschedule(self):
+        # 调用方需持有_scheduler.cond
+        now = _time()
+        self._deadline += self.sec
+        if self._deadline <= now:
+            self._deadline = now + self.sec
+        _scheduler.push(self._deadline, self, _FIRE)
+
+    def _enqueue(self, gen):
+        # 调用方需持有_scheduler.cond；交给游戏线程执行，节拍仍由调度线程维护，不等待函数执行
+        if self._queued == gen:
+            # 上一次尚未被游戏线程执行，合并为一次
+            _scheduler.coalesced += 1
         else:
-            self._release()
+            self._queued = gen
+            _scheduler.handoff.append((self, gen))
+        if self.type == "r":
+            self._reschedule()
+
+    def _deliver(self, gen):
+        # 在游戏线程中执行，快速路径不加锁，代数不符说明入队后已被暂停或取消
+        if gen != self._gen:
+            return
+        self._queued = None
+        func, args, kwargs = self.func, self.args, self.kwargs
+        if func is None:
+            return
+        # 重复定时器的下一次到期时间已由调度线程算好，只有非重复定时器需要标记执行中
+        once = self.type != "r"
+        if once:
+            self._firing = True
+        try:
+            func(*args, **kwargs)
+        except:
+            _log_error("McTimer callback %s failed:\n%s", McTimer, func, _format_exc())
+        if once:
+            with _scheduler.cond:
+                self._firing = False
+                if gen == self._gen:
+                    self._release()
+
+    def _resume(self):
+        # 调用方需持有_scheduler.cond
+        self._pause = False
+        self._gen += 1
+        if self._started:
+            self._deadline = _time() + self._remaining
+            _scheduler.push(self._deadline, self, _FIRE)
+
+    def RunInGameThread(self, enable=True):
+        """
+        | 设置定时器的函数是否在游戏线程中执行。
+        | 开启后，调度线程仍按精确的时间计时，但到期时不直接执行函数，而是放入交接队列，由库系统在下一次Update中执行，因此函数中可以安全地调用ModSDK接口，实际执行时间最多比到期时间晚一个tick。
+        | 重复定时器的节拍由调度线程维护，不受游戏线程执行时间的影响；游戏线程卡顿导致上一次尚未执行时，新的到期会与之合并，不会在恢复后集中执行多次。
+        | 库系统每tick执行的数量与耗时有上限（见config.py中的TIMER_TICK_BUDGET与TIMER_TICK_TIME_BUDGET），超出的留到之后的tick执行。
+        | 使用该模式需要已注册nuoyanlib的库系统。
+
+        -----
+
+        :param bool enable: 是否开启，默认为True
+
+        :return: 定时器自身
+        :rtype: McTimer
+        """
+        with _scheduler.cond:
+            self._game_thread = enable
+        return self
 
     def Start(self):
         """
@@ -69,7 +280,13 @@ class McTimer(object):
         :return: 定时器自身
         :rtype: McTimer
         """
-        self.__timer.start()
+        with _scheduler.cond:
+            if self._started or self._cancel:
+                return self
+            self._started = True
+            if not self._pause:
+                self._deadline = _time() + self.sec
+                _scheduler.push(self._deadline, self, _FIRE)
         return self
 
     def Cancel(self):
@@ -81,11 +298,11 @@ class McTimer(object):
         :return: 无
         :rtype: None
         """
-        self.__timer.cancel()
-        self._release()
+        with _scheduler.cond:
+            self._release()
 
     def _release(self):
-        self.__timer = None
+        self._gen += 1
         self._cancel = True
         self._pause = False
         self.sec = -1
@@ -94,23 +311,38 @@ class McTimer(object):
         self.kwargs = None
 
     def Pause(self, sec=None):
-        # todo: Pause
         """
-        | 暂停定时器，重复调用时仅第一次有效。
+        | 暂停定时器，重复调用时仅第一次有效。暂停时会记录距离下一次执行的剩余时间，继续运行后从剩余时间开始计时。
+        | 在启动前暂停时，定时器启动后不会开始计时，直到继续运行。
 
         -----
 
-        :param float|None sec: 暂停秒数，默认为None，表示无限期暂停
+        :param float|None sec: 暂停秒数，到时后自动继续运行；默认为None，表示无限期暂停
 
         :return: 定时器自身
         :rtype: McTimer
         """
-        if not self._pause:
-            pass
+        with _scheduler.cond:
+            if self._pause or self._cancel:
+                return self
+            if self._firing and self.type != "r":
+                # 非重复定时器正在执行，执行完毕即销毁，暂停无意义
+                return self
+            now = _time()
+            self._pause = True
+            self._gen += 1
+            if self._firing:
+                # 在函数执行期间暂停，本次的到期时间已过，剩余时间从下一次的到期时间算起
+                self._remaining = self._deadline + self.sec - now
+                if self._remaining <= 0:
+                    self._remaining = self.sec
+            elif self._started:
+                self._remaining = max(0.0, self._deadline - now)
+            if sec is not None:
+                _scheduler.push(_time() + sec, self, _RESUME)
         return self
 
     def Continue(self):
-        # todo: Continue
         """
         | 继续运行被暂停的定时器。
 
@@ -119,8 +351,9 @@ class McTimer(object):
         :return: 定时器自身
         :rtype: McTimer
         """
-        if self._pause:
-            pass
+        with _scheduler.cond:
+            if self._pause and not self._cancel:
+                self._resume()
         return self
 
     def Execute(self):
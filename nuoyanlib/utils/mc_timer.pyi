@@ -12,13 +12,38 @@
 #   Author        : 诺言Nuoyan
 #   Email         : 1279735247@qq.com
 #   Gitee         : https://gitee.com/charming-lee
-#   Last Modified : 2024-04-20
+#   Last Modified : 2026-10-18
 #
 # ====================================================
 
 
-from typing import Callable, Any, Optional
-from threading import Timer
+from typing import Callable, Any, Optional, List, Tuple, Iterator, Dict, Union
+from threading import Thread, Condition
+from collections import deque
+
+
+_FIRE: int
+_RESUME: int
+
+
+class _Scheduler(object):
+    cond: Condition
+    heap: List[Tuple[float, int, McTimer, int, int]]
+    seq: Iterator[int]
+    thread: Optional[Thread]
+    fired: int
+    coalesced: int
+    handoff: deque[Tuple[McTimer, int]]
+    def __init__(self) -> None: ...
+    def push(self, when: float, timer: McTimer, action: int) -> None: ...
+    def _run(self) -> None: ...
+
+
+_scheduler: _Scheduler
+
+
+def get_timer_scheduler_stats() -> Dict[str, Union[int, bool]]: ...
+def drain_timer_queue(max_count: int = 0, max_time: float = 0.0) -> int: ...
 
 
 class McTimer(object):
@@ -29,10 +54,21 @@ class McTimer(object):
     kwargs: Any
     _pause: bool
     _cancel: bool
-    __timer: Optional[Timer]
+    _started: bool
+    _gen: int
+    _deadline: float
+    _remaining: float
+    _game_thread: bool
+    _queued: Optional[int]
+    _firing: bool
     def __init__(self: ..., ttype: str, sec: float, func: Callable, *args: Any, **kwargs: Any): ...
     def _execute(self: ...) -> Any: ...
-    def __func(self: ...) -> None: ...
+    def _fire(self: ..., gen: int) -> None: ...
+    def _reschedule(self: ...) -> None: ...
+    def _enqueue(self: ..., gen: int) -> None: ...
+    def _deliver(self: ..., gen: int) -> None: ...
+    def _resume(self: ...) -> None: ...
+    def RunInGameThread(self: ..., enable: bool = True) -> McTimer: ...
     def Start(self: ...) -> McTimer: ...
     def Cancel(self: ...) -> None: ...
     def _release(self: ...) -> None: ...
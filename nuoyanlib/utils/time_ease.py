@@ -12,12 +12,15 @@
 #   Author        : 诺言Nuoyan
 #   Email         : 1279735247@qq.com
 #   Gitee         : https://gitee.com/charming-lee
-#   Last Modified : 2025-01-19
+#   Last Modified : 2026-10-18
 #
 # ====================================================
 
 
 from time import time as _time
+from itertools import count as _count
+from collections import OrderedDict as _OrderedDict
+from array import array as _array
 from math import (
     pi as _pi,
     sin as _sin,
@@ -29,6 +32,8 @@ from math import (
 __all__ = [
     "TimeEaseFunc",
     "TimeEase",
+    "TimeEaseManager",
+    "ease_lut",
 ]
 
 
@@ -228,11 +233,71 @@ class TimeEaseFunc:
     """
 
 
+# (函数, 分段数) -> 查表函数，按生成顺序排列，超出上限时先淘汰最早生成的，避免传入的临时函数一直无法释放
+_lut_cache = _OrderedDict()
+_MAX_CACHED_LUTS = 64
+
+
+def ease_lut(func, resolution=256):
+    """
+    | 将时间缓动函数预先制表，返回一个查表并线性插值的等价函数，可代替原函数传入TimeEase或TimeEaseManager。
+    | 查表本身也是一次函数调用，内置曲线制表后大多更慢，仅适用于计算量较大的自定义曲线。
+    | 插值的最大误差保存在返回函数的 ``max_error`` 属性中；in_out_circ与in_out_back在0.5处不连续，不建议制表。
+
+    -----
+
+    :param function func: 时间缓动函数，接受并返回一个float值
+    :param int resolution: 分段数，需大于等于1，表的长度为resolution + 1，默认为256
+
+    :return: 查表函数，接受[0, 1]内的值（超出范围时按端点处理），带有func（原函数）、resolution、max_error属性
+    :rtype: function
+    """
+    if resolution < 1:
+        raise ValueError("Parameter 'resolution' must be at least 1, got %s." % resolution)
+    key = (func, resolution)
+    lut = _lut_cache.get(key)
+    if lut:
+        return lut
+    n = resolution
+    table = [float(func(float(i) / n)) for i in xrange(n + 1)]
+    slopes = [table[i + 1] - table[i] for i in xrange(n)]
+    # 末尾补一个0，x极接近1时p - i的舍入不会越界
+    slopes.append(0.0)
+    first = table[0]
+    last = table[n]
+
+    def lut(x):
+        if 0 < x < 1:
+            p = x * n
+            i = int(p)
+            return table[i] + slopes[i] * (p - i)
+        return first if x <= 0 else last
+
+    max_error = 0.0
+    for i in xrange(n):
+        for k in (0.25, 0.5, 0.75):
+            x = (i + k) / n
+            err = abs(func(x) - lut(x))
+            if err > max_error:
+                max_error = err
+    lut.func = func
+    lut.resolution = n
+    lut.max_error = max_error
+    _lut_cache[key] = lut
+    while len(_lut_cache) > _MAX_CACHED_LUTS:
+        _lut_cache.popitem(False)
+    return lut
+
+
 class TimeEase(object):
-    def __init__(self, start_val, end_val, total_tm, fps=0, hold_on_last_frame=False, ease_func=TimeEaseFunc.linear):
+    def __init__(
+            self, start_val, end_val, total_tm, fps=0, hold_on_last_frame=False, ease_func=TimeEaseFunc.linear,
+            time_func=None,
+    ):
         """
         | 创建一个时间缓动对象，内置各种时间缓动函数，可用于实现UI动画、运镜等的平滑过渡效果。
         | 时间缓动对象为一个迭代器，每次迭代或调用 ``next()`` 方法时，会返回一个新的缓动值。
+        | 也可以使用 ``sample()`` 获取任意时刻的缓动值，或使用 ``sample_n()`` 预先计算整段缓动值（如运镜路径、关键帧表），之后按下标读取，无需每帧计算。
 
         -----
 
@@ -242,6 +307,7 @@ class TimeEase(object):
         :param int fps: 变化帧率，小于等于0的值将根据当前时间返回缓动值，默认为0
         :param bool hold_on_last_frame: 是否停止在最后一帧，若设为True，TimeEase可无限迭代，时间结束后将始终返回最后一帧的值，默认为False
         :param function ease_func: 时间缓动函数，可使用TimeEaseFunc提供的函数，或使用自定义函数，该函数接受并返回一个float值，且取值范围均为[0, 1]，默认为TimeEaseFunc.linear
+        :param function|None time_func: 时间来源，无参数，返回当前时间戳（秒），fps小于等于0时使用；多个缓动传入同一个返回本帧时间的函数，即可每帧只读取一次时间；默认为None，即使用time.time
         """
         self.start_val = start_val
         self.end_val = end_val
@@ -249,6 +315,7 @@ class TimeEase(object):
         self.fps = fps
         self.hold_on_last_frame = hold_on_last_frame
         self.ease_func = ease_func
+        self.time_func = time_func or _time
         self._init_tm = 0
         self._frame = 0
         self._total_frame = fps * total_tm
@@ -262,16 +329,72 @@ class TimeEase(object):
         if self._stopped and not self.hold_on_last_frame:
             raise StopIteration
         if self.fps > 0:
-            x = min(self._frame / self._total_frame, 1)
+            x = min(float(self._frame) / self._total_frame, 1) if self._total_frame > 0 else 1
             self._frame += 1
         else:
+            now = self.time_func()
             if self._init_tm == 0:
-                self._init_tm = _time()
-            x = min((_time() - self._init_tm) / self.total_tm, 1)
+                self._init_tm = now
+            x = min((now - self._init_tm) / self.total_tm, 1) if self.total_tm > 0 else 1
         if x >= 1:
             self._stopped = True
         return self.start_val + self.ease_func(x) * self._diff_val
 
+    def sample(self, t):
+        """
+        | 获取开始后第t秒的缓动值，不影响迭代状态。
+        | fps大于0时，t按帧率向下取整到所在帧。
+
+        -----
+
+        :param float t: 开始后的秒数，超出[0, total_tm]时按端点处理
+
+        :return: 缓动值
+        :rtype: float
+        """
+        if self.total_tm <= 0 or t >= self.total_tm:
+            x = 1.0
+        elif t <= 0:
+            x = 0.0
+        elif self.fps > 0:
+            # 加上一个极小值，避免t恰为帧边界时因浮点误差落入上一帧
+            x = min(int(t * self.fps + 1e-9) / float(self._total_frame), 1.0)
+        else:
+            x = float(t) / self.total_tm
+        return self.start_val + self.ease_func(x) * self._diff_val
+
+    def sample_n(self, n):
+        """
+        | 在[0, total_tm]内等间隔取n个时刻（包含两端），一次性计算这些时刻的缓动值，不影响迭代状态。
+        | 可用于预先生成关键帧表，播放时按 ``values[min(int(elapsed / total_tm * (n - 1)), n - 1)]`` 读取即可；例如n取 ``fps * total_tm + 1`` 时，第i帧的值即为 ``values[i]`` 。
+
+        -----
+
+        :param int n: 取样数量，为1时只取终点
+
+        :return: 缓动值数组
+        :rtype: array.array
+        """
+        values = _array('d')
+        if n <= 0:
+            return values
+        if n == 1 or self.total_tm <= 0:
+            values.extend([self.sample(self.total_tm)] * n)
+            return values
+        start = self.start_val
+        diff = self._diff_val
+        func = self.ease_func
+        last = float(n - 1)
+        fps = self.fps
+        total_frame = self._total_frame
+        append = values.append
+        for i in xrange(n):
+            x = i / last
+            if fps > 0 and total_frame > 0 and 0 < x < 1:
+                x = min(int(x * total_frame + 1e-9) / float(total_frame), 1.0)
+            append(start + func(x) * diff)
+        return values
+
     def reset(self):
         """
         | 重置状态，重新开始计算。
@@ -286,6 +409,278 @@ class TimeEase(object):
         self._stopped = False
 
 
+class _Tween(object):
+    # 由TimeEaseManager复用的缓动记录
+    __slots__ = (
+        "tween_id", "start", "diff", "end", "total_tm", "step", "func", "setter", "on_finish", "min_delta",
+        "vector", "start_tm", "last",
+    )
+
+
+class TimeEaseManager(object):
+    """
+    | 时间缓动管理器，每帧只读取一次时间，在一次遍历中推进所有缓动，并将结果直接写入绑定的目标。
+    | 写入目标通过setter函数完成，可直接传入控件或组件的方法，如 ``control.SetPosition`` 、 ``control.SetAlpha`` 、 ``comp.SetFov`` 等；只有值发生变化时才会调用setter。
+    | 缓动结束后其记录会回收到对象池，供之后添加的缓动复用。
+    | 管理器本身不会自动更新，需要在每帧执行的地方（如界面的Update）调用 ``update()`` 。
+
+    -----
+
+    :param int pool_size: 对象池可保留的记录数上限，默认为256
+    """
+
+    def __init__(self, pool_size=256):
+        self.pool_size = pool_size
+        self._active = []
+        self._index = {}
+        self._pool = []
+        self._ids = _count(1)
+        self._frames = 0
+        self._writes = 0
+        self._skipped = 0
+        self._last_cost = 0.0
+        self._total_cost = 0.0
+        self._max_cost = 0.0
+
+    def add(
+            self, start_val, end_val, total_tm, setter, ease_func=TimeEaseFunc.linear, fps=0, on_finish=None,
+            min_delta=0.0,
+    ):
+        """
+        | 添加一个缓动，在下一次 ``update()`` 时开始计时。
+
+        -----
+
+        :param float|tuple[float] start_val: 初始值，可传入元组，对每个分量分别缓动（如控件位置）
+        :param float|tuple[float] end_val: 最终值，为元组时长度需与start_val相同
+        :param float total_tm: 变化总时间，单位为秒
+        :param function setter: 写入函数，接受一个参数，即当前缓动值（start_val为元组时为元组）
+        :param function ease_func: 时间缓动函数，默认为TimeEaseFunc.linear
+        :param int fps: 变化帧率，大于0时缓动值按该帧率分段变化，默认为0，即每次更新均按当前时间计算
+        :param function|None on_finish: 缓动结束后调用的函数，无参数，默认为None
+        :param float min_delta: 缓动值与上一次写入的值相差超过该值时才写入，为元组时取各分量中的最大差值，默认为0.0，即只要变化就写入
+
+        :return: 缓动ID，可用于cancel()
+        :rtype: int
+        """
+        tw = self._pool.pop() if self._pool else _Tween()
+        tw.tween_id = tween_id = next(self._ids)
+        tw.vector = isinstance(start_val, (tuple, list))
+        if tw.vector:
+            tw.start = tuple(start_val)
+            tw.end = tuple(end_val)
+            tw.diff = tuple(e - s for s, e in zip(tw.start, tw.end))
+        else:
+            tw.start = start_val
+            tw.end = end_val
+            tw.diff = end_val - start_val
+        tw.total_tm = total_tm
+        tw.step = 1.0 / fps if fps > 0 else 0.0
+        tw.func = ease_func
+        tw.setter = setter
+        tw.on_finish = on_finish
+        tw.min_delta = min_delta
+        tw.start_tm = None
+        tw.last = None
+        self._active.append(tw)
+        self._index[tween_id] = tw
+        return tween_id
+
+    def add_ease(self, ease, setter, on_finish=None, min_delta=0.0):
+        """
+        | 添加一个由TimeEase对象描述的缓动，使用其初始值、最终值、总时间、帧率与缓动函数，由管理器统一推进，无需再迭代该对象。
+
+        -----
+
+        :param TimeEase ease: 时间缓动对象
+        :param function setter: 写入函数，接受一个参数，即当前缓动值
+        :param function|None on_finish: 缓动结束后调用的函数，无参数，默认为None
+        :param float min_delta: 缓动值与上一次写入的值相差超过该值时才写入，默认为0.0
+
+        :return: 缓动ID，可用于cancel()
+        :rtype: int
+        """
+        return self.add(
+            ease.start_val, ease.end_val, ease.total_tm, setter, ease.ease_func, ease.fps, on_finish, min_delta
+        )
+
+    def cancel(self, tween_id, finish=False):
+        """
+        | 取消缓动。
+
+        -----
+
+        :param int tween_id: 缓动ID
+        :param bool finish: 是否立即写入最终值并调用on_finish，默认为False
+
+        :return: 是否成功，缓动不存在或已结束时返回False
+        :rtype: bool
+        """
+        tw = self._index.pop(tween_id, None)
+        if not tw:
+            return False
+        # 只做标记，记录在下一次update()时移出并回收，因此可在setter或on_finish中调用
+        tw.tween_id = None
+        setter, end, on_finish = tw.setter, tw.end, tw.on_finish
+        if finish:
+            setter(end)
+            if on_finish:
+                on_finish()
+        return True
+
+    def clear(self):
+        """
+        | 取消所有缓动。
+
+        -----
+
+        :return: 无
+        :rtype: None
+        """
+        for tw in self._active:
+            tw.tween_id = None
+        self._index.clear()
+
+    def is_active(self, tween_id):
+        """
+        | 判断缓动是否正在进行。
+
+        -----
+
+        :param int tween_id: 缓动ID
+
+        :return: 是否正在进行
+        :rtype: bool
+        """
+        return tween_id in self._index
+
+    def _recycle(self, tw):
+        tw.setter = tw.on_finish = tw.func = tw.last = None
+        if len(self._pool) < self.pool_size:
+            self._pool.append(tw)
+
+    def update(self, now=None):
+        """
+        | 推进所有缓动，并写入发生变化的缓动值。每帧调用一次。
+
+        -----
+
+        :param float|None now: 当前时间戳，默认为None，即使用time.time()
+
+        :return: 本次写入的数量
+        :rtype: int
+        """
+        active = self._active
+        if not active:
+            return 0
+        begin = _time()
+        if now is None:
+            now = begin
+        writes = 0
+        skipped = 0
+        finished = None
+        # 只遍历本次开始前已添加的缓动，setter或on_finish中添加的缓动从下一次开始推进
+        n = len(active)
+        for i in xrange(n):
+            tw = active[i]
+            if tw.tween_id is None:
+                # 已取消
+                if finished is None:
+                    finished = []
+                finished.append(tw)
+                continue
+            start_tm = tw.start_tm
+            if start_tm is None:
+                tw.start_tm = start_tm = now
+            elapsed = now - start_tm
+            if tw.step:
+                elapsed -= elapsed % tw.step
+            x = elapsed / tw.total_tm if tw.total_tm > 0 else 1.0
+            if x >= 1:
+                # 结束时直接写入最终值，避免缓动函数在端点的浮点误差
+                value = tw.end
+                if finished is None:
+                    finished = []
+                finished.append(tw)
+            else:
+                e = tw.func(x)
+                if tw.vector:
+                    value = tuple([s + e * d for s, d in zip(tw.start, tw.diff)])
+                else:
+                    value = tw.start + e * tw.diff
+            last = tw.last
+            if last is not None:
+                if tw.min_delta and x < 1:
+                    if tw.vector:
+                        delta = max([abs(a - b) for a, b in zip(value, last)])
+                    else:
+                        delta = abs(value - last)
+                    if delta <= tw.min_delta:
+                        skipped += 1
+                        continue
+                elif value == last:
+                    skipped += 1
+                    continue
+            tw.last = value
+            tw.setter(value)
+            writes += 1
+        if finished:
+            index = self._index
+            done = set(finished)
+            # 重新读取self._active，包含本次遍历中新添加的缓动
+            self._active = [tw for tw in self._active if tw not in done]
+            for tw in finished:
+                on_finish = None
+                if tw.tween_id is not None:
+                    del index[tw.tween_id]
+                    on_finish = tw.on_finish
+                self._recycle(tw)
+                if on_finish:
+                    on_finish()
+        self._writes += writes
+        self._skipped += skipped
+        self._frames += 1
+        cost = _time() - begin
+        self._last_cost = cost
+        self._total_cost += cost
+        if cost > self._max_cost:
+            self._max_cost = cost
+        return writes
+
+    def get_stats(self):
+        """
+        | 获取管理器的统计数据。
+
+        -----
+
+        :return: 统计字典，包含active（进行中的缓动数）、pooled（对象池中的记录数）、frames（有缓动时的更新次数）、writes（写入次数）、skipped（值未变化而跳过的写入次数）、last_cost、avg_cost、max_cost（每帧耗时，单位为毫秒）
+        :rtype: dict[str,int|float]
+        """
+        frames = self._frames
+        return {
+            'active': len(self._index),
+            'pooled': len(self._pool),
+            'frames': frames,
+            'writes': self._writes,
+            'skipped': self._skipped,
+            'last_cost': self._last_cost * 1000,
+            'avg_cost': self._total_cost / frames * 1000 if frames else 0.0,
+            'max_cost': self._max_cost * 1000,
+        }
+
+    def reset_stats(self):
+        """
+        | 重置统计数据。
+
+        -----
+
+        :return: 无
+        :rtype: None
+        """
+        self._frames = self._writes = self._skipped = 0
+        self._last_cost = self._total_cost = self._max_cost = 0.0
+
+
 
 
 
@@ -12,15 +12,18 @@
 #   Author        : 诺言Nuoyan
 #   Email         : 1279735247@qq.com
 #   Gitee         : https://gitee.com/charming-lee
-#   Last Modified : 2025-01-29
+#   Last Modified : 2026-10-18
 #
 # ====================================================
 
 
-from typing import Callable
+from typing import Callable, Optional, Union, Tuple, List, Dict, Iterator, Any
+from array import array
+from collections import OrderedDict
 
 
 _TEType = Callable[[float], float]
+_Value = Union[float, Tuple[float, ...]]
 
 
 class TimeEaseFunc:
@@ -58,6 +61,13 @@ class TimeEaseFunc:
     in_out_elastic: _TEType
 
 
+_lut_cache: OrderedDict[Tuple[_TEType, int], _TEType]
+_MAX_CACHED_LUTS: int
+
+
+def ease_lut(func: _TEType, resolution: int = 256) -> _TEType: ...
+
+
 class TimeEase(object):
     start_val: float
     end_val: float
@@ -65,6 +75,7 @@ class TimeEase(object):
     hold_on_last_frame: bool
     fps: int
     ease_func: _TEType
+    time_func: Callable[[], float]
     _init_tm: float
     _frame: int
     _total_frame: int
@@ -78,7 +89,66 @@ class TimeEase(object):
         fps: int = 0,
         hold_on_last_frame: bool = False,
         ease_func: _TEType = TimeEaseFunc.linear,
+        time_func: Optional[Callable[[], float]] = None,
     ) -> None: ...
     def __iter__(self) -> None: ...
     def next(self) -> None: ...
+    def sample(self, t: float) -> float: ...
+    def sample_n(self, n: int) -> array: ...
     def reset(self) -> None: ...
+
+
+class _Tween(object):
+    tween_id: Optional[int]
+    start: _Value
+    diff: _Value
+    end: _Value
+    total_tm: float
+    step: float
+    func: Optional[_TEType]
+    setter: Optional[Callable[[_Value], None]]
+    on_finish: Optional[Callable[[], None]]
+    min_delta: float
+    vector: bool
+    start_tm: Optional[float]
+    last: Optional[_Value]
+
+
+class TimeEaseManager(object):
+    pool_size: int
+    _active: List[_Tween]
+    _index: Dict[int, _Tween]
+    _pool: List[_Tween]
+    _ids: Iterator[int]
+    _frames: int
+    _writes: int
+    _skipped: int
+    _last_cost: float
+    _total_cost: float
+    _max_cost: float
+    def __init__(self, pool_size: int = 256) -> None: ...
+    def add(
+        self,
+        start_val: Union[float, Tuple[float, ...], List[float]],
+        end_val: Union[float, Tuple[float, ...], List[float]],
+        total_tm: float,
+        setter: Callable[[_Value], None],
+        ease_func: _TEType = TimeEaseFunc.linear,
+        fps: int = 0,
+        on_finish: Optional[Callable[[], None]] = None,
+        min_delta: float = 0.0,
+    ) -> int: ...
+    def add_ease(
+        self,
+        ease: TimeEase,
+        setter: Callable[[float], None],
+        on_finish: Optional[Callable[[], None]] = None,
+        min_delta: float = 0.0,
+    ) -> int: ...
+    def cancel(self, tween_id: int, finish: bool = False) -> bool: ...
+    def clear(self) -> None: ...
+    def is_active(self, tween_id: int) -> bool: ...
+    def _recycle(self, tw: _Tween) -> None: ...
+    def update(self, now: Optional[float] = None) -> int: ...
+    def get_stats(self) -> Dict[str, Union[int, float]]: ...
+    def reset_stats(self) -> None: ...
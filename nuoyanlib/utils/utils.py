@@ -12,7 +12,7 @@
 #   Author        : 诺言Nuoyan
 #   Email         : 1279735247@qq.com
 #   Gitee         : https://gitee.com/charming-lee
-#   Last Modified : 2024-07-02
+#   Last Modified : 2026-10-18
 #
 # ====================================================
 
@@ -42,7 +42,7 @@ def _get_lib_system():
     return get_lib_system()
 
 
-def add_condition_to_func(cond, func, freq=1):
+def add_condition_to_func(cond, func, freq=1, offset=-1):
     """
     | 为指定函数添加一个条件，当条件发生变化时，自动执行一次函数。例如，当条件由 ``True`` 变化到 ``False``，或由 ``False`` 变化到 ``True`` 时，都会执行一次指定函数。
 
@@ -51,6 +51,7 @@ def add_condition_to_func(cond, func, freq=1):
     :param function cond: 条件函数，无参数，需要返回一个bool，当返回的bool（即条件）发生变化时，自动执行一次func
     :param function func: 条件发生变化时执行的函数，该函数需要接受一个类型为bool的参数，即当前的条件状态（cond的返回值）
     :param int freq: 条件判断频率，单位为tick，默认为1，即每1tick判断一次，小于1的值会被视为1
+    :param int offset: 判断时机的相位偏移，单位为tick，取值范围为[0, freq)，超出范围的值会对freq取余；默认为-1，表示根据ID自动错开，避免大量同频率的条件在同一tick集中判断
 
     :return: 返回一个int型ID，后续可用该ID移除添加的条件和函数，添加失败时返回-1
     :rtype: int
@@ -59,7 +60,7 @@ def add_condition_to_func(cond, func, freq=1):
     lib_sys = _get_lib_system()
     if not lib_sys:
         return -1
-    return lib_sys.add_condition_to_func(cond, func, freq)
+    return lib_sys.add_condition_to_func(cond, func, freq, int(offset))
 
 
 def remove_condition_to_func(cond_id):
@@ -12,7 +12,7 @@
 #   Author        : 诺言Nuoyan
 #   Email         : 1279735247@qq.com
 #   Gitee         : https://gitee.com/charming-lee
-#   Last Modified : 2024-07-02
+#   Last Modified : 2026-10-18
 #
 # ====================================================
 
@@ -20,7 +20,12 @@
 from typing import Sequence, Any, List, Callable
 
 
-def add_condition_to_func(cond: Callable[[], bool], func: Callable[[bool], Any], interval: int = 1) -> int: ...
+def add_condition_to_func(
+    cond: Callable[[], bool],
+    func: Callable[[bool], Any],
+    freq: int = 1,
+    offset: int = -1,
+) -> int: ...
 def remove_condition_to_func(cond_id: int) -> bool: ...
 def all_indexes(seq: Sequence, *elements: Any) -> List[int]: ...
 def check_string(string: str, *check: str) -> bool: ...
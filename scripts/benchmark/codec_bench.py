@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+# ====================================================
+#
+#   Copyright (c) 2023 Nuoyan
+#   nuoyanlib is licensed under Mulan PSL v2.
+#   You can use this software according to the terms and conditions of the Mulan PSL v2.
+#   You may obtain a copy of Mulan PSL v2 at:
+#            http://license.coscl.org.cn/MulanPSL2
+#   THIS SOFTWARE IS PROVIDED ON AN AS IS BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY OR FIT FOR A PARTICULAR PURPOSE.
+#   See the Mulan PSL v2 for more details.
+#
+#   Author        : 诺言Nuoyan
+#   Email         : 1279735247@qq.com
+#   Gitee         : https://gitee.com/charming-lee
+#   Last Modified : 2026-10-18
+#
+# ====================================================
+
+
+"""
+跨端调用紧凑编码的数据量基准测试，在本地ModSDK替身（scripts/mock）上运行，无需启动游戏。
+分别在关闭与开启COMPACT_CALL_CODEC时发起典型的跨端调用，输出每次调用（含返回）的平均字节数。
+字节数按替身中消息的repr长度统计，与真实引擎的序列化结果不同，但可反映相对差异。
+
+用法：python codec_bench.py [重复次数]
+"""
+
+
+import os
+import sys
+
+
+root_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# nuoyanlib根据__file__推导自身的导入路径，因此需要在仓库根目录下以相对路径导入
+os.chdir(root_path)
+sys.path[0:0] = ["", os.path.join("scripts", "mock")]
+
+
+import mod.engine as engine
+
+
+NAMESPACE = "NuoyanLibBench"
+SERVER_SYSTEM_NAME = "BenchServerSystem"
+CLIENT_SYSTEM_NAME = "BenchClientSystem"
+
+
+def make_items(n):
+    return [
+        {
+            'newItemName': "minecraft:diamond_sword",
+            'newAuxValue': 0,
+            'count': 1,
+            'enchantData': [(9, 5)],
+            'modEnchantData': [],
+            'customTips': "",
+            'extraId': "",
+            'userData': None,
+            'durability': 1561,
+            'showInHand': True,
+        }
+        for _ in range(n)
+    ]
+
+
+def setup():
+    engine.reset()
+    engine.set_side("client")
+    player = engine.add_player((0, 64, 0))
+    from nuoyanlib.client import NuoyanClientSystem
+    from nuoyanlib.utils import rpc
+
+    class BenchClientSystem(NuoyanClientSystem):
+        def get_inventory(self):
+            return make_items(36)
+
+    engine.world.systems[("client", NAMESPACE, CLIENT_SYSTEM_NAME)] = BenchClientSystem(
+        NAMESPACE, CLIENT_SYSTEM_NAME
+    )
+    engine.set_side("server")
+    from nuoyanlib.server import NuoyanServerSystem
+
+    class BenchServerSystem(NuoyanServerSystem):
+        @rpc
+        def put_item(self, item):
+            return True
+
+    engine.world.systems[("server", NAMESPACE, SERVER_SYSTEM_NAME)] = BenchServerSystem(
+        NAMESPACE, SERVER_SYSTEM_NAME
+    )
+    engine.tick()
+    return player
+
+
+def set_codec(enable):
+    from nuoyanlib._core._codec import CALL_CODEC_KEYS
+    from nuoyanlib._core._server._lib_server import get_lib_system as get_server_lib
+    from nuoyanlib._core._client._lib_client import get_lib_system as get_client_lib
+    server_lib = get_server_lib()
+    client_lib = get_client_lib()
+    server_lib._compact_codec = client_lib._compact_codec = enable
+    server_lib.set_codec_keys(CALL_CODEC_KEYS if enable else ())
+    client_lib.set_codec_keys(())
+    server_lib._codec_players.clear()
+    # 重新交换调用表与键表
+    engine.fire_event("UiInitFinished", {}, "client")
+    engine.tick(3)
+
+
+def measure(func, repeat):
+    stats = engine.get_stats()
+    for _ in range(repeat):
+        func()
+        # 一次往返需要三个tick：发出、对端回复、回复送达
+        engine.tick(3)
+    new_stats = engine.get_stats()
+    total = sum(new_stats[k] - stats[k] for k in ('bytes_to_client', 'bytes_to_server'))
+    return total / float(repeat)
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    player = setup()
+    from nuoyanlib.utils import call
+    results = []
+    cb = results.append
+    item = make_items(1)[0]
+
+    def get_inventory():
+        call(NAMESPACE, CLIENT_SYSTEM_NAME, "get_inventory", player, cb)
+
+    def put_item():
+        with engine.on_side("client"):
+            call(NAMESPACE, SERVER_SYSTEM_NAME, "put_item", callback=cb, args=(item,))
+
+    cases = [
+        ("s->c get_inventory (36 items)", get_inventory),
+        ("c->s put_item (1 item, @rpc)", put_item),
+    ]
+    print "%-36s %12s %12s %10s" % ("case", "plain B/call", "codec B/call", "saved")
+    for name, func in cases:
+        set_codec(False)
+        plain = measure(func, repeat)
+        set_codec(True)
+        compact = measure(func, repeat)
+        print "%-36s %12.1f %12.1f %9.1f%%" % (name, plain, compact, (1 - compact / plain) * 100)
+    print
+    print "callbacks: %d, ok: %d" % (len(results), sum(1 for i in results if i['success']))
+
+
+if __name__ == "__main__":
+    main()
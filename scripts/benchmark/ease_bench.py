@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+# ====================================================
+#
+#   Copyright (c) 2023 Nuoyan
+#   nuoyanlib is licensed under Mulan PSL v2.
+#   You can use this software according to the terms and conditions of the Mulan PSL v2.
+#   You may obtain a copy of Mulan PSL v2 at:
+#            http://license.coscl.org.cn/MulanPSL2
+#   THIS SOFTWARE IS PROVIDED ON AN AS IS BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY OR FIT FOR A PARTICULAR PURPOSE.
+#   See the Mulan PSL v2 for more details.
+#
+#   Author        : 诺言Nuoyan
+#   Email         : 1279735247@qq.com
+#   Gitee         : https://gitee.com/charming-lee
+#   Last Modified : 2026-10-18
+#
+# ====================================================
+"""
+时间缓动函数的基准测试，无需启动游戏。
+对比TimeEaseFunc中每条曲线的解析版本与ease_lut制表版本每秒可计算的次数，并给出制表版本的最大误差。
+分别测试直接调用函数与通过TimeEaseManager推进两种情况。
+
+用法：python ease_bench.py [分辨率] [每条曲线的取样次数] [TimeEaseManager中的缓动数量]
+"""
+
+
+import os
+import sys
+import time
+
+
+root_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# nuoyanlib根据__file__推导自身的导入路径，因此需要在仓库根目录下以相对路径导入
+os.chdir(root_path)
+sys.path[0:0] = ["", os.path.join("scripts", "mock")]
+
+
+from nuoyanlib.utils.time_ease import TimeEaseFunc, TimeEaseManager, ease_lut
+
+
+CURVES = [
+    "linear", "spring",
+    "in_quad", "out_quad", "in_out_quad",
+    "in_cubic", "out_cubic", "in_out_cubic",
+    "in_quart", "out_quart", "in_out_quart",
+    "in_quint", "out_quint", "in_out_quint",
+    "in_sine", "out_sine", "in_out_sine",
+    "in_expo", "out_expo", "in_out_expo",
+    "in_circ", "out_circ", "in_out_circ",
+    "in_bounce", "out_bounce", "in_out_bounce",
+    "in_back", "out_back", "in_out_back",
+    "in_elastic", "out_elastic", "in_out_elastic",
+]
+
+
+REPEAT = 3
+
+
+def samples_per_sec(func, xs):
+    best = None
+    for _ in range(REPEAT):
+        t = time.time()
+        for x in xs:
+            func(x)
+        cost = time.time() - t
+        if best is None or cost < best:
+            best = cost
+    return len(xs) / best
+
+
+def manager_samples_per_sec(func, tweens, frames):
+    mgr = TimeEaseManager()
+    setter = lambda v: None
+    for _ in range(tweens):
+        mgr.add(0.0, 1.0, 1.0, setter, func)
+    mgr.update(0.0)
+    best = None
+    for _ in range(REPEAT):
+        t = time.time()
+        for i in range(1, frames):
+            mgr.update(float(i) / frames)
+        cost = time.time() - t
+        if best is None or cost < best:
+            best = cost
+    return tweens * (frames - 1) / best
+
+
+def main():
+    resolution = int(sys.argv[1]) if len(sys.argv) > 1 else 256
+    n = int(sys.argv[2]) if len(sys.argv) > 2 else 200000
+    tweens = int(sys.argv[3]) if len(sys.argv) > 3 else 1000
+    frames = max(2, n // tweens)
+    # 每项取REPEAT次中最快的一次；不含端点的均匀取样，与TimeEase实际传入的值分布相近
+    xs = [(i + 0.5) / n for i in range(n)]
+    print "resolution %d, %d samples per curve" % (resolution, n)
+    print "%-16s %12s %12s %8s %12s %12s %8s %10s" % (
+        "", "call/s", "lut call/s", "speedup", "mgr/s", "lut mgr/s", "speedup", "max error"
+    )
+    for name in CURVES:
+        func = getattr(TimeEaseFunc, name)
+        lut = ease_lut(func, resolution)
+        a = samples_per_sec(func, xs)
+        b = samples_per_sec(lut, xs)
+        c = manager_samples_per_sec(func, tweens, frames)
+        d = manager_samples_per_sec(lut, tweens, frames)
+        print "%-16s %12d %12d %7.2fx %12d %12d %7.2fx %10.6f" % (
+            name, a, b, b / a, c, d, d / c, lut.max_error
+        )
+
+
+if __name__ == "__main__":
+    main()
+
+
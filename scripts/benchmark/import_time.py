@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+# ====================================================
+#
+#   Copyright (c) 2023 Nuoyan
+#   nuoyanlib is licensed under Mulan PSL v2.
+#   You can use this software according to the terms and conditions of the Mulan PSL v2.
+#   You may obtain a copy of Mulan PSL v2 at:
+#            http://license.coscl.org.cn/MulanPSL2
+#   THIS SOFTWARE IS PROVIDED ON AN AS IS BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY OR FIT FOR A PARTICULAR PURPOSE.
+#   See the Mulan PSL v2 for more details.
+#
+#   Author        : 诺言Nuoyan
+#   Email         : 1279735247@qq.com
+#   Gitee         : https://gitee.com/charming-lee
+#   Last Modified : 2026-10-18
+#
+# ====================================================
+
+
+"""
+统计nuoyanlib各子模块的导入耗时。
+每个子模块均在独立的解释器进程中导入，互不影响；默认使用scripts/mock下的ModSDK替身，也可通过PYTHONPATH指定其他实现。
+preloaded列标记导入包本身时已被连带导入的子模块（如库系统依赖的communicate、calculator），这些子模块的导入耗时计入facade，不会因惰性加载而节省。
+最后对比惰性加载（只导入包）与急切加载的基准（导入包后再导入全部子模块，即改为惰性加载之前导入包时的工作量）的耗时。
+
+用法：python import_time.py [server|client] [重复次数]
+"""
+
+
+import os
+import sys
+import subprocess
+
+
+SUBMODULES = {
+    'server': [
+        "nuoyanlib.server.server_system",
+        "nuoyanlib.server.entity",
+        "nuoyanlib.server.hurt",
+        "nuoyanlib.server.inv",
+        "nuoyanlib.server.structure",
+    ],
+    'client': [
+        "nuoyanlib.client.client_system",
+        "nuoyanlib.client.effect",
+        "nuoyanlib.client.player",
+        "nuoyanlib.client.setting",
+        "nuoyanlib.client.sound",
+        "nuoyanlib.client.render",
+        "nuoyanlib.client.camera",
+    ],
+}
+UTILS_SUBMODULES = [
+    "nuoyanlib.utils.calculator",
+    "nuoyanlib.utils.enum",
+    "nuoyanlib.utils.item",
+    "nuoyanlib.utils.mc_random",
+    "nuoyanlib.utils.utils",
+    "nuoyanlib.utils.vector",
+    "nuoyanlib.utils.time_ease",
+    "nuoyanlib.utils.communicate",
+]
+MEASURE_CODE = """
+import sys
+from time import time
+try:
+    import mod.engine
+    mod.engine.set_side(%(side)r)
+    mod.engine.add_player()
+except ImportError:
+    pass
+t = time()
+import %(pkg)s
+t1 = time()
+preloaded = %(name)r in sys.modules
+%(stmt)s
+t2 = time()
+sys.stdout.write("%%f %%f %%d" %% (t1 - t, t2 - t1, preloaded))
+"""
+
+
+root_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+mock_path = os.path.join(root_path, "scripts", "mock")
+
+
+def measure(side, pkg, stmt, repeat, name=""):
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [env.get('PYTHONPATH'), mock_path]))
+    env['PYTHONDONTWRITEBYTECODE'] = "1"
+    pkg_costs = []
+    stmt_costs = []
+    preloaded = False
+    for _ in range(repeat):
+        out = subprocess.check_output(
+            [sys.executable, "-c", MEASURE_CODE % {'side': side, 'pkg': pkg, 'stmt': stmt, 'name': name}],
+            env=env, stderr=open(os.devnull, "w"), cwd=root_path, # nuoyanlib需以相对路径导入
+        )
+        pkg_cost, stmt_cost, preloaded = out.split()[-3:]
+        pkg_costs.append(float(pkg_cost))
+        stmt_costs.append(float(stmt_cost))
+    return min(pkg_costs) * 1000, min(stmt_costs) * 1000, preloaded == "1"
+
+
+def main():
+    side = sys.argv[1] if len(sys.argv) > 1 else "server"
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    pkg = "nuoyanlib.%s" % side
+    names = SUBMODULES[side] + UTILS_SUBMODULES
+    print "%-40s %12s %12s %10s" % ("submodule", "facade(ms)", "import(ms)", "preloaded")
+    for name in names:
+        pkg_cost, cost, preloaded = measure(side, pkg, "import %s" % name, repeat, name)
+        print "%-40s %12.2f %12.2f %10s" % (name, pkg_cost, cost, "yes" if preloaded else "")
+    pkg_cost, cost, _ = measure(side, pkg, "from %s import *" % pkg, repeat)
+    print "%-40s %12.2f %12.2f" % ("from %s import *" % pkg, pkg_cost, cost)
+    lazy_cost, eager_rest, _ = measure(side, pkg, "\n".join("import %s" % n for n in names), repeat)
+    eager_cost = lazy_cost + eager_rest
+    print
+    print "%-52s %8.2f ms" % ("lazy  (import %s only)" % pkg, lazy_cost)
+    print "%-52s %8.2f ms" % ("eager (import %s + all submodules)" % pkg, eager_cost)
+    print "%-52s %8.2f ms (%.0f%%)" % (
+        "saved by lazy loading", eager_cost - lazy_cost, (eager_cost - lazy_cost) / eager_cost * 100 if eager_cost else 0
+    )
+
+
+if __name__ == "__main__":
+    main()
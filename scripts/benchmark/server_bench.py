@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+# ====================================================
+#
+#   Copyright (c) 2023 Nuoyan
+#   nuoyanlib is licensed under Mulan PSL v2.
+#   You can use this software according to the terms and conditions of the Mulan PSL v2.
+#   You may obtain a copy of Mulan PSL v2 at:
+#            http://license.coscl.org.cn/MulanPSL2
+#   THIS SOFTWARE IS PROVIDED ON AN AS IS BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY OR FIT FOR A PARTICULAR PURPOSE.
+#   See the Mulan PSL v2 for more details.
+#
+#   Author        : 诺言Nuoyan
+#   Email         : 1279735247@qq.com
+#   Gitee         : https://gitee.com/charming-lee
+#   Last Modified : 2026-10-18
+#
+# ====================================================
+
+
+"""
+服务端热点接口的基准测试，在本地ModSDK替身（scripts/mock）上运行，无需启动游戏。
+世界中默认生成10000个实体与若干玩家，输出每次调用的平均耗时、组件创建次数、引擎接口调用次数与跨端网络包数量。
+替身中引擎接口的开销远低于真实引擎，因此组件创建次数与引擎接口调用次数比耗时更能反映真实环境下的差异。
+
+用法：python server_bench.py [实体数量] [重复次数]
+"""
+
+
+import os
+import sys
+from time import time
+
+
+root_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# nuoyanlib根据__file__推导自身的导入路径，因此需要在仓库根目录下以相对路径导入
+os.chdir(root_path)
+sys.path[0:0] = ["", os.path.join("scripts", "mock")]
+
+
+import mod.engine as engine
+from mod.common.minecraftEnum import EntityType
+
+
+NAMESPACE = "NuoyanLibBench"
+SERVER_SYSTEM_NAME = "BenchServerSystem"
+CLIENT_SYSTEM_NAME = "BenchClientSystem"
+
+
+class BenchServerSystem(engine.ServerSystem):
+    def echo(self, x):
+        return x
+
+
+class BenchClientSystem(engine.ClientSystem):
+    def echo(self, x):
+        return x
+
+
+def setup(entity_count):
+    engine.reset()
+    engine.set_side("client")
+    player = engine.add_player((0, 64, 0))
+    for i in range(7):
+        engine.add_player((i * 10, 64, 0))
+    engine.spawn_entities(entity_count // 2, "minecraft:zombie", spread=512, etype=EntityType.Zombie, seed=1)
+    engine.spawn_entities(entity_count // 4, "minecraft:pig", spread=512, etype=EntityType.Pig, seed=2)
+    engine.spawn_entities(entity_count // 4, "minecraft:item", spread=512, etype=EntityType.ItemEntity, seed=3)
+    import nuoyanlib.client
+    engine.world.systems[("client", NAMESPACE, CLIENT_SYSTEM_NAME)] = BenchClientSystem(NAMESPACE, CLIENT_SYSTEM_NAME)
+    engine.set_side("server")
+    import nuoyanlib.server
+    # 组件池容量需覆盖全部实体，否则全图遍历类接口每次都会淘汰重建
+    nuoyanlib.server.set_entity_comp_cache_size(entity_count + 100)
+    engine.world.systems[("server", NAMESPACE, SERVER_SYSTEM_NAME)] = BenchServerSystem(NAMESPACE, SERVER_SYSTEM_NAME)
+    engine.tick()
+    return player
+
+
+def bench(name, func, repeat):
+    func()
+    stats = engine.get_stats()
+    start = time()
+    for _ in range(repeat):
+        func()
+    cost = (time() - start) / repeat * 1000
+    new_stats = engine.get_stats()
+    comps = (new_stats['comp_created'] - stats['comp_created']) / float(repeat)
+    reads = (new_stats['engine_reads'] - stats['engine_reads']) / float(repeat)
+    packets = sum(new_stats[k] - stats[k] for k in ('packets_to_client', 'packets_to_server')) / float(repeat)
+    print "%-36s %12.4f %12.1f %12.1f %12.1f" % (name, cost, comps, reads, packets)
+    return packets
+
+
+def main():
+    entity_count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    player = setup(entity_count)
+    from nuoyanlib.server import (
+        entity_filter, get_all_entities, get_nearest_entity, aoe_damage, set_items_to_item_grid, update_item_grids,
+    )
+    from nuoyanlib.utils import call
+    from nuoyanlib.server import get_entity_comp_stats
+    all_ents = get_all_entities()
+    print "entities: %d, players: %d" % (len(all_ents), len(engine.world.players))
+    print "%-36s %12s %12s %12s %12s" % ("case", "ms/op", "comps/op", "engine/op", "packets/op")
+    bench("entity_filter (radius+type)", lambda: entity_filter(all_ents, ((0, 64, 0), 100), {EntityType.Mob}), repeat)
+    bench("get_nearest_entity (r=30)", lambda: get_nearest_entity(player, 5, radius=30.0), repeat)
+    bench("aoe_damage (r=20)", lambda: aoe_damage(20, (0, 64, 0), 0, 0.001), repeat)
+
+    from nuoyanlib.server import enable_tick_snapshot, get_tick_snapshot_stats, sector_aoe_damage, attract_entities
+
+    def skills():
+        # 同一tick内多个技能读取同一批实体
+        aoe_damage(20, (0, 64, 0), 0, 0.001)
+        sector_aoe_damage(20, 90, 0.001, attacker_id=player)
+        attract_entities((0, 64, 0), 0, 20, 0.0)
+        get_nearest_entity(player, 5, radius=30.0)
+        engine.tick()
+    bench("4 skills per tick", skills, repeat)
+    # 快照只减少引擎接口调用（engine/op），替身的引擎接口几乎没有开销，此处的耗时不代表真实环境
+    enable_tick_snapshot()
+    bench("4 skills per tick (snapshot, opt-in)", skills, repeat)
+    print "tick snapshot: %s (fewer engine calls, not necessarily faster)" % get_tick_snapshot_stats()
+    enable_tick_snapshot(False)
+
+    from nuoyanlib._core._server._lib_server import get_lib_system
+    lib_sys = get_lib_system()
+    items = [{'newItemName': "minecraft:apple", 'newAuxValue': 0, 'count': 1} for _ in range(36)]
+    # 模拟客户端注册网格，未注册的网格不会同步
+    lib_sys._on_register_item_grid({'__id__': player, 'key': "bench_grid", 'size': 36})
+    assert all(set_items_to_item_grid(player, "bench_grid", items))
+
+    def sync_grid():
+        update_item_grids(player, "bench_grid")
+        # 同步消息合并发送，立即发出以计入本次的网络包
+        lib_sys.flush_msgs()
+    packets = bench("item grid sync (36 slots)", sync_grid, repeat * 10)
+    assert packets > 0, "item grid sync sent no packets"
+    bench("set_items_to_item_grid (36 slots)", lambda: set_items_to_item_grid(player, "bench_grid", items), repeat)
+
+    from nuoyanlib.server import listen_keyed, unlisten_keyed
+    players = list(engine.world.players)
+    hits = []
+    # 每名玩家25个只关心自己的DamageEvent处理器
+    filtered = []
+    for pid in players:
+        for _ in range(25):
+            def on_damage(args, pid=pid):
+                if args['entityId'] == pid:
+                    hits.append(1)
+            filtered.append(on_damage)
+            lib_sys.ListenForEvent(engine.ENGINE_NAMESPACE, engine.ENGINE_SYSTEM_NAME, "DamageEvent", None, on_damage)
+    damage_args = {'entityId': player, 'srcId': "-1", 'damage': 1}
+    bench("DamageEvent x200 handlers (filter)", lambda: engine.fire_event("DamageEvent", damage_args), repeat * 10)
+    for on_damage in filtered:
+        lib_sys.UnListenForEvent(engine.ENGINE_NAMESPACE, engine.ENGINE_SYSTEM_NAME, "DamageEvent", None, on_damage)
+    keyed = []
+    for pid in players:
+        for _ in range(25):
+            on_damage = lambda args: hits.append(1)
+            keyed.append((pid, on_damage))
+            listen_keyed("DamageEvent", "entityId", pid, on_damage)
+    bench("DamageEvent x200 handlers (keyed)", lambda: engine.fire_event("DamageEvent", damage_args), repeat * 10)
+    for pid, on_damage in keyed:
+        unlisten_keyed("DamageEvent", "entityId", pid, on_damage)
+
+    results = []
+    cb = results.append
+    bench("call s->s", lambda: call(NAMESPACE, SERVER_SYSTEM_NAME, "echo", callback=cb, args=(1,)), repeat * 100)
+
+    def s2c():
+        call(NAMESPACE, CLIENT_SYSTEM_NAME, "echo", player, cb, args=(1,))
+        engine.tick()
+    del results[:]
+    bench("call s->c round trip (1 tick)", s2c, repeat * 10)
+
+    def s2c_burst():
+        for i in range(10):
+            call(NAMESPACE, CLIENT_SYSTEM_NAME, "echo", player, cb, args=(i,))
+        engine.tick()
+    bench("call s->c x10 round trip (1 tick)", s2c_burst, repeat * 10)
+
+    from nuoyanlib.utils import call_batch
+    batch = [(NAMESPACE, CLIENT_SYSTEM_NAME, "echo", (i,)) for i in range(10)]
+
+    def s2c_batch():
+        call_batch(batch, cb, player)
+        engine.tick()
+    bench("call_batch s->c x10 (1 tick)", s2c_batch, repeat * 10)
+    engine.tick(2)
+
+    stats = engine.get_stats()
+    print
+    print "entity comp cache: %s" % get_entity_comp_stats()
+    print "keyed routes left: %d" % len(lib_sys._routers)
+    print "callbacks: %d, ok: %d" % (len(results), sum(1 for i in results if i['success']))
+    print "packets s->c: %d (%d bytes), c->s: %d (%d bytes)" % (
+        stats['packets_to_client'], stats['bytes_to_client'], stats['packets_to_server'], stats['bytes_to_server'],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+# ====================================================
+#
+#   Copyright (c) 2023 Nuoyan
+#   nuoyanlib is licensed under Mulan PSL v2.
+#   You can use this software according to the terms and conditions of the Mulan PSL v2.
+#   You may obtain a copy of Mulan PSL v2 at:
+#            http://license.coscl.org.cn/MulanPSL2
+#   THIS SOFTWARE IS PROVIDED ON AN AS IS BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY OR FIT FOR A PARTICULAR PURPOSE.
+#   See the Mulan PSL v2 for more details.
+#
+#   Author        : 诺言Nuoyan
+#   Email         : 1279735247@qq.com
+#   Gitee         : https://gitee.com/charming-lee
+#   Last Modified : 2026-10-18
+#
+# ====================================================
+
+
+"""
+McTimer的基准测试，无需启动游戏。
+同时运行大量重复定时器，对比旧实现（每次启动与每个重复周期都创建一个threading.Timer线程）与当前实现（所有定时器共用一个调度线程）的线程数量与调度抖动。
+抖动为每次执行的实际时间与理想节拍（启动时间 + 间隔 × 次数）之差，旧实现的误差会随执行次数累积。
+
+用法：python timer_bench.py [定时器数量] [间隔秒数] [运行秒数]
+"""
+
+
+import os
+import sys
+import threading
+import time
+
+
+root_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# nuoyanlib根据__file__推导自身的导入路径，因此需要在仓库根目录下以相对路径导入
+os.chdir(root_path)
+sys.path[0:0] = ["", os.path.join("scripts", "mock")]
+
+
+from nuoyanlib.utils.mc_timer import McTimer
+
+
+class LegacyTimer(object):
+    # 旧实现的重复定时器部分
+    def __init__(self, sec, func):
+        self.sec = sec
+        self.func = func
+        self.cancelled = False
+        self.timer = threading.Timer(sec, self._func)
+
+    def _func(self):
+        self.func()
+        if not self.cancelled:
+            self.timer = threading.Timer(self.sec, self._func)
+            self.timer.start()
+
+    def Start(self):
+        self.timer.start()
+        return self
+
+    def Cancel(self):
+        self.cancelled = True
+        self.timer.cancel()
+
+
+def run(make_timer, count, sec, duration, base_threads):
+    lateness = []
+    lock = threading.Lock()
+    timers = []
+
+    def make_func(start):
+        fired = [0]
+        def func():
+            now = time.time()
+            fired[0] += 1
+            with lock:
+                lateness.append(now - (start + sec * fired[0]))
+        return func
+
+    for _ in range(count):
+        timers.append(make_timer(sec, make_func(time.time())).Start())
+    peak = 0
+    end = time.time() + duration
+    while time.time() < end:
+        peak = max(peak, threading.active_count() - base_threads)
+        time.sleep(0.01)
+    for t in timers:
+        t.Cancel()
+    time.sleep(sec * 2)
+    # 等待旧实现的线程全部退出，避免计入下一轮；McTimer的调度线程常驻，最多保留一个
+    wait_end = time.time() + 5
+    while threading.active_count() > base_threads + 1 and time.time() < wait_end:
+        time.sleep(0.01)
+    with lock:
+        lateness.sort()
+        n = len(lateness)
+        if not n:
+            return peak, 0, 0.0, 0.0, 0.0
+        return peak, n, sum(lateness) / n * 1000, lateness[int(n * 0.95)] * 1000, lateness[-1] * 1000
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    sec = float(sys.argv[2]) if len(sys.argv) > 2 else 0.05
+    duration = float(sys.argv[3]) if len(sys.argv) > 3 else 3.0
+    # 在任何定时器启动之前取基准线程数
+    base_threads = threading.active_count()
+    print "%d repeating timers, interval %.3fs, %.1fs" % (count, sec, duration)
+    print "%-8s %12s %10s %14s %14s %14s" % ("impl", "peak threads", "fires", "avg late(ms)", "p95 late(ms)", "max late(ms)")
+    for name, make_timer in (
+        ("legacy", LegacyTimer),
+        ("McTimer", lambda s, f: McTimer("r", s, f)),
+    ):
+        print "%-8s %12d %10d %14.2f %14.2f %14.2f" % ((name,) + run(make_timer, count, sec, duration, base_threads))
+
+
+if __name__ == "__main__":
+    main()
+
+
+
+
+
+
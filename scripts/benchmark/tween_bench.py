@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+# ====================================================
+#
+#   Copyright (c) 2023 Nuoyan
+#   nuoyanlib is licensed under Mulan PSL v2.
+#   You can use this software according to the terms and conditions of the Mulan PSL v2.
+#   You may obtain a copy of Mulan PSL v2 at:
+#            http://license.coscl.org.cn/MulanPSL2
+#   THIS SOFTWARE IS PROVIDED ON AN AS IS BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY OR FIT FOR A PARTICULAR PURPOSE.
+#   See the Mulan PSL v2 for more details.
+#
+#   Author        : 诺言Nuoyan
+#   Email         : 1279735247@qq.com
+#   Gitee         : https://gitee.com/charming-lee
+#   Last Modified : 2026-10-18
+#
+# ====================================================
+"""
+TimeEaseManager的基准测试，无需启动游戏。
+模拟界面中同时进行的大量动画，对比逐个迭代TimeEase并每帧写入（每个缓动每帧读取一次时间）与使用TimeEaseManager统一推进（每帧读取一次时间，值不变时不写入）的每帧耗时与写入次数。
+动画的时长在0.5秒至1.5秒之间，结束后停在最后一帧，写入函数模拟控件接口调用的开销。
+
+用法：python tween_bench.py [动画数量] [运行秒数] [帧率]
+"""
+
+
+import os
+import sys
+import time
+
+
+root_path = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# nuoyanlib根据__file__推导自身的导入路径，因此需要在仓库根目录下以相对路径导入
+os.chdir(root_path)
+sys.path[0:0] = ["", os.path.join("scripts", "mock")]
+
+
+from nuoyanlib.utils.time_ease import TimeEase, TimeEaseFunc, TimeEaseManager
+
+
+class FakeControl(object):
+    # 模拟控件，SetAlpha的开销近似一次引擎接口调用
+    def __init__(self):
+        self.alpha = 0.0
+        self.writes = 0
+
+    def SetAlpha(self, alpha):
+        self.writes += 1
+        self.alpha = float(alpha)
+
+
+def make_anims(n):
+    return [(0.5 + (i % 11) / 10.0, FakeControl()) for i in range(n)]
+
+
+def run_legacy(n, duration, fps):
+    anims = make_anims(n)
+    eases = [
+        (TimeEase(0.0, 1.0, tm, hold_on_last_frame=True, ease_func=TimeEaseFunc.out_cubic), ctrl)
+        for tm, ctrl in anims
+    ]
+    costs = []
+    end = time.time() + duration
+    while time.time() < end:
+        t = time.time()
+        for ease, ctrl in eases:
+            ctrl.SetAlpha(next(ease))
+        costs.append(time.time() - t)
+        time.sleep(1.0 / fps)
+    return costs, sum(ctrl.writes for _, ctrl in anims)
+
+
+def run_manager(n, duration, fps):
+    anims = make_anims(n)
+    mgr = TimeEaseManager()
+    for tm, ctrl in anims:
+        mgr.add(0.0, 1.0, tm, ctrl.SetAlpha, TimeEaseFunc.out_cubic)
+    costs = []
+    end = time.time() + duration
+    while time.time() < end:
+        t = time.time()
+        mgr.update()
+        costs.append(time.time() - t)
+        time.sleep(1.0 / fps)
+    return costs, sum(ctrl.writes for _, ctrl in anims)
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    duration = float(sys.argv[2]) if len(sys.argv) > 2 else 2.0
+    fps = int(sys.argv[3]) if len(sys.argv) > 3 else 60
+    print "%d animations, %.1fs at %d fps" % (n, duration, fps)
+    print "%-16s %8s %10s %14s %14s" % ("", "frames", "writes", "avg ms/frame", "max ms/frame")
+    for name, func in (("TimeEase", run_legacy), ("TimeEaseManager", run_manager)):
+        costs, writes = func(n, duration, fps)
+        print "%-16s %8d %10d %14.3f %14.3f" % (
+            name, len(costs), writes, sum(costs) / len(costs) * 1000, max(costs) * 1000
+        )
+
+
+if __name__ == "__main__":
+    main()
+
+
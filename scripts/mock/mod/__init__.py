@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+# ====================================================
+#
+#   Copyright (c) 2023 Nuoyan
+#   nuoyanlib is licensed under Mulan PSL v2.
+#   You can use this software according to the terms and conditions of the Mulan PSL v2.
+#   You may obtain a copy of Mulan PSL v2 at:
+#            http://license.coscl.org.cn/MulanPSL2
+#   THIS SOFTWARE IS PROVIDED ON AN AS IS BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY OR FIT FOR A PARTICULAR PURPOSE.
+#   See the Mulan PSL v2 for more details.
+#
+#   Author        : 诺言Nuoyan
+#   Email         : 1279735247@qq.com
+#   Gitee         : https://gitee.com/charming-lee
+#   Last Modified : 2026-10-18
+#
+# ====================================================
+
+
+"""
+ModSDK引擎的本地替身，用于在游戏外（如普通Linux环境）运行nuoyanlib进行基准测试与回归测试。
+仅模拟nuoyanlib用到的接口，不追求与引擎行为完全一致。
+
+用法：将scripts/mock目录加入sys.path后即可导入mod，通过mod.engine控制模拟世界：
+::
+
+    import mod.engine as engine
+    engine.reset()
+    engine.set_side("server")
+    pid = engine.add_player((0, 64, 0))
+    eid = engine.spawn_entity("minecraft:zombie", (5, 64, 5))
+    import nuoyanlib.server as nyl
+    engine.tick(30)
+"""
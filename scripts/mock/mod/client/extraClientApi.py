@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+# ====================================================
+#
+#   Copyright (c) 2023 Nuoyan
+#   nuoyanlib is licensed under Mulan PSL v2.
+#   You can use this software according to the terms and conditions of the Mulan PSL v2.
+#   You may obtain a copy of Mulan PSL v2 at:
+#            http://license.coscl.org.cn/MulanPSL2
+#   THIS SOFTWARE IS PROVIDED ON AN AS IS BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY OR FIT FOR A PARTICULAR PURPOSE.
+#   See the Mulan PSL v2 for more details.
+#
+#   Author        : 诺言Nuoyan
+#   Email         : 1279735247@qq.com
+#   Gitee         : https://gitee.com/charming-lee
+#   Last Modified : 2026-10-18
+#
+# ====================================================
+
+
+from .. import engine as _engine
+
+
+_ui = {}
+
+
+def GetLevelId():
+    return _engine.LEVEL_ID
+
+
+def GetLocalPlayerId():
+    # 仅在客户端运行时返回本地玩家ID，nuoyanlib据此判断当前运行环境
+    if _engine.world.side != "client":
+        return "-1"
+    return _engine.world.local_player_id
+
+
+def GetEngineCompFactory():
+    return _engine.comp_factory
+
+
+def GetClientSystemCls():
+    return _engine.ClientSystem
+
+
+def GetSystem(nameSpace, systemName):
+    return _engine.world.systems.get(("client", nameSpace, systemName))
+
+
+def RegisterSystem(nameSpace, systemName, clsPath):
+    return _engine.world.register_system("client", nameSpace, systemName, clsPath)
+
+
+def GetEngineNamespace():
+    return _engine.ENGINE_NAMESPACE
+
+
+def GetEngineSystemName():
+    return _engine.ENGINE_SYSTEM_NAME
+
+
+def GetPlayerList():
+    return list(_engine.world.players)
+
+
+def GetEngineActor():
+    return {
+        eid: {'dimensionId': ent.dim, 'identifier': ent.type_str}
+        for eid, ent in _engine.world.entities.items()
+        if not ent.is_player
+    }
+
+
+def GetDirFromRot(rot):
+    return _engine.dir_from_rot(rot)
+
+
+def GetRotFromDir(direction):
+    return _engine.rot_from_dir(direction)
+
+
+def GetScreenNodeCls():
+    return _engine.ScreenNode
+
+
+def GetViewBinderCls():
+    return _engine.ViewBinder
+
+
+def GetViewViewRequestCls():
+    return _engine.ViewRequest
+
+
+def RegisterUI(namespace, uiKey, clsPath, uiScreenDef):
+    return True
+
+
+def CreateUI(namespace, uiKey, createParams=None):
+    node = _engine.ScreenNode(namespace, uiKey, createParams)
+    _ui[(namespace, uiKey)] = node
+    return node
+
+
+def PushScreen(namespace, uiKey, createParams=None):
+    return CreateUI(namespace, uiKey, createParams)
+
+
+def GetUI(namespace, uiKey):
+    return _ui.get((namespace, uiKey))
+
+
+def GetTouchPos():
+    return 0.0, 0.0
+
+
+def RegisterUIAnimations(animData, isOverride=False):
+    return True
+
+
+def getEntitiesOrBlockFromRay(dimensionId, pos, direction, distance, isThrough=False, filterType=0):
+    return []
+
+
+def SetMcpModLogCanPostDump(canPost):
+    pass
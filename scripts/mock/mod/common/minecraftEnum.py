@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+# ====================================================
+#
+#   Copyright (c) 2023 Nuoyan
+#   nuoyanlib is licensed under Mulan PSL v2.
+#   You can use this software according to the terms and conditions of the Mulan PSL v2.
+#   You may obtain a copy of Mulan PSL v2 at:
+#            http://license.coscl.org.cn/MulanPSL2
+#   THIS SOFTWARE IS PROVIDED ON AN AS IS BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY OR FIT FOR A PARTICULAR PURPOSE.
+#   See the Mulan PSL v2 for more details.
+#
+#   Author        : 诺言Nuoyan
+#   Email         : 1279735247@qq.com
+#   Gitee         : https://gitee.com/charming-lee
+#   Last Modified : 2026-10-18
+#
+# ====================================================
+
+
+# 实体类型的取值沿用基岩版ActorType的位组合结构，EntityType.Mob等类别判断依赖于此
+
+
+class EntityType(object):
+    ItemEntity = 0x40
+    PrimedTnt = 0x41
+    FallingBlock = 0x42
+    MovingBlock = 0x43
+    Experience = 0x45
+    EyeOfEnder = 0x46
+    EnderCrystal = 0x47
+    FireworksRocket = 0x48
+    FishingHook = 0x4D
+    Chalkboard = 0x4E
+    Painting = 0x53
+    LeashKnot = 0x58
+    BoatRideable = 0x5A
+    LightningBolt = 0x5D
+    AreaEffectCloud = 0x5F
+    Balloon = 0x6B
+    Shield = 0x75
+    Lectern = 0x77
+    Mob = 0x100
+    Npc = 0x133
+    Agent = 0x138
+    ArmorStand = 0x13D
+    TripodCamera = 0x13E
+    Player = 0x13F
+    IronGolem = 0x314
+    SnowGolem = 0x315
+    WanderingTrader = 0x376
+    Bee = 0x37A
+    Monster = 0xB00
+    Creeper = 0xB21
+    Slime = 0xB25
+    EnderMan = 0xB26
+    Ghast = 0xB29
+    LavaSlime = 0xB2A
+    Blaze = 0xB2B
+    Witch = 0xB2D
+    Guardian = 0xB31
+    ElderGuardian = 0xB32
+    Dragon = 0xB35
+    Shulker = 0xB36
+    Vindicator = 0xB39
+    IllagerBeast = 0xB3B
+    EvocationIllager = 0xB68
+    Vex = 0xB69
+    Pillager = 0xB72
+    ElderGuardianGhost = 0xB78
+    Animal = 0x1300
+    Chicken = 0x130A
+    Cow = 0x130B
+    Pig = 0x130C
+    Sheep = 0x130D
+    MushroomCow = 0x1310
+    Rabbit = 0x1312
+    PolarBear = 0x131C
+    Turtle = 0x134A
+    Panda = 0x1371
+    Fox = 0x1379
+    Hoglin = 0x137C
+    Strider = 0x137D
+    Goat = 0x1380
+    WaterAnimal = 0x2300
+    Squid = 0x2311
+    Dolphin = 0x231F
+    Pufferfish = 0x236C
+    Salmon = 0x236D
+    Tropicalfish = 0x236F
+    Fish = 0x2370
+    GlowSquid = 0x2381
+    Axolotl = 0x2382
+    TamableAnimal = 0x5300
+    Wolf = 0x530E
+    Ocelot = 0x5316
+    Parrot = 0x531E
+    Cat = 0x534B
+    Llama = 0x20531D
+    Ambient = 0x8100
+    Bat = 0x8113
+    UndeadMob = 0x10B00
+    PigZombie = 0x10B24
+    WitherBoss = 0x10B34
+    Phantom = 0x10B3A
+    Zoglin = 0x10B7E
+    Piglin = 0x1117B
+    PiglinBrute = 0x1117F
+    ZombieMonster = 0x30B00
+    Zombie = 0x30B20
+    ZombieVillager = 0x30B2C
+    Husk = 0x30B2F
+    Drowned = 0x30B6E
+    ZombieVillagerV2 = 0x30B74
+    Arthropod = 0x40B00
+    Spider = 0x40B23
+    Silverfish = 0x40B27
+    CaveSpider = 0x40B28
+    Endermite = 0x40B37
+    Minecart = 0x80054
+    MinecartHopper = 0x80060
+    MinecartTNT = 0x80061
+    MinecartChest = 0x80062
+    MinecartCommandBlock = 0x80064
+    SkeletonMonster = 0x110B00
+    Skeleton = 0x110B22
+    Stray = 0x110B2E
+    WitherSkeleton = 0x110B30
+    EquineAnimal = 0x205300
+    Horse = 0x205317
+    Donkey = 0x205318
+    Mule = 0x205319
+    SkeletonHorse = 0x215B1A
+    ZombieHorse = 0x235B1B
+    Projectile = 0x400000
+    ExperiencePotion = 0x400044
+    ShulkerBullet = 0x40004C
+    DragonFireball = 0x40004F
+    Snowball = 0x400051
+    ThrownEgg = 0x400052
+    LargeFireball = 0x400055
+    ThrownPotion = 0x400056
+    Enderpearl = 0x400057
+    WitherSkull = 0x400059
+    WitherSkullDangerous = 0x40005B
+    SmallFireball = 0x40005E
+    LingeringPotion = 0x400065
+    LlamaSpit = 0x400066
+    EvocationFang = 0x400067
+    IceBomb = 0x40006A
+    AbstractArrow = 0x800000
+    Trident = 0xC00049
+    Arrow = 0xC00050
+    VillagerBase = 0x1000300
+    Villager = 0x100030F
+    VillagerV2 = 0x1000373
+
+
+class Facing(object):
+    Down = 0
+    Up = 1
+    North = 2
+    South = 3
+    West = 4
+    East = 5
+
+
+class ItemPosType(object):
+    INVENTORY = 0
+    OFFHAND = 1
+    CARRIED = 2
+    ARMOR = 3
+
+
+class RayFilterType(object):
+    OnlyBlocks = 0
+    OnlyEntities = 1
+    BothEntitiesAndBlock = 2
+
+
+class GameType(object):
+    Survival = 0
+    Creative = 1
+    Adventure = 2
+
+
+class AttrType(object):
+    HEALTH = 0
+    SPEED = 1
+    DAMAGE = 2
+    UNDERWATER_SPEED = 3
+    HUNGER = 4
+    SATURATION = 5
+    ABSORPTION = 6
+    LAVA_SPEED = 7
+    LUCK = 8
+    FOLLOW_RANGE = 9
+    KNOCKBACK_RESISTANCE = 10
+    JUMP_STRENGTH = 11
+    ARMOR = 12
+
+
+class ActorDamageCause(object):
+    NONE = "none"
+    Override = "override"
+    Contact = "contact"
+    EntityAttack = "entity_attack"
+    Projectile = "projectile"
+    Suffocation = "suffocation"
+    Fall = "fall"
+    Fire = "fire"
+    FireTick = "fire_tick"
+    Lava = "lava"
+    Drowning = "drowning"
+    BlockExplosion = "block_explosion"
+    EntityExplosion = "entity_explosion"
+    Void = "void"
+    Suicide = "suicide"
+    Magic = "magic"
+    Wither = "wither"
+    Starve = "starve"
+    Anvil = "anvil"
+    Thorns = "thorns"
+    FallingBlock = "falling_block"
+    Piston = "piston"
+    FlyIntoWall = "fly_into_wall"
+    Magma = "magma"
+    Fireworks = "fireworks"
+    Lightning = "lightning"
+    Freezing = "freezing"
+    Stalactite = "stalactite"
+    Stalagmite = "stalagmite"
+    Custom = "custom"
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+# ====================================================
+#
+#   Copyright (c) 2023 Nuoyan
+#   nuoyanlib is licensed under Mulan PSL v2.
+#   You can use this software according to the terms and conditions of the Mulan PSL v2.
+#   You may obtain a copy of Mulan PSL v2 at:
+#            http://license.coscl.org.cn/MulanPSL2
+#   THIS SOFTWARE IS PROVIDED ON AN AS IS BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY OR FIT FOR A PARTICULAR PURPOSE.
+#   See the Mulan PSL v2 for more details.
+#
+#   Author        : 诺言Nuoyan
+#   Email         : 1279735247@qq.com
+#   Gitee         : https://gitee.com/charming-lee
+#   Last Modified : 2026-10-18
+#
+# ====================================================
+
+
+from math import sqrt as _sqrt
+
+
+class Vector3(object):
+    __slots__ = ("x", "y", "z")
+
+    def __init__(self, x=0.0, y=0.0, z=0.0):
+        if isinstance(x, (tuple, list, Vector3)):
+            x, y, z = x[0], x[1], x[2]
+        self.x = float(x)
+        self.y = float(y)
+        self.z = float(z)
+
+    def __getitem__(self, i):
+        return (self.x, self.y, self.z)[i]
+
+    def __iter__(self):
+        return iter((self.x, self.y, self.z))
+
+    def __len__(self):
+        return 3
+
+    def __repr__(self):
+        return "Vector3(%s, %s, %s)" % (self.x, self.y, self.z)
+
+    def __eq__(self, other):
+        return isinstance(other, Vector3) and self.ToTuple() == other.ToTuple()
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __neg__(self):
+        return Vector3(-self.x, -self.y, -self.z)
+
+    def __add__(self, other):
+        return Vector3(self.x + other[0], self.y + other[1], self.z + other[2])
+
+    def __sub__(self, other):
+        return Vector3(self.x - other[0], self.y - other[1], self.z - other[2])
+
+    def __mul__(self, k):
+        if isinstance(k, Vector3):
+            return Vector3.Dot(self, k)
+        return Vector3(self.x * k, self.y * k, self.z * k)
+
+    __rmul__ = __mul__
+
+    def __div__(self, k):
+        return Vector3(self.x / k, self.y / k, self.z / k)
+
+    __truediv__ = __div__
+
+    def Length(self):
+        return _sqrt(self.x ** 2 + self.y ** 2 + self.z ** 2)
+
+    def LengthSquared(self):
+        return self.x ** 2 + self.y ** 2 + self.z ** 2
+
+    def Normalized(self):
+        length = self.Length()
+        if length == 0:
+            return Vector3(self)
+        return Vector3(self.x / length, self.y / length, self.z / length)
+
+    def Normalize(self):
+        v = self.Normalized()
+        self.x, self.y, self.z = v.x, v.y, v.z
+
+    def ToTuple(self):
+        return self.x, self.y, self.z
+
+    @staticmethod
+    def Dot(a, b):
+        return a[0] * b[0] + a[1] * b[1] + a[2] * b[2]
+
+    @staticmethod
+    def Cross(a, b):
+        return Vector3(a[1] * b[2] - a[2] * b[1], a[2] * b[0] - a[0] * b[2], a[0] * b[1] - a[1] * b[0])
+
+    @staticmethod
+    def One():
+        return Vector3(1, 1, 1)
+
+    @staticmethod
+    def Zero():
+        return Vector3(0, 0, 0)
+
+    @staticmethod
+    def Up():
+        return Vector3(0, 1, 0)
+
+    @staticmethod
+    def Down():
+        return Vector3(0, -1, 0)
+
+    @staticmethod
+    def Left():
+        return Vector3(1, 0, 0)
+
+    @staticmethod
+    def Right():
+        return Vector3(-1, 0, 0)
+
+    @staticmethod
+    def Forward():
+        return Vector3(0, 0, 1)
+
+    @staticmethod
+    def Backward():
+        return Vector3(0, 0, -1)
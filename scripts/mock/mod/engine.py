@@ -0,0 +1,891 @@
+# -*- coding: utf-8 -*-
+# ====================================================
+#
+#   Copyright (c) 2023 Nuoyan
+#   nuoyanlib is licensed under Mulan PSL v2.
+#   You can use this software according to the terms and conditions of the Mulan PSL v2.
+#   You may obtain a copy of Mulan PSL v2 at:
+#            http://license.coscl.org.cn/MulanPSL2
+#   THIS SOFTWARE IS PROVIDED ON AN AS IS BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY OR FIT FOR A PARTICULAR PURPOSE.
+#   See the Mulan PSL v2 for more details.
+#
+#   Author        : 诺言Nuoyan
+#   Email         : 1279735247@qq.com
+#   Gitee         : https://gitee.com/charming-lee
+#   Last Modified : 2026-10-18
+#
+# ====================================================
+
+
+"""
+模拟世界：实体、玩家、系统、事件总线、网络回环与手动驱动的时钟。
+"""
+
+
+import heapq
+from math import floor, sin, cos, radians, atan2, asin, degrees, sqrt
+from importlib import import_module
+from .common.minecraftEnum import EntityType, AttrType, ItemPosType
+
+
+__all__ = [
+    "TICK_SEC",
+    "LEVEL_ID",
+    "ENGINE_NAMESPACE",
+    "ENGINE_SYSTEM_NAME",
+    "Comp",
+    "ServerSystem",
+    "ClientSystem",
+    "reset",
+    "world",
+    "set_side",
+    "get_side",
+    "on_side",
+    "spawn_entity",
+    "spawn_entities",
+    "add_player",
+    "remove_entity",
+    "remove_player",
+    "set_pos",
+    "fire_event",
+    "register_comp",
+    "tick",
+    "get_stats",
+]
+
+
+TICK_SEC = 1 / 30.0
+LEVEL_ID = "-4294967295"
+ENGINE_NAMESPACE = "Minecraft"
+ENGINE_SYSTEM_NAME = "Engine"
+_CELL = 16.0
+_PLAYER_EYE_HEIGHT = 1.62
+
+
+def _copy_data(data):
+    # 模拟跨端传输时的序列化，接收方拿到的是一份拷贝
+    if isinstance(data, dict):
+        return {k: _copy_data(v) for k, v in data.items()}
+    if isinstance(data, list):
+        return [_copy_data(i) for i in data]
+    if isinstance(data, tuple):
+        return tuple(_copy_data(i) for i in data)
+    return data
+
+
+class Entity(object):
+    __slots__ = (
+        "id", "type_str", "etype", "pos", "rot", "dim", "motion", "attrs", "name", "attack_target",
+        "size", "effects", "query", "items", "cell",
+    )
+
+    def __init__(self, eid, type_str, etype, pos, dim, health):
+        self.id = eid
+        self.type_str = type_str
+        self.etype = etype
+        self.pos = tuple(float(i) for i in pos)
+        self.rot = (0.0, 0.0)
+        self.dim = dim
+        self.motion = (0.0, 0.0, 0.0)
+        self.attrs = {AttrType.HEALTH: float(health), AttrType.DAMAGE: 1.0, AttrType.SPEED: 0.1}
+        self.name = ""
+        self.attack_target = "-1"
+        self.size = (0.6, 1.8)
+        self.effects = []
+        self.query = {}
+        self.items = None
+        self.cell = None
+
+    @property
+    def is_player(self):
+        return self.etype == EntityType.Player
+
+
+class _Timer(object):
+    __slots__ = ("func", "args", "kwargs", "interval", "side", "cancelled")
+
+    def __init__(self, func, args, kwargs, interval, side):
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.interval = interval
+        self.side = side
+        self.cancelled = False
+
+
+class World(object):
+    def __init__(self):
+        self.side = "server"
+        self.tick_count = 0
+        self.time = 0.0
+        self.entities = {}
+        self.players = []
+        self.local_player_id = "-1"
+        self.grid = {}
+        self.systems = {}
+        self.system_order = []
+        self.listeners = {}
+        self.packets = []
+        self.timers = []
+        self.timer_seq = 0
+        self.listen_seq = 0
+        self.entity_seq = 0
+        self.extra_data = {}
+        self.comps = {}
+        self.immediate_network = False
+        self.stats = {
+            'comp_created': 0,
+            'engine_reads': 0,
+            'packets_to_server': 0,
+            'packets_to_client': 0,
+            'bytes_to_server': 0,
+            'bytes_to_client': 0,
+            'events_dispatched': 0,
+        }
+
+    # 实体 ==========================================================================================================
+
+    def _cell_key(self, ent):
+        return ent.dim, int(floor(ent.pos[0] / _CELL)), int(floor(ent.pos[2] / _CELL))
+
+    def _grid_add(self, ent):
+        ent.cell = self._cell_key(ent)
+        self.grid.setdefault(ent.cell, set()).add(ent.id)
+
+    def _grid_remove(self, ent):
+        cell = self.grid.get(ent.cell)
+        if cell:
+            cell.discard(ent.id)
+            if not cell:
+                del self.grid[ent.cell]
+
+    def move(self, ent, pos=None, dim=None):
+        self._grid_remove(ent)
+        if pos is not None:
+            ent.pos = tuple(float(i) for i in pos)
+        if dim is not None:
+            ent.dim = dim
+        self._grid_add(ent)
+
+    def new_entity(self, type_str, etype, pos, dim, health):
+        self.entity_seq += 1
+        eid = str(-(self.entity_seq << 32 | 1))
+        ent = Entity(eid, type_str, etype, pos, dim, health)
+        self.entities[eid] = ent
+        self._grid_add(ent)
+        return ent
+
+    def delete_entity(self, eid):
+        ent = self.entities.pop(eid, None)
+        if ent:
+            self._grid_remove(ent)
+        return ent
+
+    def entities_in_box(self, start, end, dim):
+        x0, x1 = sorted((start[0], end[0]))
+        y0, y1 = sorted((start[1], end[1]))
+        z0, z1 = sorted((start[2], end[2]))
+        res = []
+        for cx in range(int(floor(x0 / _CELL)), int(floor(x1 / _CELL)) + 1):
+            for cz in range(int(floor(z0 / _CELL)), int(floor(z1 / _CELL)) + 1):
+                for eid in self.grid.get((dim, cx, cz), ()):
+                    x, y, z = self.entities[eid].pos
+                    if x0 <= x <= x1 and y0 <= y <= y1 and z0 <= z <= z1:
+                        res.append(eid)
+        return res
+
+    # 事件 ==========================================================================================================
+
+    def listen(self, owner, side, namespace, system_name, event_name, func, priority):
+        self.listen_seq += 1
+        lst = self.listeners.setdefault((side, namespace, system_name, event_name), [])
+        lst.append((-priority, self.listen_seq, owner, func))
+        lst.sort(key=lambda x: x[:2])
+
+    def unlisten(self, side, namespace, system_name, event_name, func):
+        key = (side, namespace, system_name, event_name)
+        lst = self.listeners.get(key)
+        if lst:
+            lst[:] = [i for i in lst if i[3] != func]
+
+    def unlisten_owner(self, owner):
+        for lst in self.listeners.values():
+            lst[:] = [i for i in lst if i[2] is not owner]
+
+    def dispatch(self, side, namespace, system_name, event_name, args=None, has_args=True):
+        lst = self.listeners.get((side, namespace, system_name, event_name))
+        if not lst:
+            return
+        for _, _, _, func in lst[:]:
+            self.stats['events_dispatched'] += 1
+            with on_side(side):
+                if has_args:
+                    func(args)
+                else:
+                    func()
+
+    def send(self, side, namespace, system_name, event_name, data):
+        size = len(repr(data))
+        self.stats['packets_to_%s' % side] += 1
+        self.stats['bytes_to_%s' % side] += size
+        packet = (side, namespace, system_name, event_name, _copy_data(data))
+        if self.immediate_network:
+            self.dispatch(*packet)
+        else:
+            self.packets.append(packet)
+
+    # 时钟 ==========================================================================================================
+
+    def add_timer(self, delay, func, args, kwargs, interval=None):
+        timer = _Timer(func, args, kwargs, interval, self.side)
+        self.timer_seq += 1
+        heapq.heappush(self.timers, (self.time + max(delay, 0), self.timer_seq, timer))
+        return timer
+
+    def _run_timers(self):
+        while self.timers and self.timers[0][0] <= self.time + 1e-9:
+            due, _, timer = heapq.heappop(self.timers)
+            if timer.cancelled:
+                continue
+            if timer.interval is not None:
+                self.timer_seq += 1
+                heapq.heappush(self.timers, (due + max(timer.interval, TICK_SEC), self.timer_seq, timer))
+            with on_side(timer.side):
+                timer.func(*timer.args, **timer.kwargs)
+
+    def step(self):
+        self.tick_count += 1
+        self.time += TICK_SEC
+        packets, self.packets = self.packets, []
+        for packet in packets:
+            self.dispatch(*packet)
+        self._run_timers()
+        for key in self.system_order[:]:
+            system = self.systems.get(key)
+            if system:
+                with on_side(key[0]):
+                    system.Update()
+        self.dispatch("server", ENGINE_NAMESPACE, ENGINE_SYSTEM_NAME, "OnScriptTickServer", has_args=False)
+        if self.local_player_id != "-1":
+            self.dispatch("client", ENGINE_NAMESPACE, ENGINE_SYSTEM_NAME, "OnScriptTickClient", has_args=False)
+
+    # 系统 ==========================================================================================================
+
+    def register_system(self, side, namespace, system_name, cls_path):
+        key = (side, namespace, system_name)
+        if key in self.systems:
+            return self.systems[key]
+        module_path, cls_name = cls_path.rsplit(".", 1)
+        cls = getattr(import_module(module_path), cls_name)
+        with on_side(side):
+            system = cls(namespace, system_name)
+        self.systems[key] = system
+        self.system_order.append(key)
+        return system
+
+
+world = World()
+
+
+def reset():
+    """
+    | 重置模拟世界。已导入的nuoyanlib模块不会被重新加载。
+    """
+    global world
+    world = World()
+    return world
+
+
+def set_side(side):
+    """
+    | 设置当前运行端，"server"或"client"。决定客户端接口GetLocalPlayerId的返回值，从而决定nuoyanlib的is_client()结果。
+    """
+    world.side = side
+
+
+def get_side():
+    return world.side
+
+
+class on_side(object):
+    def __init__(self, side):
+        self.side = side
+        self.old_side = None
+
+    def __enter__(self):
+        self.old_side = world.side
+        world.side = self.side
+
+    def __exit__(self, *args):
+        world.side = self.old_side
+
+
+def spawn_entity(type_str="minecraft:zombie", pos=(0, 64, 0), dim=0, etype=EntityType.Zombie, health=20, notify=True):
+    """
+    | 生成一个实体，返回实体ID。notify为True时会派发AddEntityServerEvent与AddEntityClientEvent。
+    """
+    ent = world.new_entity(type_str, etype, pos, dim, health)
+    if notify:
+        args = {
+            'id': ent.id, 'posX': ent.pos[0], 'posY': ent.pos[1], 'posZ': ent.pos[2], 'dimensionId': dim,
+            'isBaby': False, 'engineTypeStr': type_str, 'itemName': "", 'auxValue': 0,
+        }
+        fire_event("AddEntityServerEvent", args)
+        if world.local_player_id != "-1":
+            fire_event("AddEntityClientEvent", dict(args), "client")
+    return ent.id
+
+
+def spawn_entities(count, type_str="minecraft:zombie", center=(0, 64, 0), spread=256, dim=0, etype=EntityType.Zombie, seed=0):
+    """
+    | 在中心点周围的正方形区域内批量生成实体（不派发事件），返回实体ID列表。用于构造大规模世界。
+    """
+    from random import Random
+    rnd = Random(seed)
+    half = spread / 2.0
+    res = []
+    for _ in range(count):
+        pos = (center[0] + rnd.uniform(-half, half), center[1], center[2] + rnd.uniform(-half, half))
+        res.append(world.new_entity(type_str, etype, pos, dim, 20).id)
+    return res
+
+
+def add_player(pos=(0, 64, 0), dim=0, local=None):
+    """
+    | 添加一个玩家，返回玩家实体ID。第一个添加的玩家默认为本地（客户端）玩家。
+    """
+    ent = world.new_entity("minecraft:player", EntityType.Player, pos, dim, 20)
+    ent.items = [None] * 36
+    world.players.append(ent.id)
+    if local or (local is None and world.local_player_id == "-1"):
+        world.local_player_id = ent.id
+    fire_event("AddServerPlayerEvent", {'id': ent.id, 'isTransfer': False, 'isReconnect': False, 'isPeUser': False})
+    return ent.id
+
+
+def remove_entity(entity_id):
+    """
+    | 移除实体，并派发EntityRemoveEvent与RemoveEntityClientEvent。
+    """
+    if not world.delete_entity(entity_id):
+        return False
+    fire_event("EntityRemoveEvent", {'id': entity_id})
+    if world.local_player_id != "-1":
+        fire_event("RemoveEntityClientEvent", {'id': entity_id}, "client")
+    return True
+
+
+def remove_player(player_id):
+    """
+    | 玩家退出，派发PlayerIntendLeaveServerEvent与DelServerPlayerEvent。
+    """
+    if player_id not in world.players:
+        return False
+    fire_event("PlayerIntendLeaveServerEvent", {'playerId': player_id})
+    world.players.remove(player_id)
+    world.delete_entity(player_id)
+    if world.local_player_id == player_id:
+        world.local_player_id = "-1"
+    fire_event("DelServerPlayerEvent", {'id': player_id, 'isTransfer': False, 'uid': 0})
+    return True
+
+
+def set_pos(entity_id, pos, dim=None):
+    ent = world.entities.get(entity_id)
+    if ent:
+        world.move(ent, pos, dim)
+
+
+def fire_event(event_name, args=None, side="server"):
+    """
+    | 派发一个引擎事件。
+    """
+    world.dispatch(side, ENGINE_NAMESPACE, ENGINE_SYSTEM_NAME, event_name, args)
+
+
+def register_comp(name, cls):
+    """
+    | 注册自定义组件类，之后CompFactory.Create<name>(target)将返回该类的实例。组件类接受一个参数target。
+    """
+    world.comps[name] = cls
+
+
+def tick(n=1):
+    """
+    | 推进n个tick：投递网络包、触发到期的定时器、调用各系统的Update并派发tick事件。
+    """
+    for _ in range(n):
+        world.step()
+
+
+def get_stats():
+    return dict(world.stats)
+
+
+def dir_from_rot(rot):
+    pitch, yaw = radians(rot[0]), radians(rot[1])
+    return -cos(pitch) * sin(yaw), -sin(pitch), cos(pitch) * cos(yaw)
+
+
+def rot_from_dir(direction):
+    x, y, z = direction
+    length = sqrt(x * x + y * y + z * z) or 1.0
+    return degrees(-asin(y / length)), degrees(atan2(-x, z))
+
+
+# 系统 ==============================================================================================================
+
+
+class _System(object):
+    _side = None
+
+    def __init__(self, namespace, systemName):
+        self.namespace = namespace
+        self.systemName = systemName
+
+    def ListenForEvent(self, namespace, systemName, eventName, instance, func, priority=0):
+        world.listen(self, self._side, namespace, systemName, eventName, func, priority)
+
+    def UnListenForEvent(self, namespace, systemName, eventName, instance, func, priority=0):
+        world.unlisten(self._side, namespace, systemName, eventName, func)
+
+    def UnListenAllEvents(self):
+        world.unlisten_owner(self)
+
+    def BroadcastEvent(self, eventName, eventData):
+        world.dispatch(self._side, self.namespace, self.systemName, eventName, eventData)
+
+    def CreateEventData(self):
+        return {}
+
+    def Update(self):
+        pass
+
+    def Destroy(self):
+        pass
+
+
+class ServerSystem(_System):
+    _side = "server"
+
+    def NotifyToClient(self, targetId, eventName, eventData):
+        if targetId == world.local_player_id:
+            world.send("client", self.namespace, self.systemName, eventName, eventData)
+        else:
+            # 非本地玩家的客户端不存在，仅统计流量
+            world.stats['packets_to_client'] += 1
+            world.stats['bytes_to_client'] += len(repr(eventData))
+
+    def NotifyToMultiClients(self, targetIdList, eventName, eventData):
+        for pid in targetIdList:
+            self.NotifyToClient(pid, eventName, eventData)
+
+    def BroadcastToAllClient(self, eventName, eventData):
+        self.NotifyToMultiClients(world.players, eventName, eventData)
+
+    def CreateEngineItemEntity(self, itemDict, dimensionId=0, pos=(0, 0, 0)):
+        return spawn_entity("minecraft:item", pos, dimensionId, EntityType.ItemEntity, 5)
+
+    def DestroyEntity(self, entityId):
+        return remove_entity(entityId)
+
+
+class ClientSystem(_System):
+    _side = "client"
+
+    def NotifyToServer(self, eventName, eventData):
+        if isinstance(eventData, dict):
+            eventData['__id__'] = world.local_player_id
+        world.send("server", self.namespace, self.systemName, eventName, eventData)
+
+
+class ScreenNode(object):
+    def __init__(self, namespace, name, param=None):
+        self.namespace = namespace
+        self.name = name
+        self.param = param
+
+    def Create(self):
+        pass
+
+    def Update(self):
+        pass
+
+    def Destroy(self):
+        pass
+
+
+class ViewBinder(object):
+    pass
+
+
+class ViewRequest(object):
+    Nothing = 0
+    Refresh = 1
+    PointerHeldEventsRequest = 2
+    PointerHeldEventsCancel = 4
+    Exit = 8
+
+
+# 组件 ==============================================================================================================
+
+
+class Comp(object):
+    """
+    | 组件基类。自定义组件可继承此类，通过self.entity访问模拟实体（实体不存在时为None）。
+    """
+
+    def __init__(self, target):
+        self.target = target
+
+    @property
+    def entity(self):
+        world.stats['engine_reads'] += 1
+        return world.entities.get(self.target)
+
+    def __getattr__(self, name):
+        # 未模拟的接口统一返回None
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return lambda *args, **kwargs: None
+
+
+class PosComp(Comp):
+    def GetFootPos(self):
+        ent = self.entity
+        return ent.pos if ent else None
+
+    def GetPos(self):
+        ent = self.entity
+        if not ent:
+            return None
+        if ent.is_player:
+            return ent.pos[0], ent.pos[1] + _PLAYER_EYE_HEIGHT, ent.pos[2]
+        return ent.pos
+
+    def SetFootPos(self, pos):
+        ent = self.entity
+        if not ent:
+            return False
+        world.move(ent, pos)
+        return True
+
+    def SetPos(self, pos):
+        ent = self.entity
+        if ent and ent.is_player:
+            pos = (pos[0], pos[1] - _PLAYER_EYE_HEIGHT, pos[2])
+        return self.SetFootPos(pos)
+
+
+class RotComp(Comp):
+    def GetRot(self):
+        ent = self.entity
+        return ent.rot if ent else None
+
+    def SetRot(self, rot):
+        ent = self.entity
+        if not ent:
+            return False
+        ent.rot = tuple(rot)
+        return True
+
+
+class DimensionComp(Comp):
+    def GetEntityDimensionId(self):
+        ent = self.entity
+        return ent.dim if ent else -1
+
+    def ChangePlayerDimension(self, dimId, pos):
+        ent = self.entity
+        if not ent:
+            return False
+        world.move(ent, pos, dimId)
+        return True
+
+
+class EngineTypeComp(Comp):
+    def GetEngineType(self):
+        ent = self.entity
+        return ent.etype if ent else 0
+
+    def GetEngineTypeStr(self):
+        ent = self.entity
+        return ent.type_str if ent else ""
+
+
+class ActorMotionComp(Comp):
+    def GetMotion(self):
+        ent = self.entity
+        return ent.motion if ent else None
+
+    def SetMotion(self, motion):
+        ent = self.entity
+        if not ent or ent.is_player:
+            return False
+        ent.motion = tuple(motion)
+        return True
+
+    def SetPlayerMotion(self, motion):
+        ent = self.entity
+        if not ent or not ent.is_player:
+            return False
+        ent.motion = tuple(motion)
+        return True
+
+
+class AttrComp(Comp):
+    def GetAttrValue(self, attrType):
+        ent = self.entity
+        return ent.attrs.get(attrType, 0.0) if ent else 0.0
+
+    def GetAttrMaxValue(self, attrType):
+        return 20.0 if attrType == AttrType.HEALTH else self.GetAttrValue(attrType)
+
+    def SetAttrValue(self, attrType, value):
+        ent = self.entity
+        if not ent:
+            return False
+        ent.attrs[attrType] = float(value)
+        if attrType == AttrType.HEALTH and value <= 0 and not ent.is_player:
+            remove_entity(ent.id)
+        return True
+
+
+class HurtComp(Comp):
+    def Hurt(self, damage, cause, attackerId=None, childAttackerId=None, knocked=True, customTag=None):
+        ent = self.entity
+        if not ent:
+            return False
+        health = ent.attrs[AttrType.HEALTH] - damage
+        ent.attrs[AttrType.HEALTH] = health
+        if health <= 0 and not ent.is_player:
+            remove_entity(ent.id)
+        return True
+
+    def ImmuneDamage(self, immune):
+        return True
+
+
+class NameComp(Comp):
+    def GetName(self):
+        ent = self.entity
+        return ent.name if ent else None
+
+    def SetName(self, name):
+        ent = self.entity
+        if not ent:
+            return False
+        ent.name = name
+        return True
+
+
+class ActionComp(Comp):
+    def GetAttackTarget(self):
+        ent = self.entity
+        return ent.attack_target if ent else "-1"
+
+    def SetAttackTarget(self, targetId):
+        ent = self.entity
+        if not ent:
+            return False
+        ent.attack_target = targetId
+        return True
+
+    def ResetAttackTarget(self):
+        return self.SetAttackTarget("-1")
+
+
+class CollisionBoxComp(Comp):
+    def GetSize(self):
+        ent = self.entity
+        return ent.size if ent else None
+
+    def SetSize(self, size):
+        ent = self.entity
+        if not ent:
+            return False
+        ent.size = tuple(size)
+        return True
+
+
+class EffectComp(Comp):
+    def GetAllEffects(self):
+        ent = self.entity
+        return [dict(i) for i in ent.effects] if ent else None
+
+    def AddEffectToEntity(self, effectName, duration, amplifier, showParticles):
+        ent = self.entity
+        if not ent:
+            return False
+        ent.effects.append({'effectName': effectName, 'duration': duration, 'amplifier': amplifier})
+        return True
+
+    def RemoveEffectFromEntity(self, effectName):
+        ent = self.entity
+        if not ent:
+            return False
+        ent.effects = [i for i in ent.effects if i['effectName'] != effectName]
+        return True
+
+
+class QueryVariableComp(Comp):
+    def Register(self, name, default):
+        ent = self.entity
+        if not ent:
+            return False
+        ent.query.setdefault(name, default)
+        return True
+
+    def Get(self, name):
+        ent = self.entity
+        return ent.query.get(name, -1.0) if ent else -1.0
+
+    def Set(self, name, value):
+        ent = self.entity
+        if not ent or name not in ent.query:
+            return False
+        ent.query[name] = value
+        return True
+
+
+class GameComp(Comp):
+    def AddTimer(self, delay, func, *args, **kwargs):
+        return world.add_timer(delay, func, args, kwargs)
+
+    def AddRepeatedTimer(self, delay, func, *args, **kwargs):
+        return world.add_timer(delay, func, args, kwargs, delay)
+
+    def CancelTimer(self, timer):
+        if timer:
+            timer.cancelled = True
+
+    def GetEntitiesInSquareArea(self, entityId, startPos, endPos, dimensionId=-1):
+        if dimensionId == -1 and entityId:
+            dimensionId = world.entities[entityId].dim if entityId in world.entities else 0
+        world.stats['engine_reads'] += 1
+        return world.entities_in_box(startPos, endPos, dimensionId)
+
+    def GetScreenSize(self):
+        return 1920.0, 1080.0
+
+
+class ExtraDataComp(Comp):
+    def GetExtraData(self, key):
+        return _copy_data(world.extra_data.get((self.target, key)))
+
+    def SetExtraData(self, key, value, autoSave=True):
+        world.extra_data[(self.target, key)] = _copy_data(value)
+        return True
+
+    def CleanExtraData(self, key):
+        return world.extra_data.pop((self.target, key), None) is not None
+
+
+class ItemComp(Comp):
+    def _items(self, player_id):
+        ent = world.entities.get(player_id)
+        return ent.items if ent and ent.items is not None else None
+
+    def GetPlayerAllItems(self, posType, getUserData=False):
+        items = self._items(self.target)
+        if items is None or posType != ItemPosType.INVENTORY:
+            return []
+        return _copy_data(items)
+
+    def GetPlayerItem(self, posType, slotPos=0, getUserData=False):
+        items = self._items(self.target)
+        if items is None or posType != ItemPosType.INVENTORY or not 0 <= slotPos < len(items):
+            return None
+        return _copy_data(items[slotPos])
+
+    def SetPlayerAllItems(self, itemsDictMap):
+        items = self._items(self.target)
+        res = {}
+        for (pos_type, slot), item in itemsDictMap.items():
+            ok = items is not None and pos_type == ItemPosType.INVENTORY and 0 <= slot < len(items)
+            if ok:
+                items[slot] = _copy_data(item)
+            res[(pos_type, slot)] = ok
+        return res
+
+    def SetInvItemNum(self, slotPos, num):
+        items = self._items(self.target)
+        if not items or not items[slotPos]:
+            return False
+        if num <= 0:
+            items[slotPos] = None
+        else:
+            items[slotPos]['count'] = num
+        return True
+
+    def SetInvItemExchange(self, pos1, pos2):
+        items = self._items(self.target)
+        if not items:
+            return False
+        items[pos1], items[pos2] = items[pos2], items[pos1]
+        return True
+
+    def SpawnItemToPlayerInv(self, itemDict, playerId, slotPos=-1):
+        items = self._items(playerId)
+        if items is None:
+            return False
+        slots = [slotPos] if slotPos >= 0 else range(len(items))
+        for i in slots:
+            if not items[i]:
+                items[i] = _copy_data(itemDict)
+                return True
+        return False
+
+
+class ProjectileComp(Comp):
+    def CreateProjectileEntity(self, spawnerId, entityIdentifier, param=None):
+        spawner = world.entities.get(spawnerId)
+        if not spawner:
+            return "-1"
+        pos = (param or {}).get('position', spawner.pos)
+        return spawn_entity(entityIdentifier, pos, spawner.dim, EntityType.Arrow, 1)
+
+
+class ExplosionComp(Comp):
+    def CreateExplosion(self, pos, radius, fire, breaks, sourceId, playerId):
+        return True
+
+
+_BUILTIN_COMPS = {
+    'Pos': PosComp,
+    'Rot': RotComp,
+    'Dimension': DimensionComp,
+    'EngineType': EngineTypeComp,
+    'ActorMotion': ActorMotionComp,
+    'Attr': AttrComp,
+    'Hurt': HurtComp,
+    'Name': NameComp,
+    'Action': ActionComp,
+    'CollisionBox': CollisionBoxComp,
+    'Effect': EffectComp,
+    'QueryVariable': QueryVariableComp,
+    'Game': GameComp,
+    'ExtraData': ExtraDataComp,
+    'Item': ItemComp,
+    'Projectile': ProjectileComp,
+    'Explosion': ExplosionComp,
+}
+
+
+class CompFactory(object):
+    """
+    | 组件工厂，CreateXxx(target)每次调用都会创建新的组件对象，并计入comp_created统计。
+    """
+
+    def __getattr__(self, name):
+        if not name.startswith("Create"):
+            raise AttributeError(name)
+        comp_name = name[6:]
+        def create(target):
+            world.stats['comp_created'] += 1
+            cls = world.comps.get(comp_name) or _BUILTIN_COMPS.get(comp_name, Comp)
+            return cls(target)
+        return create
+
+
+comp_factory = CompFactory()
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+# ====================================================
+#
+#   Copyright (c) 2023 Nuoyan
+#   nuoyanlib is licensed under Mulan PSL v2.
+#   You can use this software according to the terms and conditions of the Mulan PSL v2.
+#   You may obtain a copy of Mulan PSL v2 at:
+#            http://license.coscl.org.cn/MulanPSL2
+#   THIS SOFTWARE IS PROVIDED ON AN AS IS BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY OR FIT FOR A PARTICULAR PURPOSE.
+#   See the Mulan PSL v2 for more details.
+#
+#   Author        : 诺言Nuoyan
+#   Email         : 1279735247@qq.com
+#   Gitee         : https://gitee.com/charming-lee
+#   Last Modified : 2026-10-18
+#
+# ====================================================
+
+
+from .. import engine as _engine
+
+
+def GetLevelId():
+    return _engine.LEVEL_ID
+
+
+def GetEngineCompFactory():
+    return _engine.comp_factory
+
+
+def GetServerSystemCls():
+    return _engine.ServerSystem
+
+
+def GetSystem(nameSpace, systemName):
+    return _engine.world.systems.get(("server", nameSpace, systemName))
+
+
+def RegisterSystem(nameSpace, systemName, clsPath):
+    return _engine.world.register_system("server", nameSpace, systemName, clsPath)
+
+
+def GetEngineNamespace():
+    return _engine.ENGINE_NAMESPACE
+
+
+def GetEngineSystemName():
+    return _engine.ENGINE_SYSTEM_NAME
+
+
+def GetPlayerList():
+    return list(_engine.world.players)
+
+
+def GetEngineActor():
+    return {
+        eid: {'dimensionId': ent.dim, 'identifier': ent.type_str}
+        for eid, ent in _engine.world.entities.items()
+        if not ent.is_player
+    }
+
+
+def GetDirFromRot(rot):
+    return _engine.dir_from_rot(rot)
+
+
+def GetRotFromDir(direction):
+    return _engine.rot_from_dir(direction)
+
+
+def AddEntityTickEventWhiteList(identifier):
+    return True
+
+
+def SetMcpModLogCanPostDump(canPost):
+    pass
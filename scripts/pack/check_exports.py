@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+# ====================================================
+#
+#   Copyright (c) 2023 Nuoyan
+#   nuoyanlib is licensed under Mulan PSL v2.
+#   You can use this software according to the terms and conditions of the Mulan PSL v2.
+#   You may obtain a copy of Mulan PSL v2 at:
+#            http://license.coscl.org.cn/MulanPSL2
+#   THIS SOFTWARE IS PROVIDED ON AN AS IS BASIS, WITHOUT WARRANTIES OF ANY KIND, EITHER EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT, MERCHANTABILITY OR FIT FOR A PARTICULAR PURPOSE.
+#   See the Mulan PSL v2 for more details.
+#
+#   Author        : 诺言Nuoyan
+#   Email         : 1279735247@qq.com
+#   Gitee         : https://gitee.com/charming-lee
+#   Last Modified : 2026-10-18
+#
+# ====================================================
+"""
+检查client、server、utils包的__init__.py中传给_lazy_module的名称列表是否与各子模块的__all__一致。
+只做静态解析，不导入任何模块，无需游戏环境。打包时会自动执行，不一致时终止打包。
+
+用法：python check_exports.py
+"""
+
+
+import ast
+import os
+import sys
+
+
+LAZY_PACKAGES = (
+    "client",
+    "server",
+    "utils",
+)
+
+
+def _str_items(node):
+    if isinstance(node, (ast.List, ast.Tuple)):
+        return [e.s for e in node.elts if isinstance(e, ast.Str)]
+    return []
+
+
+def _parse(path):
+    with open(path, "r") as f:
+        return ast.parse(f.read(), path)
+
+
+def read_all(path):
+    names = []
+    for node in _parse(path).body:
+        if isinstance(node, ast.Assign) and any(isinstance(t, ast.Name) and t.id == "__all__" for t in node.targets):
+            names = _str_items(node.value)
+        elif isinstance(node, ast.AugAssign) and isinstance(node.target, ast.Name) and node.target.id == "__all__":
+            names.extend(_str_items(node.value))
+    return names
+
+
+def read_lazy_lists(path):
+    for node in ast.walk(_parse(path)):
+        if (
+                isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id == "_lazy_module"
+                and len(node.args) > 1 and isinstance(node.args[1], ast.Tuple)
+        ):
+            return [(e.elts[0].s, _str_items(e.elts[1])) for e in node.args[1].elts]
+    return []
+
+
+def check(lib_path):
+    errors = []
+    for pkg in LAZY_PACKAGES:
+        pkg_path = os.path.join(lib_path, pkg)
+        init_path = os.path.join(pkg_path, "__init__.py")
+        for sub, names in read_lazy_lists(init_path):
+            sub_path = os.path.join(pkg_path, *sub.lstrip(".").split(".")) + ".py"
+            exported = read_all(sub_path)
+            missing = [n for n in exported if n not in names]
+            extra = [n for n in names if n not in exported]
+            if missing:
+                errors.append("%s: %s.__all__ has names missing from _lazy_module: %s" % (init_path, sub, ", ".join(missing)))
+            if extra:
+                errors.append("%s: _lazy_module lists names not in %s.__all__: %s" % (init_path, sub, ", ".join(extra)))
+    return errors
+
+
+def main():
+    lib_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "nuoyanlib")
+    errors = check(os.path.normpath(lib_path))
+    for e in errors:
+        print >> sys.stderr, "[Export Diff] " + e
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
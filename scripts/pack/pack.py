@@ -12,7 +12,7 @@
 #   Author        : 诺言Nuoyan
 #   Email         : 1279735247@qq.com
 #   Gitee         : https://gitee.com/charming-lee
-#   Last Modified : 2024-07-07
+#   Last Modified : 2026-10-18
 #
 # ====================================================
 
@@ -21,6 +21,12 @@ import shutil
 import os
 import sys
 import json
+import check_exports
+
+
+# _lazy_module的名称列表与子模块的__all__不一致时终止打包
+if check_exports.main():
+    sys.exit(1)
 
 
 core_files = [
@@ -34,6 +40,12 @@ core_files = [
     "_utils.pyi",
     "_logging.py",
     "_logging.pyi",
+    "_lazy.py",
+    "_lazy.pyi",
+    "_codec.py",
+    "_codec.pyi",
+    "_call_stats.py",
+    "_call_stats.pyi",
 ]
 copy_res = [
     "GameTick",